@@ -65,13 +65,68 @@ class SignalStatistics:
                 'pp': 0.0
             }
 
-        arr = np.array(data)
+        arr = np.asarray(data)
+        arr_max = np.max(arr)
+        arr_min = np.min(arr)
         return {
             'rms': np.sqrt(np.mean(arr ** 2)),
-            'max': np.max(arr),
-            'min': np.min(arr),
+            'max': arr_max,
+            'min': arr_min,
             'avg': np.mean(arr),
-            'pp': np.max(arr) - np.min(arr)
+            'pp': arr_max - arr_min
+        }
+
+    @staticmethod
+    def calculate_statistics_batch(data, mask=None):
+        """
+        다채널 통계 일괄 계산 (열 = 채널, 축 0 방향 리덕션)
+
+        결측(NaN)과 mask가 False인 샘플은 제외한다. 합/제곱합/최대/최소를
+        한 번씩만 구하고 나머지 값은 그로부터 계산한다. 표준편차는 큰 DC 성분에서
+        자릿수 손실이 없도록 평균 기준 편차 제곱합으로 구한다 (np.nanstd와 같음).
+
+        Args:
+            data: (n, k) 신호 행렬
+            mask: 사용할 샘플 표시 bool 배열 ((n, k) 또는 행 단위 (n,), None이면 NaN만 제외)
+
+        Returns:
+            {'rms', 'max', 'min', 'avg', 'pp', 'std', 'count'} 딕셔너리 (값은 (k,) 배열,
+            샘플이 없는 채널은 0.0)
+        """
+        arr = np.asarray(data)
+        if arr.ndim == 1:
+            arr = arr[:, np.newaxis]
+
+        # 채널별 행이 연속되도록 (k, n) float64로 배치 (축 1 리덕션이 빠름)
+        # 1-D float64/Fortran 입력이면 뷰가 되므로 rows는 수정하지 않는다
+        rows = np.ascontiguousarray(arr.T, dtype=np.float64)
+        valid = ~np.isnan(rows)
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
+            valid &= mask if mask.ndim == 1 else mask.T
+            rows = np.where(valid, rows, np.nan)
+
+        count = np.count_nonzero(valid, axis=1)
+        filled = np.where(valid, rows, 0.0)
+        total = filled.sum(axis=1)
+        total_sq = np.einsum('ij,ij->i', filled, filled)
+        row_max = np.fmax.reduce(rows, axis=1, initial=-np.inf)
+        row_min = np.fmin.reduce(rows, axis=1, initial=np.inf)
+
+        has = count > 0
+        n = np.maximum(count, 1)
+        avg = total / n
+        mean_sq = total_sq / n
+        deviation = np.where(valid, rows - avg[:, np.newaxis], 0.0)
+        variance = np.einsum('ij,ij->i', deviation, deviation) / n
+        return {
+            'rms': np.sqrt(mean_sq),
+            'max': np.where(has, row_max, 0.0),
+            'min': np.where(has, row_min, 0.0),
+            'avg': avg,
+            'pp': np.where(has, row_max - row_min, 0.0),
+            'std': np.sqrt(variance),
+            'count': count
         }
 
     @staticmethod
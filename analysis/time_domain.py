@@ -5,12 +5,203 @@ Time Domain Analysis Module
 """
 
 import numpy as np
+try:
+    from scipy import signal
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 from analysis.statistics import SignalStatistics
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _default_threshold(arr):
+    """기본 임계값 (축 0 기준 평균 + 1*std, 결측 제외, 모두 결측이면 NaN)"""
+    valid = ~np.isnan(arr)
+    count = valid.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(valid, arr, 0).sum(axis=0) / count
+        std = np.sqrt((np.where(valid, arr - mean, 0) ** 2).sum(axis=0) / count)
+    return mean + std
+
+
+def _default_hysteresis(arr):
+    """
+    기본 슈미트 트리거 폭 (축 0 기준 열별, DC 제거된 입력)
+
+    잡음 표준편차(1차 차분의 MAD 추정)의 3배와 견고한 피크-피크(1~99 백분위)의
+    10% 중 큰 값을 쓰되, 상태 전환이 가능하도록 피크-피크의 25%를 넘지 않는다.
+    """
+    # 모두 결측인 열/차분은 0으로 채워 nan 함수 경고를 피한다 (결과 폭 0)
+    filled = np.where(np.isnan(arr).all(axis=0), 0.0, arr)
+    low, high = np.nanpercentile(filled, [1, 99], axis=0)
+    pp = high - low
+    diffs = np.abs(np.diff(filled, axis=0))
+    diffs = np.where(np.isnan(diffs).all(axis=0), 0.0, diffs)
+    noise = np.nanmedian(diffs, axis=0) / (0.6745 * np.sqrt(2))
+    return np.minimum(np.maximum(0.1 * pp, 3 * noise), 0.25 * pp)
+
+
+def _local_maxima(arr):
+    """
+    극대점 인덱스 (scipy find_peaks와 같은 규칙, NaN은 제외)
+
+    같은 값이 이어지는 구간(평탄한 꼭대기)을 하나로 묶어 양옆 구간보다 크면
+    피크로 보고 구간 중앙(짝수 길이면 왼쪽) 인덱스를 반환한다.
+    신호 양 끝에 닿은 구간은 피크가 아니다.
+    """
+    starts = np.flatnonzero(np.concatenate(([True], arr[1:] != arr[:-1])))
+    values = arr[starts]
+    ends = np.append(starts[1:], len(arr)) - 1
+    mid = values[1:-1]
+    peak = np.flatnonzero((mid > values[:-2]) & (mid > values[2:])) + 1
+    return (starts[peak] + ends[peak]) // 2
+
+
+def _plateau_maxima(arr):
+    """양옆 샘플 이상인 지점 인덱스 (평탄 구간 전체 포함, 프로미넌스 경계 탐색용)"""
+    mid = arr[1:-1]
+    return np.flatnonzero((mid >= arr[:-2]) & (mid >= arr[2:])) + 1
+
+
+def _select_by_distance(peaks, arr, distance):
+    """
+    최소 간격 조건 적용 (높은 피크 우선, scipy find_peaks와 같은 규칙)
+
+    반복은 샘플 수가 아니라 피크 수만큼만 돈다.
+    """
+    keep = np.ones(len(peaks), dtype=bool)
+    order = np.argsort(arr[peaks], kind='stable')[::-1]
+    for i in order:
+        if not keep[i]:
+            continue
+        lo = np.searchsorted(peaks, peaks[i] - distance, side='right')
+        hi = np.searchsorted(peaks, peaks[i] + distance, side='left')
+        keep[lo:hi] = False
+        keep[i] = True
+    return peaks[keep]
+
+
+def _higher_neighbors(heights, queries):
+    """
+    질의 항목별 이전/다음의 더 큰 항목 위치 (없으면 -1 / len(heights))
+
+    구간 최대값 희소 테이블(levels[k][i] = max(heights[i:i + 2^k]))을 만들고
+    2의 거듭제곱 길이로 "모두 자기 이하인 구간"을 넓혀 가며 경계를 찾는다.
+    모든 질의를 레벨마다 한 번에 처리하므로 반복은 log(n)회다.
+    """
+    n = len(heights)
+    levels = [heights]
+    while (1 << len(levels)) <= n:
+        width = 1 << (len(levels) - 1)
+        levels.append(np.maximum(levels[-1][:-width], levels[-1][width:]))
+
+    h = heights[queries]
+    left = queries.copy()       # [left, query) 구간은 모두 h 이하
+    right = queries + 1         # [query + 1, right) 구간은 모두 h 이하
+    for k in range(len(levels) - 1, -1, -1):
+        width = 1 << k
+        level = levels[k]
+
+        start = left - width
+        ok = start >= 0
+        ok[ok] = level[start[ok]] <= h[ok]
+        left[ok] = start[ok]
+
+        ok = right + width <= n
+        ok[ok] = level[right[ok]] <= h[ok]
+        right[ok] += width
+    return left - 1, right
+
+
+def _peak_prominences(peaks, arr):
+    """
+    피크 프로미넌스와 좌/우 탐색 구간
+
+    좌우로 더 높은 점을 만날 때까지의 최소값이 기준점이다. 더 높은 점을
+    처음 만나는 위치는 항상 더 높은 극대점(같은 값 포함)으로 오르는 경사 위에
+    있으므로, 극대점끼리 비교해 구간을 정하고 최소값은 reduceat으로 구한다.
+
+    Returns:
+        (prominences, 좌측 구간 시작, 우측 구간 끝(미포함)) 튜플
+    """
+    n = len(arr)
+    barriers = _plateau_maxima(arr)
+    left, right = _higher_neighbors(arr[barriers], np.searchsorted(barriers, peaks))
+    barriers_ext = np.append(barriers, [n, -1])
+
+    lo = barriers_ext[left] + 1
+    hi = barriers_ext[right]
+
+    arr_ext = np.append(arr, 0.0)
+    left_min = np.minimum.reduceat(arr_ext, np.column_stack([lo, peaks + 1]).ravel())[::2]
+    right_min = np.minimum.reduceat(arr_ext, np.column_stack([peaks, hi]).ravel())[::2]
+    return arr[peaks] - np.maximum(left_min, right_min), lo, hi
+
+
+def _crossing(arr, peak, line, bound, step):
+    """
+    peak에서 step(-1/+1) 방향으로 처음 line 이하가 되는 위치
+
+    탐색 구간을 두 배씩 넓혀 피크 폭에 비례하는 만큼만 읽는다.
+    bound(포함)까지 가면 반드시 찾는다.
+    """
+    size = 16
+    while True:
+        if step < 0:
+            start = max(bound, peak - size)
+            below = np.flatnonzero(arr[start:peak + 1] <= line)
+            if len(below) or start == bound:
+                return start + below[-1]
+        else:
+            stop = min(bound + 1, peak + size + 1)
+            below = np.flatnonzero(arr[peak:stop] <= line)
+            if len(below) or stop == bound + 1:
+                return peak + below[0]
+        size *= 2
+
+
+def _peak_widths(peaks, arr, prominences, lo, hi, rel_height=0.5):
+    """피크 폭 (프로미넌스의 rel_height 높이에서 선형 보간한 샘플 수)"""
+    widths = np.empty(len(peaks))
+    for k, peak in enumerate(peaks):
+        line = arr[peak] - prominences[k] * rel_height
+
+        i = _crossing(arr, peak, line, lo[k], -1)
+        left_x = i
+        if i < peak and arr[i] < line:
+            left_x = i + (line - arr[i]) / (arr[i + 1] - arr[i])
+
+        j = _crossing(arr, peak, line, hi[k] - 1, 1)
+        right_x = j
+        if j > peak and arr[j] < line:
+            right_x = j - (line - arr[j]) / (arr[j - 1] - arr[j])
+
+        widths[k] = right_x - left_x
+    return widths
+
+
+def _find_peaks_numpy(arr, height=None, distance=None, prominence=None, width=None):
+    """scipy가 없을 때의 find_peaks 대체 (height/distance/prominence/width 최소값 조건)"""
+    peaks = _local_maxima(arr)
+    if height is not None:
+        peaks = peaks[arr[peaks] >= height]
+    if distance is not None and distance > 1 and len(peaks) > 1:
+        peaks = _select_by_distance(peaks, arr, distance)
+    if (prominence is None and width is None) or len(peaks) == 0:
+        return peaks
+
+    prominences, lo, hi = _peak_prominences(peaks, arr)
+    if prominence is not None:
+        keep = prominences >= prominence
+        peaks, prominences, lo, hi = peaks[keep], prominences[keep], lo[keep], hi[keep]
+    if width is not None:
+        peaks = peaks[_peak_widths(peaks, arr, prominences, lo, hi) >= width]
+    return peaks
+
+
 class TimeDomainAnalyzer:
     """시간 영역 신호 분석 클래스"""
 
@@ -22,68 +213,151 @@ class TimeDomainAnalyzer:
         시간 영역 분석 수행
 
         Args:
-            data: 시간 영역 신호 데이터
+            data: 시간 영역 신호 데이터 ((n,) 또는 열이 채널인 (n, k), 결측은 NaN)
 
         Returns:
-            분석 결과 딕셔너리
+            분석 결과 딕셔너리 (2차원 입력이면 값이 열별 배열)
         """
         if len(data) == 0:
             return None
 
+        if np.ndim(data) == 2:
+            return self.stats.calculate_statistics_batch(data)
         return self.stats.calculate_statistics(data)
 
-    def detect_peaks(self, data, threshold=None):
+    def detect_peaks(self, data, threshold=None, prominence=None, width=None, distance=None):
         """
-        피크 검출
+        피크 검출 (scipy가 있으면 signal.find_peaks, 없으면 NumPy 구현)
 
         Args:
             data: 신호 데이터
             threshold: 검출 임계값 (None이면 평균 + 1*std)
+            prominence: 최소 프로미넌스 (주변 기준점 대비 돌출 높이, V)
+            width: 최소 폭 (프로미넌스 절반 높이에서의 샘플 수)
+            distance: 피크 간 최소 간격 (샘플 수, 가까우면 높은 피크 우선)
 
         Returns:
-            피크 인덱스 리스트
+            피크 인덱스 배열
         """
-        if len(data) < 3:
-            return []
-
-        arr = np.array(data)
+        arr = np.asarray(data, dtype=np.float64)
+        if len(arr) < 3:
+            return np.empty(0, dtype=np.intp)
 
         if threshold is None:
-            threshold = np.mean(arr) + np.std(arr)
+            threshold = _default_threshold(arr)
+        # find_peaks의 height는 이상(>=) 조건이므로 초과(>) 조건으로 맞춤
+        height = np.nextafter(threshold, np.inf)
 
-        peaks = []
-        for i in range(1, len(arr) - 1):
-            if arr[i] > arr[i - 1] and arr[i] > arr[i + 1] and arr[i] > threshold:
-                peaks.append(i)
+        if SCIPY_AVAILABLE:
+            peaks, _ = signal.find_peaks(
+                arr, height=height, distance=distance if distance and distance >= 1 else None,
+                prominence=prominence, width=width
+            )
+            return peaks
+        return _find_peaks_numpy(arr, height, distance, prominence, width)
 
-        return peaks
+    def detect_peaks_multi(self, data, threshold=None, prominence=None, width=None, distance=None):
+        """
+        다채널 피크 검출 (열마다 detect_peaks와 같은 경로, 평탄한 꼭대기 포함)
+
+        Args:
+            data: (n, k) 신호 행렬 (열 = 채널, 결측은 NaN)
+            threshold: 검출 임계값 (스칼라 또는 열별 배열, None이면 열별 평균 + 1*std)
+            prominence, width, distance: detect_peaks와 같음
 
-    def calculate_frequency(self, data, sample_rate):
+        Returns:
+            열별 피크 인덱스 배열 리스트
         """
-        신호 주파수 추정 (zero-crossing 기반)
+        arr = np.asarray(data, dtype=np.float64)
+        if arr.ndim != 2:
+            raise ValueError(f"2차원 (n, k) 배열이 필요합니다: {arr.shape}")
+        n, k = arr.shape
+        if n < 3:
+            return [np.empty(0, dtype=np.intp) for _ in range(k)]
+
+        if threshold is None:
+            threshold = _default_threshold(arr)
+        threshold = np.broadcast_to(np.asarray(threshold, dtype=np.float64), (k,))
+
+        return [self.detect_peaks(arr[:, col], threshold[col], prominence, width, distance)
+                for col in range(k)]
+
+    def calculate_frequency(self, data, sample_rate=None, timestamps=None, hysteresis=None):
+        """
+        신호 주파수 추정 (zero-crossing 기반, 보간된 상승 교차 시각)
+
+        DC 제거 후 슈미트 트리거(±hysteresis)로 상태를 정하고, 낮음 → 높음
+        전환마다 직전 부호 변화(np.signbit) 구간에서 0을 지나는 시각을 선형
+        보간한다. 주파수 = 주기 수 / 주기 합 (결측 구간을 건너는 주기는 제외).
 
         Args:
-            data: 신호 데이터
-            sample_rate: 샘플링 레이트 (Hz)
+            data: 신호 데이터 ((n,) 또는 열이 채널인 (n, k), 결측은 NaN)
+            sample_rate: 샘플링 레이트 (Hz, timestamps가 없을 때 균일 간격 가정)
+            timestamps: (n,) 샘플별 시각 (초, epoch 가능)
+            hysteresis: 노이즈 제거용 상태 전환 폭 (V, DC 제거 후 ±값, 스칼라 또는 열별).
+                        None이면 열별로 잡음 크기와 피크-피크에서 정한다.
+                        0이면 슈미트 트리거 없이 부호만 본다.
 
         Returns:
-            추정 주파수 (Hz)
+            추정 주파수 (Hz, 1차원 입력이면 float, 2차원이면 열별 배열).
+            측정된 주기가 없으면 0.0
         """
-        if len(data) < 10:
-            return 0.0
+        arr = np.asarray(data, dtype=np.float64)
+        single = arr.ndim == 1
+        if single:
+            arr = arr[:, np.newaxis]
+        n, k = arr.shape
+
+        if n < 10 or (timestamps is None and not sample_rate):
+            return 0.0 if single else np.zeros(k)
+
+        if timestamps is None:
+            t = np.arange(n) / sample_rate
+        else:
+            t = np.asarray(timestamps, dtype=np.float64)
+            t = t - t[0]
+
+        # DC 제거 (결측 제외 평균)
+        valid = ~np.isnan(arr)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            arr = arr - np.where(valid, arr, 0).sum(axis=0) / valid.sum(axis=0)
+
+        if hysteresis is None:
+            hysteresis = _default_hysteresis(arr)
+
+        # 슈미트 트리거 상태: 임계 밖이면 +1/-1, 안쪽/결측이면 직전 상태 유지
+        rows = np.arange(n)[:, np.newaxis]
+        state = (arr > hysteresis).astype(np.int8) - (arr < -hysteresis)
+        held = np.maximum.accumulate(np.where(state != 0, rows, 0), axis=0)
+        state = np.take_along_axis(state, held, axis=0)
+
+        # 상승 전환 (-1 → +1) 위치 j와 그 직전 음수 샘플 i
+        j, col = np.nonzero((state[1:] > 0) & (state[:-1] < 0))
+        j += 1
+        negative = np.signbit(arr) & valid
+        last_negative = np.maximum.accumulate(np.where(negative, rows, 0), axis=0)
+        i = last_negative[j, col]
 
-        arr = np.array(data)
-        # DC 제거
-        arr = arr - np.mean(arr)
+        # 교차 시각 선형 보간 (보간 불가능하면 전환 샘플 시각)
+        x0, x1 = arr[i, col], arr[np.minimum(i + 1, n - 1), col]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            frac = x0 / (x0 - x1)
+        ok = np.isfinite(frac) & (frac >= 0) & (frac <= 1) & (i + 1 <= j)
+        t1 = t[np.minimum(i + 1, n - 1)]
+        crossing = np.where(ok, t[i] + (t1 - t[i]) * frac, t[j])
 
-        # Zero-crossing 검출
-        crossings = 0
-        for i in range(1, len(arr)):
-            if (arr[i - 1] < 0 and arr[i] >= 0) or (arr[i - 1] >= 0 and arr[i] < 0):
-                crossings += 1
+        # 같은 열의 연속 교차 간격 = 주기 (사이에 결측이 있으면 제외)
+        gaps = np.cumsum(~valid, axis=0)[j, col]
+        order = np.lexsort((crossing, col))
+        col, crossing, gaps = col[order], crossing[order], gaps[order]
+        period_ok = (col[1:] == col[:-1]) & (gaps[1:] == gaps[:-1])
+        periods = np.diff(crossing)[period_ok]
+        period_col = col[1:][period_ok]
 
-        # 주파수 계산 (zero-crossing의 절반)
-        duration = len(arr) / sample_rate
-        frequency = (crossings / 2) / duration if duration > 0 else 0.0
+        count = np.bincount(period_col, minlength=k)
+        total = np.bincount(period_col, weights=periods, minlength=k)
+        frequency = np.zeros(k)
+        has = (count > 0) & (total > 0)
+        frequency[has] = count[has] / total[has]
 
-        return frequency
+        return float(frequency[0]) if single else frequency
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Binary Capture Module
+청크 단위 바이너리 캡처 파일 (uint16 원시 코드 + float64 타임스탬프, mmap 읽기)
+
+파일 구조 (리틀 엔디언):
+    MAGIC(8) | 헤더 길이 uint32 | JSON 헤더 (8바이트 정렬까지 공백 패딩)
+    청크 반복: CHUNK_MAGIC(4) | 행 수 uint32 | 채널별 레인지 ID uint8[8]
+               | 타임스탬프 float64[n] | 코드 uint16[n, k] (8바이트 정렬 패딩)
+"""
+
+import json
+import struct
+from datetime import datetime
+import numpy as np
+import logging
+
+from hardware.adc_conversion import ADC_RANGES, CodeConverter, MISSING_CODE
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"ADSCAP1\0"
+CHUNK_MAGIC = b"CHNK"
+FILE_EXT = ".adcap"
+
+_HEADER_LEN = struct.Struct("<I")
+_CHUNK_HEADER = struct.Struct("<4sI8B")
+_NO_RANGE = 0xFF
+
+
+def _padding(size):
+    """8바이트 정렬 패딩 길이"""
+    return (-size) % 8
+
+
+class BinaryCaptureWriter:
+    """
+    바이너리 캡처 기록 클래스
+
+    청크마다 레인지 ID를 함께 기록하므로 캡처 도중 레인지가 바뀌어도
+    각 청크를 올바르게 변환할 수 있다.
+    """
+
+    def __init__(self, filename, channels, ranges, config=None):
+        """
+        Args:
+            filename: 저장할 파일명
+            channels: 기록 채널 리스트 (코드 배열의 열 순서)
+            ranges: 채널별 레인지 ID 리스트 (길이 8, 첫 청크 기본값)
+            config: 헤더에 함께 저장할 설정 딕셔너리
+        """
+        self.filename = filename
+        self.channels = list(channels)
+        self.ranges = list(ranges)
+        self.rows_written = 0
+
+        header = {
+            'version': 1,
+            'created': datetime.now().isoformat(),
+            'channels': self.channels,
+            'ranges': self.ranges,
+            'range_names': {str(r): ADC_RANGES[r]["name"] for r in set(self.ranges)},
+            'missing_code': MISSING_CODE,
+            'config': config or {}
+        }
+        payload = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        payload += b" " * _padding(len(MAGIC) + _HEADER_LEN.size + len(payload))
+
+        self._file = open(filename, 'wb')
+        self._file.write(MAGIC)
+        self._file.write(_HEADER_LEN.pack(len(payload)))
+        self._file.write(payload)
+
+    def write_chunk(self, timestamps, codes, ranges=None):
+        """
+        청크 기록
+
+        Args:
+            timestamps: (n,) epoch 초 배열
+            codes: (n, k) uint16 코드 배열 (k = 채널 수, 결측은 MISSING_CODE)
+            ranges: 채널별 레인지 ID 리스트 (None이면 생성 시 값)
+        """
+        n = len(timestamps)
+        if n == 0:
+            return
+        codes = np.ascontiguousarray(codes, dtype='<u2')
+        if codes.shape != (n, len(self.channels)):
+            raise ValueError(f"청크 크기 불일치: {codes.shape}")
+
+        ranges = self.ranges if ranges is None else list(ranges)
+        range_bytes = [ranges[ch] if ch < len(ranges) else _NO_RANGE for ch in range(8)]
+
+        self._file.write(_CHUNK_HEADER.pack(CHUNK_MAGIC, n, *range_bytes))
+        self._file.write(np.ascontiguousarray(timestamps, dtype='<f8').tobytes())
+        self._file.write(codes.tobytes())
+        self._file.write(b"\0" * _padding(codes.nbytes))
+        self.rows_written += n
+
+    def close(self):
+        """파일 닫기"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class BinaryCaptureReader:
+    """
+    바이너리 캡처 읽기 클래스
+
+    파일 전체를 np.memmap으로 열고 청크 헤더만 훑어 위치를 기록한다.
+    청크의 타임스탬프/코드는 파싱 없이 memmap 뷰로 반환된다.
+    """
+
+    def __init__(self, filename):
+        """
+        Args:
+            filename: 캡처 파일명
+
+        Raises:
+            ValueError: 캡처 파일 형식이 아닌 경우
+        """
+        self.filename = filename
+        self._map = np.memmap(filename, dtype=np.uint8, mode='r')
+        if bytes(self._map[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"캡처 파일 형식이 아닙니다: {filename}")
+
+        offset = len(MAGIC)
+        (header_len,) = _HEADER_LEN.unpack_from(self._map, offset)
+        offset += _HEADER_LEN.size
+        self.header = json.loads(bytes(self._map[offset:offset + header_len]).decode('utf-8'))
+        offset += header_len
+
+        self.channels = self.header['channels']
+        self.chunks = []
+        self._scan_chunks(offset)
+
+    def _scan_chunks(self, offset):
+        """청크 헤더를 따라가며 청크 뷰 목록 생성"""
+        k = len(self.channels)
+        size = len(self._map)
+        while offset + _CHUNK_HEADER.size <= size:
+            magic, n, *range_bytes = _CHUNK_HEADER.unpack_from(self._map, offset)
+            if magic != CHUNK_MAGIC:
+                logger.warning(f"손상된 청크 헤더 (offset {offset}), 이후 데이터 무시")
+                break
+            offset += _CHUNK_HEADER.size
+            ts_bytes = n * 8
+            code_bytes = n * k * 2
+            if offset + ts_bytes + code_bytes > size:
+                logger.warning(f"잘린 청크 (offset {offset}), 이후 데이터 무시")
+                break
+
+            timestamps = self._map[offset:offset + ts_bytes].view('<f8')
+            offset += ts_bytes
+            codes = self._map[offset:offset + code_bytes].view('<u2').reshape(n, k)
+            offset += code_bytes + _padding(code_bytes)
+
+            self.chunks.append({
+                'timestamps': timestamps,
+                'codes': codes,
+                'ranges': [r if r != _NO_RANGE else 0 for r in range_bytes]
+            })
+
+    def __len__(self):
+        return sum(len(chunk['timestamps']) for chunk in self.chunks)
+
+    @property
+    def timestamps(self):
+        """전체 타임스탬프 (청크가 하나면 memmap 뷰, 여러 개면 연결한 복사본)"""
+        if len(self.chunks) == 1:
+            return self.chunks[0]['timestamps']
+        if not self.chunks:
+            return np.empty(0)
+        return np.concatenate([chunk['timestamps'] for chunk in self.chunks])
+
+    @property
+    def codes(self):
+        """전체 원시 코드 (청크가 하나면 memmap 뷰)"""
+        if len(self.chunks) == 1:
+            return self.chunks[0]['codes']
+        if not self.chunks:
+            return np.empty((0, len(self.channels)), dtype=np.uint16)
+        return np.concatenate([chunk['codes'] for chunk in self.chunks])
+
+    def to_volts(self, converter=None):
+        """
+        전체 데이터 전압 변환 (청크별 레인지 적용)
+
+        Args:
+            converter: CodeConverter (None이면 기본 테이블, 보정 없음)
+
+        Returns:
+            (n, k) float64 전압 배열 (결측은 NaN)
+        """
+        converter = converter or CodeConverter()
+        parts = []
+        for chunk in self.chunks:
+            range_ids = [chunk['ranges'][ch] for ch in self.channels]
+            parts.append(converter.convert_block(chunk['codes'], range_ids, self.channels))
+        if not parts:
+            return np.empty((0, len(self.channels)))
+        return np.concatenate(parts)
+
+    def channel_volts(self, channel, converter=None):
+        """
+        단일 채널 전압 (SignalStatistics/SpectralAnalyzer 입력용)
+
+        Returns:
+            (n,) float64 전압 배열
+        """
+        column = self.channels.index(channel)
+        converter = converter or CodeConverter()
+        parts = [converter.to_volts(chunk['codes'][:, column], chunk['ranges'][channel], channel)
+                 for chunk in self.chunks]
+        volts = np.concatenate(parts) if parts else np.empty(0)
+        if volts.size:
+            missing = self.codes[:, column] == MISSING_CODE
+            if missing.any():
+                volts[missing] = np.nan
+        return volts
+
+    def close(self):
+        """memmap 해제"""
+        self.chunks = []
+        self._map = None
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Block Queue Module
+스캔 블록 단위 수집 → GUI 전달 큐
+"""
+
+import queue
+import time
+import numpy as np
+import logging
+
+from hardware.adc_conversion import NO_RANGE
+
+logger = logging.getLogger(__name__)
+
+
+class ScanBlockQueue:
+    """
+    스캔 블록 전달 큐
+
+    수집 스레드는 put_scan()으로 스캔 1회(채널별 전압 행)와 캡처 시점의 채널별
+    레인지를 사전 할당된 블록에 채우고, 블록이 목표 크기에 도달하면
+    (timestamps, samples, ranges) 배열을 큐에 넣는다. GUI 스레드는 drain()으로
+    쌓인 블록을 한 번에 꺼내 DataManager.add_block()에 넘기므로 스캔마다
+    딕셔너리를 만들지 않고, 레인지 구간도 캡처 시점 기준으로 기록된다.
+
+    목표 블록 크기는 측정 주기 기준으로 max_latency 안에 전달되도록 정한다
+    (주기가 max_latency 이상이면 스캔마다 전달).
+
+    블록 배열은 할당해 둔 것을 돌려 쓴다. 전달한 블록은 GUI가 다음 drain()을
+    호출할 때 빈 블록 목록으로 돌아오고, 수집 스레드는 flush() 후 빈 블록을
+    꺼내 채운다. 평상시에는 채우는 블록 / 전달된 블록 / GUI가 사용 중인 블록
+    세 개로 순환하며, GUI가 밀려 빈 블록이 없을 때만 새로 할당한다.
+    """
+
+    def __init__(self, num_channels=8, block_size=1024, max_latency=0.1):
+        """
+        Args:
+            num_channels: 채널 수
+            block_size: 최대 블록 행 수
+            max_latency: 스캔이 블록에 머무는 최대 시간 (초)
+        """
+        self.num_channels = num_channels
+        self.block_size = block_size
+        self.max_latency = max_latency
+        self._queue = queue.Queue()
+        self._free = queue.SimpleQueue()    # 재사용할 빈 블록
+        self._drained = []                  # 마지막 drain()이 반환한 블록 (다음 drain 때 반납)
+        self._target = 1
+        self._free.put(self._allocate())
+        self._next_block(self._allocate())
+
+    def _allocate(self):
+        """(timestamps, samples, ranges) 블록 배열 할당"""
+        return (np.empty(self.block_size, dtype=np.float64),
+                np.full((self.block_size, self.num_channels), np.nan, dtype=np.float32),
+                np.empty((self.block_size, self.num_channels), dtype=np.uint8))
+
+    def _next_block(self, block=None):
+        """생산자 측 다음 블록 준비 (빈 블록 재사용, 없으면 새로 할당)"""
+        if block is None:
+            try:
+                block = self._free.get_nowait()
+            except queue.Empty:
+                block = self._allocate()
+        self._block = block
+        self._timestamps, self._samples, self._ranges = block
+        self._count = 0
+        self._started = None
+
+    def set_interval(self, interval):
+        """측정 주기 설정 (목표 블록 크기 갱신)"""
+        if interval <= 0:
+            self._target = self.block_size
+        else:
+            self._target = int(min(self.block_size, max(1, self.max_latency // interval)))
+
+    def put_scan(self, timestamp, values, ranges=None):
+        """
+        스캔 1회 추가 (수집 스레드)
+
+        Args:
+            timestamp: epoch 초
+            values: (num_channels,) 전압 배열 (결측은 NaN)
+            ranges: (num_channels,) 캡처 시점 채널별 레인지 ID (None이면 NO_RANGE)
+        """
+        if self._count == 0:
+            self._started = time.monotonic()
+        self._timestamps[self._count] = timestamp
+        self._samples[self._count] = values
+        self._ranges[self._count] = NO_RANGE if ranges is None else ranges
+        self._count += 1
+
+        if (self._count >= self._target or
+                time.monotonic() - self._started >= self.max_latency):
+            self.flush()
+
+    def put_block(self, timestamps, samples, ranges=None):
+        """
+        블록 그대로 추가 (버스트 캡처 등, 수집 스레드)
+
+        Args:
+            timestamps: (n,) epoch 초 배열
+            samples: (n, num_channels) 전압 배열
+            ranges: 캡처 시점 채널별 레인지 ID, (num_channels,) 또는 (n, num_channels)
+                    (None이면 NO_RANGE)
+        """
+        self.flush()
+        n = len(timestamps)
+        if n:
+            ranges = np.asarray(NO_RANGE if ranges is None else ranges, dtype=np.uint8)
+            self._queue.put((np.asarray(timestamps, dtype=np.float64),
+                             np.asarray(samples, dtype=np.float32),
+                             np.broadcast_to(ranges, (n, self.num_channels)), None))
+
+    def flush(self):
+        """채우던 블록 전달 (수집 스레드)"""
+        if self._count == 0:
+            return
+        n = self._count
+        self._queue.put((self._timestamps[:n], self._samples[:n], self._ranges[:n], self._block))
+        self._next_block()
+
+    def drain(self):
+        """
+        쌓인 블록 모두 꺼내기 (GUI 스레드)
+
+        Returns:
+            (timestamps, samples, ranges) 배열 튜플 (없으면 None)
+            ranges는 (n, num_channels) 행별 캡처 시점 레인지 (미지정은 NO_RANGE).
+            블록 배열의 뷰일 수 있으므로 다음 drain() 호출 전까지만 유효하다.
+        """
+        # 이전 drain()이 반환한 블록은 이제 사용이 끝났으므로 반납
+        for block in self._drained:
+            self._free.put(block)
+        self._drained = []
+
+        blocks = []
+        while True:
+            try:
+                blocks.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if not blocks:
+            return None
+        self._drained = [b[3] for b in blocks if b[3] is not None]
+        if len(blocks) == 1:
+            return blocks[0][:3]
+        return tuple(np.concatenate([b[i] for b in blocks]) for i in range(3))
+
+    def clear(self):
+        """대기 중인 블록 폐기"""
+        self.drain()
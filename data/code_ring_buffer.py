@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Code Ring Buffer Module
+원시 ADC 코드 링 버퍼 (읽을 때 전압 변환)
+"""
+
+import numpy as np
+import logging
+
+from data.ring_buffer import RingBuffer
+from hardware.adc_conversion import CodeConverter, MISSING_CODE
+
+logger = logging.getLogger(__name__)
+
+
+def add_segment(segments, seq, ranges):
+    """
+    레인지 구간 목록에 seq 행부터 적용할 채널별 레인지 추가
+
+    Args:
+        segments: (시작 행 번호, 채널별 레인지 튜플) 리스트 (시작 행 오름차순)
+        seq: 새 레인지가 적용되는 첫 행 번호
+        ranges: 채널별 레인지 ID 시퀀스
+    """
+    ranges = tuple(int(r) for r in ranges)
+    if segments[-1][1] == ranges:
+        return
+    if segments[-1][0] == seq:
+        segments[-1] = (seq, ranges)
+    else:
+        segments.append((seq, ranges))
+
+
+def expire_segments(segments, oldest):
+    """oldest 행보다 오래된 레인지 구간 제거 (oldest를 포함하는 구간은 유지)"""
+    while len(segments) > 1 and segments[1][0] <= oldest:
+        segments.pop(0)
+
+
+def segment_runs(segments, first_seq, count):
+    """
+    first_seq부터 count개 행을 레인지 구간별로 나누기
+
+    Returns:
+        [(시작 인덱스, 끝 인덱스, 채널별 레인지), ...] (인덱스는 first_seq 기준, 빈 구간 제외)
+    """
+    runs = []
+    for i, (seq, ranges) in enumerate(segments):
+        end_seq = segments[i + 1][0] if i + 1 < len(segments) else None
+        lo = max(seq - first_seq, 0)
+        hi = count if end_seq is None else min(end_seq - first_seq, count)
+        if hi > lo:
+            runs.append((lo, hi, ranges))
+    return runs
+
+
+class CodeRingBuffer:
+    """
+    원시 코드 저장 링 버퍼
+
+    샘플을 uint16 코드(결측은 MISSING_CODE)로 보관하고, 레인지가 바뀔 때마다
+    (시작 행 번호, 채널별 레인지) 구간을 기록한다. 읽기 시 구간별로
+    CodeConverter 룩업 테이블을 적용해 float32 전압으로 변환하므로
+    이후 레인지를 바꿔도 이전 데이터의 해석이 달라지지 않는다.
+    RingBuffer와 같은 읽기 인터페이스를 제공한다 (반환값은 변환된 복사본).
+    """
+
+    def __init__(self, capacity, width=8, converter=None, range_ids=None):
+        """
+        Args:
+            capacity: 최대 행 수
+            width: 채널 수
+            converter: CodeConverter 객체 (None이면 기본 레인지 테이블)
+            range_ids: 초기 채널별 레인지 ID 리스트 (None이면 모두 0)
+        """
+        # 읽을 때 항상 변환 복사하므로 미러 영역 없이 저장 (행당 2바이트 × 채널)
+        self.codes = RingBuffer(capacity, np.uint16, width, fill=MISSING_CODE, mirrored=False)
+        self.capacity = self.codes.capacity
+        self.width = width
+        self.converter = converter if converter is not None else CodeConverter()
+        ranges = tuple(range_ids) if range_ids is not None else (0,) * width
+        self.segments = [(0, ranges)]   # (시작 행 번호, 채널별 레인지)
+
+    @property
+    def total_written(self):
+        return self.codes.total_written
+
+    @total_written.setter
+    def total_written(self, value):
+        self.codes.total_written = value
+
+    @property
+    def dtype(self):
+        """읽기 결과 타입"""
+        return np.dtype(np.float32)
+
+    @property
+    def range_ids(self):
+        """현재 채널별 레인지"""
+        return self.segments[-1][1]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def set_range(self, channel, range_id):
+        """채널 레인지 변경 (다음에 기록되는 행부터 적용)"""
+        ranges = list(self.range_ids)
+        ranges[channel] = range_id
+        self.set_ranges(ranges)
+
+    def set_ranges(self, ranges):
+        """전체 채널 레인지 설정 (다음에 기록되는 행부터 적용)"""
+        add_segment(self.segments, self.codes.total_written, ranges)
+
+    def encode(self, volts):
+        """전압 블록 → 현재 레인지 기준 코드"""
+        return self.converter.from_volts(volts, self.range_ids)
+
+    def decode(self, codes, ranges=None):
+        """코드 블록 → float32 전압 (ranges가 None이면 현재 레인지)"""
+        volts = self.converter.convert_block(codes, self.range_ids if ranges is None else ranges)
+        return volts.astype(np.float32)
+
+    def extend(self, codes):
+        """코드 행 추가, 밀려난 행 수 반환"""
+        evicted = self.codes.extend(codes)
+        self._expire_segments()
+        return evicted
+
+    def append(self, row):
+        """코드 한 행 추가"""
+        self.codes.append(row)
+        self._expire_segments()
+
+    def _expire_segments(self):
+        """윈도우보다 오래된 레인지 구간 제거 (윈도우 시작을 포함하는 구간은 유지)"""
+        expire_segments(self.segments, self.codes.total_written - len(self.codes))
+
+    def slice(self, start, stop):
+        """start~stop 행을 전압으로 변환 (start/stop은 오래된 행 기준 인덱스)"""
+        codes = self.codes.slice(start, stop)
+        if len(self.segments) == 1:
+            return self.decode(codes, self.segments[0][1])
+
+        base = self.codes.total_written - len(self.codes)
+        out = np.empty((len(codes), self.width), dtype=np.float32)
+        for lo, hi, ranges in segment_runs(self.segments, base + max(0, start), len(codes)):
+            out[lo:hi] = self.decode(codes[lo:hi], ranges)
+        return out
+
+    def view(self):
+        """저장된 행 전체 (전압 변환 복사본)"""
+        return self.slice(0, len(self.codes))
+
+    def tail(self, n):
+        """가장 최근 n개 행 (전압)"""
+        size = len(self.codes)
+        return self.slice(size - min(n, size), size)
+
+    def oldest(self, n):
+        """가장 오래된 n개 행 (전압)"""
+        return self.slice(0, min(n, len(self.codes)))
+
+    def latest(self):
+        """가장 최근 행 (전압, 비어 있으면 None)"""
+        if len(self.codes) == 0:
+            return None
+        return self.tail(1)[0]
+
+    def set_column(self, column, value):
+        """한 열 전체 설정 (NaN은 MISSING_CODE)"""
+        self.codes.set_column(column, MISSING_CODE if value != value else value)
+
+    def clear(self):
+        """전체 삭제"""
+        self.codes.clear()
+        self.segments = [(self.codes.total_written, self.range_ids)]
+
+    def resized(self, capacity):
+        """최근 데이터와 레인지 구간을 유지한 새 용량의 버퍼 반환"""
+        new = CodeRingBuffer(capacity, self.width, self.converter)
+        new.codes = self.codes.resized(capacity)
+        new.capacity = new.codes.capacity
+        new.segments = list(self.segments)
+        new._expire_segments()
+        return new
@@ -4,64 +4,239 @@ Data Export Module
 데이터 내보내기 (CSV, JSON 등)
 """
 
-import csv
+import os
+import gzip
 import json
 from datetime import datetime
+import numpy as np
 import logging
 
+from data.binary_capture import BinaryCaptureWriter
+from hardware.adc_conversion import CodeConverter
+
 logger = logging.getLogger(__name__)
 
 
+# CSV 내보내기 청크 크기 (행)
+CSV_CHUNK_ROWS = 100000
+
+# csv.writer 기본 줄바꿈과 동일
+CSV_LINE_END = "\r\n"
+
+GZIP_EXT = ".gz"
+
+
+def _local_offsets(timestamps):
+    """epoch 초 → 로컬 시간대 오프셋(초), 구간 안에 서머타임 전환이 없으면 스칼라"""
+    def offset(ts):
+        return datetime.fromtimestamp(float(ts)).astimezone().utcoffset().total_seconds()
+
+    first, last = offset(timestamps[0]), offset(timestamps[-1])
+    if first == last:
+        return first
+    return np.array([offset(ts) for ts in timestamps])
+
+
+def format_timestamps(timestamps):
+    """
+    epoch 초 배열 → 'YYYY-MM-DD HH:MM:SS.ffffff' 로컬 시각 문자열 배열 (벡터 변환)
+
+    datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S.%f')와 같은 결과
+    (datetime처럼 소수부만 마이크로초로 반올림한 뒤 정수 초와 UTC 오프셋을 더함)
+    """
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    if len(timestamps) == 0:
+        return np.empty(0, dtype='U26')
+    frac, whole = np.modf(timestamps)
+    offsets = np.round(_local_offsets(timestamps) * 1e6).astype(np.int64)
+    local_us = (whole.astype(np.int64) * 1000000 + np.round(frac * 1e6).astype(np.int64)
+                + offsets).astype('datetime64[us]')
+    return np.char.replace(np.datetime_as_string(local_us, unit='us'), 'T', ' ')
+
+
+def parse_timestamps(strings):
+    """
+    'YYYY-MM-DD HH:MM:SS.ffffff' 로컬 시각 문자열 배열 → epoch 초 배열 (format_timestamps의 역변환)
+    """
+    local = np.asarray(strings, dtype='datetime64[us]').astype(np.int64) / 1e6
+    if len(local) == 0:
+        return local
+    return local - _local_offsets(local)
+
+
+def _remove_partial(filename):
+    """취소/실패한 내보내기의 불완전한 파일 삭제"""
+    try:
+        if os.path.exists(filename):
+            os.remove(filename)
+    except OSError as e:
+        logger.error(f"불완전한 파일 삭제 실패: {e}")
+
+
+def format_csv_block(timestamps, samples, precision=6):
+    """
+    프레임 블록 → CSV 텍스트 (결측은 빈 칸)
+
+    행마다 f-string을 만드는 대신 청크 전체를 한 번의 % 포맷으로 변환한다.
+
+    Args:
+        timestamps: (n,) epoch 초 배열
+        samples: (n, k) 전압 배열
+        precision: 소수점 자리수
+
+    Returns:
+        CSV 텍스트 (행마다 줄바꿈)
+    """
+    n, k = samples.shape
+    if n == 0:
+        return ""
+    cells = np.empty((n, k + 1), dtype=object)
+    cells[:, 0] = format_timestamps(timestamps)
+    cells[:, 1:] = samples.astype(np.float64)
+    row_format = "%s" + f",%.{precision}f" * k + CSV_LINE_END
+    return (row_format * n % tuple(cells.ravel().tolist())).replace("nan", "")
+
+
 class DataExporter:
     """데이터 내보내기 클래스"""
 
     @staticmethod
-    def export_to_csv(filename, channel_data):
+    def export_to_csv(filename, frame, progress=None, cancel=None, compress=None):
         """
         CSV 파일로 내보내기
 
         Args:
             filename: 저장할 파일명
-            channel_data: {ch: {'timestamps': [...], 'voltages': [...], 'enabled': bool}, ...}
+            frame: DataManager.get_frame() 또는 snapshot() 결과
+                   {'timestamps': (N,) epoch 초, 'samples': (N, 8) 전압, 'enabled': (8,) bool}
+            progress: 청크마다 진행률(0.0 ~ 1.0)을 받을 함수 (None이면 보고 안 함)
+            cancel: 취소 요청 threading.Event (설정되면 중단 후 파일 삭제)
+            compress: gzip 스트리밍 압축 여부 (None이면 파일명이 .gz로 끝날 때)
         """
         try:
             # 활성화된 채널만 필터링
-            enabled_channels = [ch for ch in range(8) if channel_data[ch]['enabled']]
+            enabled_channels = [ch for ch in range(8) if frame['enabled'][ch]]
 
             if not enabled_channels:
                 logger.warning("활성화된 채널이 없습니다")
                 return False
 
-            with open(filename, 'w', newline='') as f:
-                writer = csv.writer(f)
+            timestamps = np.asarray(frame['timestamps'])
+            samples = np.asarray(frame['samples'])[:, enabled_channels]
 
+            # 공유 시간축에서 선택 채널이 모두 결측인 행 제외
+            keep = ~np.isnan(samples).all(axis=1)
+            if not keep.all():
+                timestamps, samples = timestamps[keep], samples[keep]
+
+            if compress is None:
+                compress = filename.endswith(GZIP_EXT)
+            if compress:
+                f = gzip.open(filename, 'wt', newline='', compresslevel=6)
+            else:
+                f = open(filename, 'w', newline='')
+
+            with f:
                 # 헤더 작성
                 header = ['Timestamp'] + [f'CH{ch} (V)' for ch in enabled_channels]
-                writer.writerow(header)
-
-                # 최대 길이 계산
-                max_len = max([len(channel_data[ch]['timestamps'])
-                              for ch in enabled_channels], default=0)
-
-                # 데이터 작성
-                for i in range(max_len):
-                    row = []
-                    ts = None
-                    for ch in enabled_channels:
-                        if i < len(channel_data[ch]['timestamps']):
-                            if ts is None:
-                                ts = channel_data[ch]['timestamps'][i].strftime('%Y-%m-%d %H:%M:%S.%f')
-                            row.append(f"{channel_data[ch]['voltages'][i]:.6f}")
-                        else:
-                            row.append("")
-                    if ts:
-                        writer.writerow([ts] + row)
+                f.write(",".join(header) + CSV_LINE_END)
+
+                # 데이터 작성 (청크 단위 일괄 포맷)
+                for start in range(0, len(timestamps), CSV_CHUNK_ROWS):
+                    if cancel is not None and cancel.is_set():
+                        break
+                    stop = start + CSV_CHUNK_ROWS
+                    f.write(format_csv_block(timestamps[start:stop], samples[start:stop]))
+                    if progress is not None:
+                        progress(min(stop, len(timestamps)) / len(timestamps))
+
+            if cancel is not None and cancel.is_set():
+                _remove_partial(filename)
+                logger.info(f"CSV 저장 취소: {filename}")
+                return False
 
-            logger.info(f"데이터 저장 성공: {filename}")
+            logger.info(f"데이터 저장 성공: {filename} ({len(timestamps)}행)")
             return True
 
         except Exception as e:
             logger.error(f"CSV 저장 실패: {e}")
+            _remove_partial(filename)
+            return False
+
+    @staticmethod
+    def export_to_binary(filename, frame, range_ids, config=None, converter=None,
+                         progress=None, cancel=None):
+        """
+        바이너리 캡처 파일로 내보내기 (uint16 원시 코드 + float64 타임스탬프)
+
+        레인지가 바뀐 행에서 청크를 나누고 청크마다 그 구간의 레인지를 기록하므로
+        이전 레인지로 캡처한 행이 현재 레인지로 잘리지 않는다. 프레임에 원시
+        코드가 있으면 다시 양자화하지 않고 그대로 기록한다.
+
+        Args:
+            filename: 저장할 파일명
+            frame: DataManager.snapshot() 결과 ('ranges', 'codes'는 선택)
+            range_ids: 채널별 레인지 ID 리스트 (길이 8, 헤더 기본값,
+                       프레임에 'ranges'가 없으면 전체 행의 변환 기준)
+            config: 헤더에 함께 저장할 설정 딕셔너리
+            converter: CodeConverter (None이면 기본값, 보정 없음)
+            progress: 청크마다 진행률(0.0 ~ 1.0)을 받을 함수 (None이면 보고 안 함)
+            cancel: 취소 요청 threading.Event (설정되면 중단 후 파일 삭제)
+        """
+        try:
+            enabled_channels = [ch for ch in range(8) if frame['enabled'][ch]]
+
+            if not enabled_channels:
+                logger.warning("활성화된 채널이 없습니다")
+                return False
+
+            converter = converter or CodeConverter()
+            timestamps = np.asarray(frame['timestamps'])
+            samples = np.asarray(frame['samples'])[:, enabled_channels]
+            codes = frame.get('codes')
+            if codes is not None:
+                codes = np.asarray(codes)[:, enabled_channels]
+
+            # 레인지 구간 경계 (행 인덱스)
+            segments = frame.get('ranges') or [(0, range_ids)]
+            bounds = [start for start, _ in segments[1:]] + [len(timestamps)]
+
+            keep = ~np.isnan(samples).all(axis=1)
+            total = int(keep.sum())
+            written = 0
+
+            writer = BinaryCaptureWriter(filename, enabled_channels, range_ids, config)
+            try:
+                for (seg_start, ranges), seg_stop in zip(segments, bounds):
+                    column_ranges = [ranges[ch] for ch in enabled_channels]
+                    rows = np.flatnonzero(keep[seg_start:seg_stop]) + seg_start
+                    for start in range(0, len(rows), CSV_CHUNK_ROWS):
+                        if cancel is not None and cancel.is_set():
+                            break
+                        chunk = rows[start:start + CSV_CHUNK_ROWS]
+                        if codes is not None:
+                            chunk_codes = codes[chunk]
+                        else:
+                            chunk_codes = converter.from_volts(samples[chunk], column_ranges,
+                                                               enabled_channels)
+                        writer.write_chunk(timestamps[chunk], chunk_codes, ranges)
+                        written += len(chunk)
+                        if progress is not None:
+                            progress(written / total)
+            finally:
+                writer.close()
+
+            if cancel is not None and cancel.is_set():
+                _remove_partial(filename)
+                logger.info(f"바이너리 저장 취소: {filename}")
+                return False
+
+            logger.info(f"바이너리 저장 성공: {filename} ({written}행)")
+            return True
+
+        except Exception as e:
+            logger.error(f"바이너리 저장 실패: {e}")
+            _remove_partial(filename)
             return False
 
     @staticmethod
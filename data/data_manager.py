@@ -4,92 +4,733 @@ Data Manager Module
 데이터 수집 및 관리
 """
 
-from collections import deque
 from datetime import datetime
+import functools
+import threading
+import time
+import numpy as np
 import logging
 
+from data.ring_buffer import RingBuffer
+from data.code_ring_buffer import CodeRingBuffer, add_segment, expire_segments, segment_runs
+from data.running_stats import RunningStats
+from data.decimation import DecimationPyramid
+from data.history_store import HistoryStore
+from hardware.adc_conversion import MISSING_CODE, NO_RANGE, range_runs
+
 logger = logging.getLogger(__name__)
 
 
+def _to_epoch(timestamp):
+    """datetime 또는 epoch 초 → epoch 초 (float)"""
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return float(timestamp)
+
+
+def _writer(method):
+    """
+    쓰기 메서드 데코레이터
+
+    쓰기 잠금으로 쓰기 작업을 직렬화하고, 가장 바깥 호출의 앞뒤로
+    버전 카운터를 1씩 올린다 (홀수 = 쓰기 중). 읽기 측은 잠금 없이
+    버전을 비교해 일관된 스냅샷인지 확인한다 (seqlock).
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock:
+            outer = self._write_depth == 0
+            if outer:
+                self._version += 1
+            self._write_depth += 1
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._write_depth -= 1
+                if outer:
+                    self._version += 1
+    return wrapper
+
+
+def _resample(timestamps, samples, step, origin):
+    """
+    고정 간격 구간 평균 재샘플 (결측 제외, 빈 구간은 NaN)
+
+    Args:
+        timestamps: (n,) 오름차순 epoch 초
+        samples: (n,) 또는 (n, k) 배열
+        step: 구간 간격 (초)
+        origin: 첫 구간 시작 시각
+
+    Returns:
+        (구간 시작 시각 배열, 구간 평균 배열) 튜플
+    """
+    bins = ((timestamps - origin) // step).astype(np.int64)
+    n_bins = int(bins[-1]) + 1
+    starts = np.flatnonzero(np.r_[True, np.diff(bins) != 0])
+
+    valid = ~np.isnan(samples)
+    sums = np.add.reduceat(np.where(valid, samples, 0.0), starts, axis=0)
+    counts = np.add.reduceat(valid, starts, axis=0)
+
+    out = np.full((n_bins,) + samples.shape[1:], np.nan, dtype=np.float32)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        out[bins[starts]] = sums / counts
+    return origin + np.arange(n_bins) * step, out
+
+
 class DataManager:
-    """데이터 수집 및 관리 클래스"""
+    """
+    데이터 수집 및 관리 클래스
+
+    스캔 1회 = 1행인 열 지향 프레임으로 저장한다. 타임스탬프 열은 하나만 두고
+    샘플은 (N, 8) 행렬에 보관하며, 비활성 채널 값은 NaN으로 채운다.
+    따라서 모든 채널이 같은 시간축을 공유하고 재정렬이 필요 없다.
+
+    쓰기(데이터 추가, 초기화, 크기 조정, 채널 설정)는 내부 잠금으로 직렬화된다.
+    get_frame()/query() 등이 반환하는 뷰는 쓰기와 같은 스레드에서만 사용하고,
+    다른 스레드는 잠금 없이 동작하는 snapshot()/get_running_statistics()/
+    get_enabled_channels()를 사용한다.
+    """
+
+    NUM_CHANNELS = 8
 
-    def __init__(self, max_points=300):
+    # 샘플 저장 방식
+    STORAGE_VOLTS = 'volts'     # float32 전압
+    STORAGE_CODES = 'codes'     # uint16 원시 코드 + 레인지 구간 (읽을 때 변환)
+    STORAGE_MODES = (STORAGE_VOLTS, STORAGE_CODES)
+
+    def __init__(self, max_points=300, history_dir=None, storage=STORAGE_VOLTS,
+                 converter=None, range_ids=None):
         """
         Args:
-            max_points: 채널당 최대 저장 포인트 수
+            max_points: 최대 저장 스캔(행) 수
+            history_dir: 버퍼에서 밀려난 행을 저장할 디렉토리 (None이면 저장 안 함)
+            storage: 샘플 저장 방식 (STORAGE_VOLTS 또는 STORAGE_CODES)
+            converter: 코드 저장 시 사용할 CodeConverter (None이면 기본값)
+            range_ids: 초기 채널별 레인지 ID 리스트 (None이면 모두 0)
         """
+        if storage not in self.STORAGE_MODES:
+            raise ValueError(f"지원하지 않는 저장 방식: {storage}")
+
+        # 단일 쓰기/다중 읽기 동기화 (쓰기는 잠금, 읽기는 seqlock 버전 비교)
+        self._write_lock = threading.RLock()
+        self._write_depth = 0
+        self._version = 0
+
         self.max_points = max_points
-        self.channel_data = {i: {
-            'timestamps': deque(maxlen=max_points),
-            'voltages': deque(maxlen=max_points),
-            'enabled': False
-        } for i in range(8)}
+        self.storage = storage
+        self.timestamps = RingBuffer(max_points, np.float64)                  # epoch 초
+        if storage == self.STORAGE_CODES:
+            self.samples = CodeRingBuffer(max_points, self.NUM_CHANNELS, converter, range_ids)
+        else:
+            self.samples = RingBuffer(max_points, np.float32, self.NUM_CHANNELS, fill=np.nan)
+            # 전압 저장 방식도 내보내기용으로 (시작 행 번호, 채널별 레인지) 구간을 기록
+            ranges = tuple(range_ids) if range_ids is not None else (0,) * self.NUM_CHANNELS
+            self._range_segments = [(0, ranges)]
+        self.enabled = np.zeros(self.NUM_CHANNELS, dtype=bool)
+        self.stats = RunningStats(self.NUM_CHANNELS)
+        self.pyramid = DecimationPyramid(max_points, self.NUM_CHANNELS)
+
+        # 변경 추적: 행 시퀀스(write_seq, 누적 행 수)와 별도로 상태 변경 시퀀스
+        # (change_seq, 행 추가/채널 상태 변경/초기화마다 증가)와 채널별 마지막 변경 시퀀스
+        self._change_seq = 0
+        self.reset_seq = 0      # 마지막 초기화 시점의 행 시퀀스
+        self.channel_seq = np.zeros(self.NUM_CHANNELS, dtype=np.int64)
+
+        self.history = None
+        if history_dir:
+            self.enable_history(history_dir)
+
+        # 추가되는 모든 행을 받는 함수 (연속 기록 등, 버퍼 크기와 무관)
+        self.row_sink = None
+
+        # 수집 프로세스 모드 (공유 메모리 링 버퍼)
+        self.shared_ring = None
+        self.shared_to_volts = None
+        self.shared_seq = 0
+        self.dropped_samples = 0
+
+    def _append_rows(self, timestamps, samples, codes=None, ranges=None):
+        """
+        프레임 행 추가 (비활성 채널은 NaN 처리)
+
+        Args:
+            timestamps: (n,) epoch 초 배열
+            samples: (n, 8) 전압 배열
+            codes: (n, 8) 원시 코드 배열 (코드 저장 방식에서 있으면 그대로 저장)
+            ranges: 이 행들의 캡처 시점 채널별 레인지 (None이면 현재 구간 유지)
+        """
+        samples = np.array(samples, dtype=np.float32)
+        samples[:, ~self.enabled] = np.nan
+        if codes is not None and self.storage == self.STORAGE_CODES:
+            codes = np.array(codes, dtype=np.uint16)
+            codes[:, ~self.enabled] = MISSING_CODE
+        self._store_rows(timestamps, samples, codes, ranges)
+
+    @_writer
+    def _store_rows(self, timestamps, samples, codes=None, ranges=None):
+        """
+        링 버퍼에 행 기록 및 통계 갱신
+
+        밀려날 행은 덮어쓰기 전에 통계에서 먼저 제거한다.
+        코드 저장 방식에서는 통계/피라미드도 읽기 결과와 같은 값이 되도록
+        저장한 코드를 다시 변환한 전압을 사용한다.
+
+        Args:
+            timestamps: (n,) epoch 초 배열
+            samples: (n, 8) 전압 배열
+            codes: (n, 8) 원시 코드 배열 (코드 저장 방식, None이면 전압에서 계산)
+            ranges: 이 행들의 캡처 시점 채널별 레인지 (None이면 현재 구간 유지)
+        """
+        if ranges is not None:
+            self._set_ranges(ranges)
+
+        stored = samples
+        if self.storage == self.STORAGE_CODES:
+            stored = codes if codes is not None else self.samples.encode(samples)
+            samples = self.samples.decode(stored)
+
+        if self.row_sink is not None:
+            try:
+                self.row_sink(timestamps, samples)
+            except Exception as e:
+                logger.error(f"행 전달 실패: {e}")
+
+        n = len(samples)
+        start_seq = self.samples.total_written
+        evicted = len(self.samples) + n - self.max_points
+        if evicted > 0 and self.history is not None:
+            self._spill(timestamps, samples, evicted)
+
+        if n >= self.max_points:
+            self.stats.clear()
+        elif evicted > 0:
+            self.stats.remove_block(self.samples.oldest(evicted))
+
+        self.timestamps.extend(timestamps)
+        self.samples.extend(stored)
+        if self.storage == self.STORAGE_VOLTS:
+            expire_segments(self._range_segments, self.samples.total_written - len(self.samples))
+
+        kept = min(n, self.max_points)
+        self.stats.add_block(start_seq + n - kept, samples[n - kept:])
+        self.stats.expire(self.samples.total_written - len(self.samples))
+        self.pyramid.update(self.timestamps, self.samples)
+
+        written = ~np.isnan(samples[n - kept:]).all(axis=0)
+        self._change_seq += 1
+        self.channel_seq[written] = self._change_seq
+
+    @_writer
+    def set_row_sink(self, sink):
+        """
+        추가되는 모든 행을 받을 함수 설정 (예: ContinuousRecorder.submit)
+
+        버퍼에 넣기 전에 블록 단위로 호출하므로 한 번에 max_points보다 많은
+        행이 들어와도 빠짐없이 전달된다. sink(timestamps, samples)는 인자를
+        복사해야 한다 (비활성 채널은 NaN).
+
+        Args:
+            sink: sink(timestamps, samples) 함수 (None이면 해제)
+        """
+        self.row_sink = sink
+
+    def _spill(self, timestamps, samples, evicted):
+        """밀려날 행(기존 행 + 버퍼에 들어가지 못하는 새 행)을 히스토리에 저장"""
+        try:
+            old = min(evicted, len(self.samples))
+            if old > 0:
+                self.history.append(self.timestamps.oldest(old), self.samples.oldest(old))
+            if evicted > old:
+                self.history.append(np.asarray(timestamps)[:evicted - old], samples[:evicted - old])
+        except Exception as e:
+            logger.error(f"히스토리 저장 실패: {e}")
+
+    @_writer
+    def add_block(self, timestamps, samples, codes=None, ranges=None):
+        """
+        스캔 블록 추가 (n회 스캔 = n행, 복사 1회)
+
+        Args:
+            timestamps: (n,) epoch 초 배열 (오름차순)
+            samples: (n, 8) 전압 배열 (결측은 NaN, 비활성 채널은 NaN 처리)
+            codes: (n, 8) 원시 코드 배열 (코드 저장 방식에서 있으면 그대로 저장)
+            ranges: 캡처 시점 채널별 레인지, (8,) 블록 공통 또는 (n, 8) 행별
+                    (None이면 현재 구간 유지, NO_RANGE 항목은 현재 값 유지).
+                    레인지가 바뀐 행에서 블록을 나눠 레인지 구간을 기록한다.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        n = len(timestamps)
+        if n == 0:
+            return
+        if np.shape(samples) != (n, self.NUM_CHANNELS):
+            raise ValueError(f"블록 크기 불일치: timestamps {timestamps.shape}, samples {np.shape(samples)}")
+        if ranges is None:
+            self._append_rows(timestamps, samples, codes)
+            return
+
+        for lo, hi, row in range_runs(np.broadcast_to(ranges, (n, self.NUM_CHANNELS))):
+            self._append_rows(timestamps[lo:hi], samples[lo:hi],
+                              codes[lo:hi] if codes is not None else None, row)
 
     def add_data(self, channel, timestamp, voltage):
-        """데이터 추가"""
+        """
+        단일 채널 데이터 추가 (다른 채널은 NaN인 행)
+
+        Args:
+            channel: 채널 번호
+            timestamp: 측정 시각 (datetime 또는 epoch 초)
+            voltage: 전압 값
+        """
         if 0 <= channel <= 7:
-            self.channel_data[channel]['timestamps'].append(timestamp)
-            self.channel_data[channel]['voltages'].append(voltage)
+            row = np.full(self.NUM_CHANNELS, np.nan, dtype=np.float32)
+            row[channel] = voltage
+            self._store_rows([_to_epoch(timestamp)], row[np.newaxis])
 
     def add_batch_data(self, timestamp, channels_data):
         """
-        배치 데이터 추가
+        배치 데이터 추가 (스캔 1회 = 1행)
 
         Args:
-            timestamp: 측정 시간
+            timestamp: 측정 시간 (datetime 또는 epoch 초)
             channels_data: {channel: {'voltage': value, ...}, ...}
         """
+        row = np.full(self.NUM_CHANNELS, np.nan, dtype=np.float32)
+        has_data = False
         for ch, data in channels_data.items():
-            if self.channel_data[ch]['enabled']:
-                self.add_data(ch, timestamp, data['voltage'])
+            if self.enabled[ch]:
+                row[ch] = data['voltage']
+                has_data = True
+        if has_data:
+            self._store_rows([_to_epoch(timestamp)], row[np.newaxis])
+
+    @_writer
+    def set_channel_range(self, channel, range_id):
+        """
+        채널 레인지 변경 기록 (이후 행의 변환/내보내기 기준)
+
+        Args:
+            channel: 채널 번호
+            range_id: 레인지 ID
+        """
+        if 0 <= channel <= 7:
+            ranges = list(self.range_segments[-1][1])
+            ranges[channel] = range_id
+            self._set_ranges(ranges)
+
+    def _set_ranges(self, ranges):
+        """다음에 기록되는 행부터 적용할 채널별 레인지 기록 (쓰기 잠금 안에서 호출)"""
+        current = self.range_segments[-1][1]
+        ranges = [cur if r == NO_RANGE else int(r) for r, cur in zip(ranges, current)]
+        if self.storage == self.STORAGE_CODES:
+            self.samples.set_ranges(ranges)
+        else:
+            add_segment(self._range_segments, self.write_seq, ranges)
+
+    @property
+    def range_segments(self):
+        """버퍼 윈도우의 레인지 구간 [(시작 행 번호, 채널별 레인지), ...]"""
+        if self.storage == self.STORAGE_CODES:
+            return self.samples.segments
+        return self._range_segments
 
+    @_writer
     def enable_channel(self, channel, enabled=True):
         """채널 활성화/비활성화"""
-        if 0 <= channel <= 7:
-            self.channel_data[channel]['enabled'] = enabled
+        if 0 <= channel <= 7 and self.enabled[channel] != enabled:
+            self.enabled[channel] = enabled
+            self._touch([channel])
 
     def is_channel_enabled(self, channel):
         """채널 활성화 여부 확인"""
         if 0 <= channel <= 7:
-            return self.channel_data[channel]['enabled']
+            return bool(self.enabled[channel])
         return False
 
+    @_writer
     def clear_channel(self, channel):
-        """채널 데이터 초기화"""
+        """채널 데이터 초기화 (해당 열을 NaN으로)"""
         if 0 <= channel <= 7:
-            self.channel_data[channel]['timestamps'].clear()
-            self.channel_data[channel]['voltages'].clear()
+            self.samples.set_column(channel, np.nan)
+            self.stats.clear_channel(channel)
+            self.pyramid.clear_channel(channel)
+            self._mark_reset([channel])
 
+    @_writer
     def clear_all(self):
         """전체 데이터 초기화"""
-        for ch in range(8):
-            self.clear_channel(ch)
+        self.timestamps.clear()
+        self.samples.clear()
+        if self.storage == self.STORAGE_VOLTS:
+            self._range_segments = [(self.write_seq, self._range_segments[-1][1])]
+        self.stats.clear()
+        self.pyramid.clear()
+        self._mark_reset()
+
+    @property
+    def write_seq(self):
+        """행 시퀀스 (지금까지 추가된 전체 행 수, read_since 커서)"""
+        return self.samples.total_written
+
+    @property
+    def change_seq(self):
+        """상태 변경 시퀀스 (행 추가, 채널 상태 변경, 초기화마다 단조 증가)"""
+        return self._change_seq
+
+    def _mark_reset(self, channels=None):
+        """
+        기존 행이 바뀌는 변경(초기화/크기 조정) 기록
+
+        초기화 시점의 행 시퀀스를 reset_seq로 남겨 그 이전 시퀀스로
+        read_since()를 호출한 소비자에게 알리고, 채널 시퀀스를 갱신해
+        changed_channels() 소비자가 캐시를 다시 읽도록 한다.
+        """
+        self._change_seq += 1
+        self.reset_seq = self.write_seq
+        if channels is None:
+            self.channel_seq[:] = self._change_seq
+        else:
+            self.channel_seq[channels] = self._change_seq
+
+    def _touch(self, channels):
+        """기존 행은 그대로지만 채널 상태가 바뀐 경우 채널 시퀀스만 갱신 (행 시퀀스는 그대로)"""
+        self._change_seq += 1
+        self.channel_seq[channels] = self._change_seq
+
+    def changed_channels(self, seq):
+        """change_seq 기준 seq 이후 데이터나 상태가 바뀐 채널 리스트"""
+        return [int(ch) for ch in np.flatnonzero(self.channel_seq > seq)]
+
+    def read_since(self, seq, channels=None):
+        """
+        seq 이후 추가된 행 반환 (증분 소비용)
+
+        Args:
+            seq: 이전 호출에서 받은 'seq' (처음이면 0)
+            channels: None(전체), 채널 번호 또는 채널 리스트 (query와 같음)
+
+        Returns:
+            {'seq': 다음 호출에 넘길 시퀀스, 'timestamps', 'samples',
+             'dropped': 읽기 전에 버퍼에서 밀려나거나 초기화로 사라진 행 수,
+             'reset': seq 이후 초기화/크기 조정이 있었으면 True}
+            반환 행은 항상 seq 이후의 행 중 버퍼에 남아 있는 행이며,
+            메모리 버퍼 안의 행은 뷰로 반환한다.
+        """
+        current = self.write_seq
+        size = len(self.samples)
+        oldest = current - size
+
+        reset = seq < self.reset_seq
+        start = min(max(seq, oldest), current)
+        dropped = start - seq
+        count = current - start
+
+        samples = self.samples.slice(size - count, size)
+        if channels is not None:
+            samples = samples[:, channels]
+        return {
+            'seq': current,
+            'timestamps': self.timestamps.view()[size - count:],
+            'samples': samples,
+            'dropped': dropped,
+            'reset': reset
+        }
+
+    def get_frame(self):
+        """
+        프레임 전체 반환
+
+        Returns:
+            {'timestamps': (N,) epoch 초 뷰, 'samples': (N, 8) float32 뷰,
+             'enabled': (8,) bool 배열}
+            뷰는 다음 데이터 추가 전까지 유효하다.
+        """
+        return {
+            'timestamps': self.timestamps.view(),
+            'samples': self.samples.view(),
+            'enabled': self.enabled.copy()
+        }
 
     def get_channel_data(self, channel):
-        """채널 데이터 반환"""
+        """
+        채널 데이터 반환
+
+        Returns:
+            {'timestamps': 공유 epoch 초 뷰, 'voltages': 열 뷰 (결측은 NaN), 'enabled': bool}
+        """
+        if 0 <= channel <= 7:
+            return {
+                'timestamps': self.timestamps.view(),
+                'voltages': self.samples.view()[:, channel],
+                'enabled': bool(self.enabled[channel])
+            }
+        return None
+
+    def get_channel_view(self, channel, t0=None, t1=None, max_points=2000):
+        """
+        차트 표시용 채널 데이터 반환 (구간이 길면 min/max 피라미드로 축약)
+
+        Args:
+            channel: 채널 번호
+            t0, t1: 시간 구간 (epoch 초, None이면 끝까지)
+            max_points: 최대 점 수 (보통 플롯 폭(px) × 2)
+
+        Returns:
+            {'timestamps': epoch 초 배열, 'voltages': 배열, 'enabled': bool}
+        """
         if 0 <= channel <= 7:
+            timestamps, voltages = self.pyramid.get_view(
+                self.timestamps, self.samples, channel, t0, t1, max_points)
             return {
-                'timestamps': list(self.channel_data[channel]['timestamps']),
-                'voltages': list(self.channel_data[channel]['voltages']),
-                'enabled': self.channel_data[channel]['enabled']
+                'timestamps': timestamps,
+                'voltages': voltages,
+                'enabled': bool(self.enabled[channel])
             }
         return None
 
+    def get_all_views(self, t0=None, t1=None, max_points=2000):
+        """전체 채널 표시용 데이터 반환"""
+        return {ch: self.get_channel_view(ch, t0, t1, max_points) for ch in range(8)}
+
+    @_writer
+    def enable_history(self, directory, **kwargs):
+        """
+        디스크 히스토리 저장 활성화
+
+        Args:
+            directory: 세그먼트 저장 디렉토리
+            **kwargs: HistoryStore 옵션 (segment_seconds, max_bytes)
+
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            self.close_history()
+            self.history = HistoryStore(directory, self.NUM_CHANNELS, **kwargs)
+            logger.info(f"히스토리 저장 활성화: {directory}")
+            return True
+        except Exception as e:
+            logger.error(f"히스토리 저장 활성화 실패: {e}")
+            self.history = None
+            return False
+
+    @_writer
+    def close_history(self):
+        """디스크 히스토리 저장 종료"""
+        if self.history is not None:
+            self.history.close()
+            self.history = None
+
+    def get_range(self, t0=None, t1=None):
+        """
+        시간 구간 프레임 반환 (디스크 히스토리 + 메모리 버퍼)
+
+        Args:
+            t0, t1: 시간 구간 (epoch 초, None이면 끝까지)
+
+        Returns:
+            {'timestamps': (n,) epoch 초, 'samples': (n, 8) float32, 'enabled': (8,) bool}
+        """
+        result = self.query(None, t0, t1)
+        result['enabled'] = self.enabled.copy()
+        return result
+
+    def query(self, channels=None, t_start=None, t_end=None, step=None):
+        """
+        시간 구간 조회
+
+        타임스탬프 열이 단조 증가하므로 searchsorted로 구간 경계만 찾고,
+        메모리 버퍼 안의 구간은 복사 없이 뷰로 반환한다.
+        버퍼 이전 구간은 디스크 히스토리에서 읽어 이어 붙인다 (복사본).
+
+        Args:
+            channels: None(전체), 채널 번호(1차원 열 뷰) 또는 채널 리스트(복사본)
+            t_start, t_end: 시간 구간 (epoch 초, None이면 끝까지, 양끝 포함)
+            step: 재샘플 간격 (초, None이면 원본). 구간별 평균 (결측 제외)
+
+        Returns:
+            {'timestamps': (n,) epoch 초, 'samples': (n,) 또는 (n, k) 배열}
+            뷰는 다음 데이터 추가 전까지 유효하다.
+        """
+        ts = self.timestamps.view()
+        i0 = 0 if t_start is None else int(np.searchsorted(ts, t_start, side='left'))
+        i1 = len(ts) if t_end is None else int(np.searchsorted(ts, t_end, side='right'))
+        timestamps = ts[i0:i1]
+        samples = self.samples.slice(i0, i1)
+
+        # 버퍼 이전 구간은 디스크에서 읽는다
+        if self.history is not None and (len(ts) == 0 or t_start is None or t_start < ts[0]):
+            h_end = t_end
+            if len(ts) and (t_end is None or t_end >= ts[0]):
+                h_end = np.nextafter(ts[0], -np.inf)
+            h_ts, h_samples = self.history.read(t_start, h_end)
+            if len(h_ts):
+                timestamps = np.concatenate([h_ts, timestamps])
+                samples = np.concatenate([h_samples, samples])
+
+        if channels is not None:
+            samples = samples[:, channels]
+
+        if step is not None and len(timestamps):
+            timestamps, samples = _resample(timestamps, samples, step,
+                                            timestamps[0] if t_start is None else t_start)
+
+        return {
+            'timestamps': timestamps,
+            'samples': samples
+        }
+
+    def _read_consistent(self, read):
+        """
+        잠금 없이 일관된 읽기 (seqlock)
+
+        읽기 전후 버전이 같고 짝수일 때만 결과를 반환하고, 그 사이에
+        쓰기가 있었으면 다시 읽는다. read는 결과를 복사해 반환해야 한다.
+        """
+        while True:
+            version = self._version
+            if version & 1:
+                time.sleep(0)
+                continue
+            try:
+                result = read()
+            except Exception:
+                # 크기 조정 등과 겹친 읽기는 다시 시도
+                if self._version != version:
+                    continue
+                raise
+            if self._version == version:
+                return result
+
+    def snapshot(self, channels=None, t_start=None, t_end=None):
+        """
+        다른 스레드에서 사용할 수 있는 일관된 프레임 복사본
+
+        Args:
+            channels, t_start, t_end: query()와 같음
+
+        Returns:
+            {'seq', 'timestamps', 'samples', 'enabled',
+             'ranges': [(시작 행 인덱스, 채널별 레인지), ...] 행 구간별 레인지
+                       (버퍼 이전 히스토리 행은 가장 오래된 구간 레인지),
+             'codes': 코드 저장 방식이고 모든 행이 버퍼 안이면 원시 코드, 아니면 None}
+            (모두 복사본)
+        """
+        def read():
+            result = self.query(channels, t_start, t_end)
+            ts = self.timestamps.view()
+            i0 = 0 if t_start is None else int(np.searchsorted(ts, t_start, side='left'))
+            i1 = len(ts) if t_end is None else int(np.searchsorted(ts, t_end, side='right'))
+            count = max(i1 - i0, 0)
+            history_rows = len(result['timestamps']) - count
+
+            runs = segment_runs(self.range_segments, self.write_seq - len(ts) + i0, count)
+            ranges = [(lo + history_rows, r) for lo, _, r in runs] or [(0, self.range_segments[-1][1])]
+            ranges[0] = (0, ranges[0][1])
+
+            codes = None
+            if self.storage == self.STORAGE_CODES and history_rows == 0:
+                codes = self.samples.codes.slice(i0, i1)
+                codes = np.array(codes if channels is None else codes[:, channels])
+            return {
+                'seq': self.write_seq,
+                'timestamps': np.array(result['timestamps']),
+                'samples': np.array(result['samples']),
+                'enabled': self.enabled.copy(),
+                'ranges': ranges,
+                'codes': codes
+            }
+        return self._read_consistent(read)
+
+    def get_running_statistics(self, channel):
+        """
+        버퍼 윈도우의 채널 통계 반환 (수집 시 증분 갱신, O(1) 조회)
+
+        Returns:
+            {'rms', 'max', 'min', 'avg', 'pp', 'std', 'count'} 딕셔너리
+            (데이터가 없으면 None)
+        """
+        if 0 <= channel <= 7:
+            return self._read_consistent(lambda: self.stats.get(channel))
+        return None
+
     def get_all_data(self):
         """전체 데이터 반환"""
         return {ch: self.get_channel_data(ch) for ch in range(8)}
 
     def get_enabled_channels(self):
         """활성화된 채널 리스트 반환"""
-        return [ch for ch in range(8) if self.channel_data[ch]['enabled']]
+        return [int(ch) for ch in np.flatnonzero(self.enabled.copy())]
 
+    @_writer
     def resize_buffer(self, max_points):
         """버퍼 크기 조정"""
+        dropped = len(self.samples) - max_points
+        if dropped > 0 and self.history is not None:
+            self._spill(None, None, dropped)
+
         self.max_points = max_points
-        for ch in range(8):
-            old_ts = list(self.channel_data[ch]['timestamps'])
-            old_v = list(self.channel_data[ch]['voltages'])
+        self.timestamps = self.timestamps.resized(max_points)
+        self.samples = self.samples.resized(max_points)
+        if self.storage == self.STORAGE_VOLTS:
+            expire_segments(self._range_segments, self.samples.total_written - len(self.samples))
+
+        # 남은 윈도우로 통계 재구성
+        self.stats.clear()
+        self.stats.add_block(self.samples.total_written - len(self.samples), self.samples.view())
+        self.pyramid = DecimationPyramid(max_points, self.NUM_CHANNELS)
+        self.pyramid.rebuild(self.timestamps, self.samples)
+        self._mark_reset()
+
+    @_writer
+    def attach_shared_buffer(self, ring, to_volts):
+        """
+        공유 메모리 링 버퍼 연결 (수집 프로세스 모드)
+
+        Args:
+            ring: SharedRingBuffer 객체 (None이면 연결 해제)
+            to_volts: to_volts(codes, ranges) (n, 8) 코드 배열과 행별 캡처 시점
+                      레인지 → 전압 배열 변환 함수
+        """
+        self.shared_ring = ring
+        self.shared_to_volts = to_volts
+        self.shared_seq = ring.write_seq if ring is not None else 0
+        self.dropped_samples = 0
+
+    def poll_shared_buffer(self):
+        """
+        링 버퍼에 새로 기록된 스캔을 버퍼에 추가
+
+        링 버퍼 뷰를 복사 없이 변환 함수에 넘기고, 변환이 끝난 뒤
+        시퀀스 카운터로 읽는 도중 덮어쓰인 행을 검출해 버린다.
+
+        Returns:
+            {channel: 최신 전압} (새 데이터가 없으면 빈 딕셔너리)
+        """
+        if self.shared_ring is None:
+            return {}
+
+        read = self.shared_ring.read_since(self.shared_seq)
+        self.shared_seq = read['seq']
+        n = len(read['timestamps'])
+
+        lost = read['dropped']
+        if n > 0:
+            volts = self.shared_to_volts(read['codes'], read['ranges'])
+            timestamps = read['timestamps'].copy()
+            ranges = read['ranges'].copy()
+            codes = read['codes'].copy() if self.storage == self.STORAGE_CODES else None
+            overrun = self.shared_ring.overrun(read['start'], n)
+            lost += overrun
+        if lost:
+            self.dropped_samples += lost
+            logger.warning(f"링 버퍼 오버런: {lost}개 스캔 손실 (누적 {self.dropped_samples})")
+        if n == 0 or overrun >= n:
+            return {}
+
+        volts = volts[overrun:]
+        self.add_block(timestamps[overrun:], volts,
+                       codes[overrun:] if codes is not None else None, ranges[overrun:])
 
-            self.channel_data[ch]['timestamps'] = deque(old_ts, maxlen=max_points)
-            self.channel_data[ch]['voltages'] = deque(old_v, maxlen=max_points)
+        return {ch: v for ch, v in enumerate(volts[-1].tolist()) if v == v}
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Decimation Module
+다해상도 min/max/mean 피라미드 (장시간 차트 표시용)
+"""
+
+import numpy as np
+import logging
+
+from data.ring_buffer import RingBuffer
+
+logger = logging.getLogger(__name__)
+
+
+class _Tier:
+    """
+    피라미드 한 단계 (버킷 1개 = 하위 단계 factor개 행)
+
+    버킷마다 시작/끝 시각과 채널별 최소/최대/평균/유효 개수,
+    최소값이 최대값보다 먼저 나왔는지(min_first)를 저장한다.
+    """
+
+    def __init__(self, capacity, num_channels):
+        self.start = RingBuffer(capacity, np.float64)
+        self.end = RingBuffer(capacity, np.float64)
+        self.mins = RingBuffer(capacity, np.float32, num_channels, fill=np.nan)
+        self.maxs = RingBuffer(capacity, np.float32, num_channels, fill=np.nan)
+        self.means = RingBuffer(capacity, np.float32, num_channels, fill=np.nan)
+        self.counts = RingBuffer(capacity, np.int32, num_channels)
+        self.min_first = RingBuffer(capacity, bool, num_channels)
+        self.consumed = 0   # 집계에 사용한 하위 단계 행 수 (전역 번호)
+
+    @property
+    def total_written(self):
+        return self.start.total_written
+
+    def __len__(self):
+        return len(self.start)
+
+    def columns(self):
+        """(start, end, mins, maxs, means, counts, min_first) 뷰"""
+        return (self.start.view(), self.end.view(), self.mins.view(), self.maxs.view(),
+                self.means.view(), self.counts.view(), self.min_first.view())
+
+    def extend(self, start, end, mins, maxs, means, counts, min_first):
+        self.start.extend(start)
+        self.end.extend(end)
+        self.mins.extend(mins)
+        self.maxs.extend(maxs)
+        self.means.extend(means)
+        self.counts.extend(counts)
+        self.min_first.extend(min_first)
+
+    def set_column(self, column, value):
+        self.mins.set_column(column, value)
+        self.maxs.set_column(column, value)
+        self.means.set_column(column, value)
+        self.counts.set_column(column, 0)
+
+    def clear(self):
+        for buf in (self.start, self.end, self.mins, self.maxs,
+                    self.means, self.counts, self.min_first):
+            buf.clear()
+        self.consumed = 0
+
+
+class DecimationPyramid:
+    """
+    다해상도 min/max/mean 피라미드 클래스
+
+    단계 L의 버킷은 원시 행 factor**L개를 요약하며, 하위 단계에서 버킷이
+    가득 찰 때마다 증분으로 집계한다. 조회 시 요청 구간의 버킷 수가
+    max_points/2 이하가 되는 가장 세밀한 단계를 골라 버킷마다 최소/최대
+    두 점을 발생 순서대로 내보내므로 피크를 잃지 않고 점 수가 제한된다.
+    """
+
+    def __init__(self, capacity, num_channels=8, factor=4):
+        """
+        Args:
+            capacity: 원시 버퍼 용량 (행 수)
+            num_channels: 채널 수
+            factor: 단계 간 축소 비율
+        """
+        self.capacity = capacity
+        self.num_channels = num_channels
+        self.factor = factor
+        self.tiers = []
+
+        size = capacity // factor
+        while size >= 2:
+            self.tiers.append(_Tier(size + 1, num_channels))
+            size //= factor
+
+    def clear(self):
+        """전체 초기화"""
+        for tier in self.tiers:
+            tier.clear()
+
+    def clear_channel(self, channel):
+        """채널 요약값 초기화"""
+        for tier in self.tiers:
+            tier.set_column(channel, np.nan)
+
+    def rebuild(self, timestamps, samples):
+        """원시 버퍼 전체로 피라미드 재구성"""
+        self.clear()
+        self.update(timestamps, samples)
+
+    def update(self, timestamps, samples):
+        """
+        원시 버퍼에 새로 기록된 행을 상위 단계로 집계
+
+        Args:
+            timestamps: 원시 타임스탬프 RingBuffer
+            samples: 원시 샘플 RingBuffer
+        """
+        if not self.tiers:
+            return
+        total = samples.total_written
+        n = min(total - self.tiers[0].consumed, len(samples))
+        if n < self.factor:
+            return
+
+        # 아직 집계되지 않은 최근 행만 사용
+        ts = timestamps.tail(n)
+        values = samples.tail(n)
+        source = (ts, ts, values, values, values, ~np.isnan(values),
+                  np.ones(values.shape, dtype=bool))
+
+        for tier in self.tiers:
+            if not self._aggregate(tier, source, total):
+                break
+            source = tier.columns()
+            total = tier.total_written
+
+    def _aggregate(self, tier, source, total):
+        """
+        하위 단계의 완성된 버킷을 tier에 추가
+
+        Returns:
+            bool: 새 버킷 추가 여부
+        """
+        f = self.factor
+        available = len(source[0])
+        pending = total - tier.consumed
+        if pending > available:
+            # 집계 전에 하위 단계에서 밀려난 행은 건너뛰고 경계 재정렬
+            tier.consumed = total - available
+            tier.consumed += (-tier.consumed) % f
+            pending = total - tier.consumed
+
+        n_buckets = pending // f
+        if n_buckets <= 0:
+            return False
+
+        first = available - pending
+        last = first + n_buckets * f
+        start, end, mins, maxs, means, counts, min_first = (
+            col[first:last] for col in source)
+        tier.consumed += n_buckets * f
+
+        shape = (n_buckets, f, self.num_channels)
+        mins = mins.reshape(shape)
+        maxs = maxs.reshape(shape)
+        counts = counts.reshape(shape).astype(np.int32)
+
+        k_min = np.where(np.isnan(mins), np.inf, mins).argmin(axis=1)
+        k_max = np.where(np.isnan(maxs), -np.inf, maxs).argmax(axis=1)
+        bucket_min = np.take_along_axis(mins, k_min[:, np.newaxis], axis=1)[:, 0]
+        bucket_max = np.take_along_axis(maxs, k_max[:, np.newaxis], axis=1)[:, 0]
+        child_first = np.take_along_axis(min_first.reshape(shape), k_min[:, np.newaxis], axis=1)[:, 0]
+        bucket_first = np.where(k_min == k_max, child_first, k_min < k_max)
+
+        bucket_count = counts.sum(axis=1)
+        weighted = np.where(counts > 0, means.reshape(shape), 0.0) * counts
+        with np.errstate(invalid='ignore', divide='ignore'):
+            bucket_mean = weighted.sum(axis=1) / bucket_count
+
+        tier.extend(start.reshape(n_buckets, f)[:, 0], end.reshape(n_buckets, f)[:, -1],
+                    bucket_min, bucket_max, bucket_mean, bucket_count, bucket_first)
+        return True
+
+    def get_view(self, timestamps, samples, channel, t0=None, t1=None, max_points=2000):
+        """
+        채널 표시용 데이터 반환 (최대 약 max_points개 점)
+
+        Args:
+            timestamps: 원시 타임스탬프 RingBuffer
+            samples: 원시 샘플 RingBuffer
+            channel: 채널 번호
+            t0, t1: 시간 구간 (epoch 초, None이면 끝까지)
+            max_points: 최대 점 수
+
+        Returns:
+            (timestamps, voltages) 배열 튜플
+        """
+        ts = timestamps.view()
+        i0 = 0 if t0 is None else int(np.searchsorted(ts, t0, side='left'))
+        i1 = len(ts) if t1 is None else int(np.searchsorted(ts, t1, side='right'))
+        if i1 - i0 <= max_points or not self.tiers:
+            return ts[i0:i1], samples.slice(i0, i1)[:, channel]
+
+        # 원시 버퍼에서 밀려난 행이 섞인 버킷은 제외하고, 버퍼에 남은 앞부분과
+        # 미집계 최신 구간은 하위 단계로 채워 점 수 제한을 만족하는 가장 세밀한
+        # 단계 (없으면 가장 거친 단계 후 축약)
+        tiers = [tier for tier in self.tiers if len(tier) > 0]
+        if not tiers:
+            return ts[i0:i1], samples.slice(i0, i1)[:, channel]
+        lo = ts[i0]
+        for tier in tiers:
+            level = self.tiers.index(tier)
+            start, end = tier.start.view(), tier.end.view()
+            b0 = int(np.searchsorted(start, ts[0], side='left'))
+            if t0 is not None:
+                b0 = max(b0, int(np.searchsorted(end, t0, side='left')))
+            b1 = len(start) if t1 is None else int(np.searchsorted(start, t1, side='right'))
+            if 2 * (b1 - b0) > max_points:
+                continue
+            x, y = self._cover(timestamps, samples, channel, level, b0, b1, lo, t1)
+            if len(x) <= max_points:
+                return x, y
+
+        x, y = self._cover(timestamps, samples, channel, level, b0, b1, lo, t1)
+        return self._clamp(x, y, max_points)
+
+    def _cover(self, timestamps, samples, channel, level, b0, b1, lo, hi):
+        """
+        level 단계 버킷 [b0, b1)에 앞뒤 남은 구간(하위 단계)을 이어 붙인 점 배열
+
+        Args:
+            level: 단계 번호 (self.tiers 인덱스)
+            b0, b1: 사용할 버킷 범위
+            lo: 구간 시작 시각 (포함)
+            hi: 구간 끝 시각 (포함, None이면 끝까지)
+        """
+        if b1 <= b0:
+            return self._fill(timestamps, samples, channel, level, lo, True, hi)
+        tier = self.tiers[level]
+        x, y = self._envelope(tier, channel, b0, b1)
+        head_x, head_y = self._fill(timestamps, samples, channel, level, lo, True,
+                                    tier.start.view()[b0], False)
+        tail_x, tail_y = self._fill(timestamps, samples, channel, level,
+                                    tier.end.view()[b1 - 1], False, hi)
+        return np.concatenate([head_x, x, tail_x]), np.concatenate([head_y, y, tail_y])
+
+    def _fill(self, timestamps, samples, channel, level, lo, lo_inclusive, hi, hi_inclusive=True):
+        """
+        level 단계 아래에서 [lo, hi] 구간을 채우는 점 배열
+
+        구간에 완전히 들어가는 바로 아래 단계 버킷을 쓰고, 그 앞뒤 나머지는
+        다시 아래 단계(최종적으로 원시 행)에서 채운다.
+        """
+        ts = timestamps.view()
+        i0 = int(np.searchsorted(ts, lo, side='left' if lo_inclusive else 'right'))
+        i1 = len(ts) if hi is None else int(
+            np.searchsorted(ts, hi, side='right' if hi_inclusive else 'left'))
+        if i1 <= i0:
+            return np.empty(0), np.empty(0, dtype=np.float32)
+        if level == 0:
+            return ts[i0:i1], samples.slice(i0, i1)[:, channel]
+
+        lower = self.tiers[level - 1]
+        start, end = lower.start.view(), lower.end.view()
+        b0 = int(np.searchsorted(start, lo, side='left' if lo_inclusive else 'right'))
+        b1 = len(end) if hi is None else int(
+            np.searchsorted(end, hi, side='right' if hi_inclusive else 'left'))
+        if b1 <= b0:
+            return self._fill(timestamps, samples, channel, level - 1,
+                              lo, lo_inclusive, hi, hi_inclusive)
+        x, y = self._envelope(lower, channel, b0, b1)
+        head_x, head_y = self._fill(timestamps, samples, channel, level - 1,
+                                    lo, lo_inclusive, start[b0], False)
+        tail_x, tail_y = self._fill(timestamps, samples, channel, level - 1,
+                                    end[b1 - 1], False, hi, hi_inclusive)
+        return np.concatenate([head_x, x, tail_x]), np.concatenate([head_y, y, tail_y])
+
+    @staticmethod
+    def _clamp(x, y, max_points):
+        """
+        점 배열을 max_points개 이하로 축약 (구간마다 최소/최대 두 점, 발생 순서)
+
+        가장 거친 단계로도 제한을 넘을 때만 사용한다. 전체 최소/최대 점은
+        항상 남긴다.
+        """
+        if len(x) <= max_points:
+            return x, y
+        if np.isnan(y).all():
+            keep = np.linspace(0, len(x) - 1, max_points).astype(np.int64)
+            return x[keep], y[keep]
+        extremes = sorted({int(np.nanargmin(y)), int(np.nanargmax(y))})
+        if max_points <= len(extremes):
+            keep = np.asarray(extremes[-max_points:])
+            return x[keep], y[keep]
+
+        groups = max(max_points // 2, 1)
+        bounds = np.linspace(0, len(x), groups + 1).astype(np.int64)
+        keep = set(extremes)
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            part = y[lo:hi]
+            if np.isnan(part).all():
+                keep.add(int(lo))
+                continue
+            keep.update((lo + int(np.nanargmin(part)), lo + int(np.nanargmax(part))))
+        keep = np.asarray(sorted(keep), dtype=np.int64)
+        return x[keep], y[keep]
+
+    @staticmethod
+    def _envelope(tier, channel, b0, b1):
+        """버킷 구간 → (시각, 값) 점 배열 (버킷마다 2점, 발생 순서)"""
+        if b1 <= b0:
+            return np.empty(0), np.empty(0, dtype=np.float32)
+        mins = tier.mins.view()[b0:b1, channel]
+        maxs = tier.maxs.view()[b0:b1, channel]
+        first = tier.min_first.view()[b0:b1, channel]
+        x = np.column_stack([tier.start.view()[b0:b1], tier.end.view()[b0:b1]]).ravel()
+        y = np.column_stack([np.where(first, mins, maxs), np.where(first, maxs, mins)]).ravel()
+        return x, y
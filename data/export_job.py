@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Export Job Module
+백그라운드 내보내기 작업 (진행률 보고, 취소)
+"""
+
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ExportJob:
+    """
+    백그라운드 내보내기 작업 클래스
+
+    DataExporter의 내보내기 함수를 별도 스레드에서 실행한다. 프레임은
+    DataManager.snapshot() 복사본을 넘기므로 수집이 계속되어도 내용이
+    바뀌지 않는다. GUI 스레드는 progress/result를 폴링해 상태를 표시하고
+    cancel()로 중단을 요청한다.
+    """
+
+    def __init__(self, export_func, filename, frame, **kwargs):
+        """
+        Args:
+            export_func: progress/cancel 키워드를 받는 내보내기 함수
+                         (예: DataExporter.export_to_csv)
+            filename: 저장할 파일명
+            frame: 내보낼 프레임 (snapshot() 복사본)
+            **kwargs: export_func에 그대로 넘길 추가 인자
+        """
+        self.export_func = export_func
+        self.filename = filename
+        self.frame = frame
+        self.kwargs = kwargs
+
+        self.progress = 0.0
+        self.result = None  # 완료 후 True/False
+        self.elapsed = 0.0
+        self._cancel = threading.Event()
+        self._thread = None
+
+    @property
+    def is_running(self):
+        """작업 스레드 동작 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def is_cancelled(self):
+        """취소 요청 여부"""
+        return self._cancel.is_set()
+
+    def start(self):
+        """작업 시작"""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self, wait=False):
+        """
+        취소 요청 (현재 청크 기록 후 중단, 불완전한 파일은 삭제)
+
+        Args:
+            wait: 작업 스레드 종료까지 대기 여부
+        """
+        self._cancel.set()
+        if wait and self._thread is not None:
+            self._thread.join()
+
+    def _set_progress(self, fraction):
+        self.progress = fraction
+
+    def _run(self):
+        """작업 스레드 본체"""
+        started = time.monotonic()
+        try:
+            self.result = bool(self.export_func(
+                self.filename, self.frame,
+                progress=self._set_progress, cancel=self._cancel, **self.kwargs
+            ))
+        except Exception as e:
+            logger.error(f"내보내기 작업 실패: {e}")
+            self.result = False
+        finally:
+            self.frame = None
+            self.elapsed = time.monotonic() - started
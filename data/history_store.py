@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+History Store Module
+디스크 기반 장기 데이터 저장 (시간 구간별 세그먼트, mmap 읽기)
+"""
+
+import os
+import glob
+import time
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def record_dtype(num_channels=8):
+    """고정 폭 레코드 타입 (epoch 초 + 채널별 전압)"""
+    return np.dtype([('t', '<f8'), ('v', '<f4', (num_channels,))])
+
+
+class _Segment:
+    """세그먼트 파일 하나 (레코드 append, np.memmap 읽기)"""
+
+    def __init__(self, path, dtype):
+        self.path = path
+        self.dtype = dtype
+        self.count = 0
+        if os.path.exists(path):
+            size = os.path.getsize(path)
+            self.count = size // dtype.itemsize
+            if size % dtype.itemsize:
+                # 비정상 종료로 잘린 마지막 레코드 제거
+                os.truncate(path, self.count * dtype.itemsize)
+        self.first_t = None
+        self.last_t = None
+        self._map = None
+        self._map_count = 0
+        if self.count:
+            records = self.records()
+            self.first_t = float(records['t'][0])
+            self.last_t = float(records['t'][-1])
+
+    def records(self):
+        """전체 레코드의 읽기 전용 memmap (필요한 페이지만 읽힌다)"""
+        if self.count == 0:
+            return np.empty(0, dtype=self.dtype)
+        if self._map is None or self._map_count != self.count:
+            self._map = np.memmap(self.path, dtype=self.dtype, mode='r', shape=(self.count,))
+            self._map_count = self.count
+        return self._map
+
+    def release(self):
+        """memmap 해제"""
+        self._map = None
+        self._map_count = 0
+
+
+class HistoryStore:
+    """
+    append 전용 장기 저장소 클래스
+
+    레코드는 고정 폭(epoch 초 f8 + 채널 f4 × N)으로 세그먼트 파일에 이어 쓰고,
+    세그먼트는 segment_seconds 단위 시간 구간마다 새 파일로 나눈다.
+    읽기는 np.memmap과 타임스탬프 이진 탐색으로 필요한 구간만 접근하므로
+    파일 전체를 메모리에 올리지 않는다.
+    """
+
+    FILE_PREFIX = "history_"
+    FILE_EXT = ".hist"
+
+    def __init__(self, directory, num_channels=8, segment_seconds=3600, max_bytes=None):
+        """
+        Args:
+            directory: 세그먼트 저장 디렉토리
+            num_channels: 채널 수
+            segment_seconds: 세그먼트 시간 길이 (초)
+            max_bytes: 전체 용량 제한 (초과 시 오래된 세그먼트 삭제, None이면 제한 없음)
+        """
+        self.directory = directory
+        self.num_channels = num_channels
+        self.segment_seconds = segment_seconds
+        self.max_bytes = max_bytes
+        self.dtype = record_dtype(num_channels)
+
+        os.makedirs(directory, exist_ok=True)
+        self.segments = []
+        self._file = None
+        self._file_key = None
+        self._load_segments()
+
+    def _load_segments(self):
+        """기존 세그먼트 파일 목록 로드"""
+        pattern = os.path.join(self.directory, f"{self.FILE_PREFIX}*{self.FILE_EXT}")
+        for path in sorted(glob.glob(pattern)):
+            segment = _Segment(path, self.dtype)
+            if segment.count:
+                self.segments.append(segment)
+        if self.segments:
+            logger.info(f"히스토리 세그먼트 {len(self.segments)}개 로드: {self.directory}")
+
+    def _segment_key(self, timestamp):
+        """타임스탬프가 속하는 세그먼트 구간 번호"""
+        return int(timestamp // self.segment_seconds)
+
+    def _open_segment(self, key):
+        """구간 번호에 해당하는 세그먼트를 쓰기용으로 연다"""
+        if self._file is not None:
+            self._file.close()
+
+        start = key * self.segment_seconds
+        name = time.strftime('%Y%m%d_%H%M%S', time.gmtime(start))
+        path = os.path.join(self.directory, f"{self.FILE_PREFIX}{name}{self.FILE_EXT}")
+
+        if self.segments and self.segments[-1].path == path:
+            segment = self.segments[-1]
+        else:
+            segment = _Segment(path, self.dtype)
+            self.segments = [seg for seg in self.segments if seg.path != path]
+            self.segments.append(segment)
+
+        self._file = open(path, 'ab')
+        self._file_key = key
+        return segment
+
+    def append(self, timestamps, samples):
+        """
+        레코드 추가 (타임스탬프 오름차순)
+
+        Args:
+            timestamps: (n,) epoch 초 배열
+            samples: (n, num_channels) 전압 배열
+        """
+        n = len(timestamps)
+        if n == 0:
+            return
+
+        records = np.empty(n, dtype=self.dtype)
+        records['t'] = timestamps
+        records['v'] = samples
+
+        # 세그먼트 경계에서 분할
+        keys = (records['t'] // self.segment_seconds).astype(np.int64)
+        bounds = np.flatnonzero(np.diff(keys)) + 1
+        for chunk in np.split(records, bounds):
+            key = self._segment_key(chunk['t'][0])
+            if self._file is None or key != self._file_key:
+                segment = self._open_segment(key)
+            else:
+                segment = self.segments[-1]
+
+            self._file.write(chunk.tobytes())
+            self._file.flush()
+            if segment.count == 0:
+                segment.first_t = float(chunk['t'][0])
+            segment.count += len(chunk)
+            segment.last_t = float(chunk['t'][-1])
+
+        self._enforce_limit()
+
+    def _enforce_limit(self):
+        """용량 제한 초과 시 가장 오래된 세그먼트 삭제 (쓰기 중인 세그먼트 제외)"""
+        if self.max_bytes is None:
+            return
+        total = sum(seg.count for seg in self.segments) * self.dtype.itemsize
+        while total > self.max_bytes and len(self.segments) > 1:
+            segment = self.segments.pop(0)
+            total -= segment.count * self.dtype.itemsize
+            segment.release()
+            try:
+                os.remove(segment.path)
+                logger.info(f"히스토리 세그먼트 삭제: {segment.path}")
+            except OSError as e:
+                logger.error(f"히스토리 세그먼트 삭제 실패: {e}")
+
+    @property
+    def time_range(self):
+        """(가장 오래된 시각, 가장 최근 시각) 또는 None"""
+        if not self.segments:
+            return None
+        return self.segments[0].first_t, self.segments[-1].last_t
+
+    def read(self, t0=None, t1=None, channels=None):
+        """
+        시간 구간 레코드 읽기
+
+        Args:
+            t0, t1: 시간 구간 (epoch 초, None이면 끝까지)
+            channels: 읽을 채널 리스트 (None이면 전체)
+
+        Returns:
+            (timestamps (n,) float64, samples (n, k) float32) 튜플
+        """
+        ts_parts, value_parts = [], []
+        for segment in self.segments:
+            if segment.count == 0:
+                continue
+            if t0 is not None and segment.last_t < t0:
+                continue
+            if t1 is not None and segment.first_t > t1:
+                break
+
+            records = segment.records()
+            times = records['t']
+            i0 = 0 if t0 is None else int(np.searchsorted(times, t0, side='left'))
+            i1 = segment.count if t1 is None else int(np.searchsorted(times, t1, side='right'))
+            if i1 <= i0:
+                continue
+
+            values = records['v'][i0:i1]
+            ts_parts.append(np.array(times[i0:i1]))
+            value_parts.append(np.array(values if channels is None else values[:, channels]))
+
+        width = self.num_channels if channels is None else len(channels)
+        if not ts_parts:
+            return np.empty(0), np.empty((0, width), dtype=np.float32)
+        return np.concatenate(ts_parts), np.concatenate(value_parts)
+
+    def close(self):
+        """쓰기 파일 닫기"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._file_key = None
+        for segment in self.segments:
+            segment.release()
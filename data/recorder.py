@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Recorder Module
+연속 CSV 기록 (별도 스레드, 파일 분할, 주기적 fsync)
+"""
+
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+import numpy as np
+import logging
+
+from data.data_export import format_csv_block, CSV_LINE_END
+
+logger = logging.getLogger(__name__)
+
+
+class ContinuousRecorder:
+    """
+    연속 기록 클래스
+
+    수집된 스캔 블록을 submit()으로 받아 기록 스레드에서 버퍼링된 CSV 파일에
+    이어 쓴다. 파일 크기나 경과 시간이 한도를 넘으면 새 파일로 분할하고,
+    fsync_interval마다 디스크에 동기화하므로 장시간 무인 기록에서도
+    메모리 사용량이 늘지 않고 전원 차단 시 손실이 제한된다.
+    """
+
+    FILE_PREFIX = "record_"
+
+    def __init__(self, directory, channels, rotate_bytes=100 * 1024 * 1024,
+                 rotate_seconds=3600, fsync_interval=5.0, buffer_size=1024 * 1024):
+        """
+        Args:
+            directory: 기록 디렉토리
+            channels: 기록할 채널 리스트
+            rotate_bytes: 파일 분할 크기 (바이트, None이면 크기 기준 분할 안 함)
+            rotate_seconds: 파일 분할 시간 (초, None이면 시간 기준 분할 안 함)
+            fsync_interval: fsync 주기 (초)
+            buffer_size: 파일 쓰기 버퍼 크기 (바이트)
+        """
+        self.directory = directory
+        self.channels = sorted(channels)
+        self.rotate_bytes = rotate_bytes
+        self.rotate_seconds = rotate_seconds
+        self.fsync_interval = fsync_interval
+        self.buffer_size = buffer_size
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._file = None
+        self._opened_at = 0.0
+        self._last_sync = 0.0
+
+        self.files = []
+        self.rows_written = 0
+        self.error = None
+
+    @property
+    def is_recording(self):
+        """기록 스레드 동작 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """
+        기록 시작
+
+        Returns:
+            bool: 성공 여부
+        """
+        if self.is_recording:
+            return True
+        if not self.channels:
+            logger.warning("기록할 채널이 없습니다")
+            return False
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._open_file()
+        except Exception as e:
+            logger.error(f"기록 시작 실패: {e}")
+            return False
+
+        self.error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        logger.info(f"연속 기록 시작: {self.directory} (CH{self.channels})")
+        return True
+
+    def submit(self, timestamps, samples):
+        """
+        스캔 블록 기록 요청 (호출 스레드에서 복사 후 큐에 넣음)
+
+        Args:
+            timestamps: (n,) epoch 초 배열
+            samples: (n, 8) 전압 배열 (결측은 NaN)
+        """
+        if self.is_recording and len(timestamps):
+            self._queue.put((np.array(timestamps, dtype=np.float64),
+                             np.array(samples[:, self.channels], dtype=np.float32)))
+
+    def stop(self):
+        """기록 종료 (대기 중인 블록은 모두 기록)"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        logger.info(f"연속 기록 종료: {self.rows_written}행, 파일 {len(self.files)}개")
+
+    def _open_file(self):
+        """새 기록 파일 열기"""
+        self._close_file()
+
+        name = f"{self.FILE_PREFIX}{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        path = os.path.join(self.directory, f"{name}.csv")
+        index = 1
+        while os.path.exists(path):
+            path = os.path.join(self.directory, f"{name}_{index}.csv")
+            index += 1
+
+        self._file = open(path, 'w', newline='', buffering=self.buffer_size)
+        header = ['Timestamp'] + [f'CH{ch} (V)' for ch in self.channels]
+        self._file.write(",".join(header) + CSV_LINE_END)
+        self._opened_at = time.monotonic()
+        self._last_sync = self._opened_at
+        self.files.append(path)
+        logger.info(f"기록 파일 생성: {path}")
+
+    def _close_file(self):
+        """현재 파일 동기화 후 닫기"""
+        if self._file is None:
+            return
+        self._sync()
+        self._file.close()
+        self._file = None
+
+    def _sync(self):
+        """버퍼 flush + fsync"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+    def _needs_rotation(self):
+        """파일 분할 조건 확인"""
+        if self.rotate_bytes is not None and self._file.tell() >= self.rotate_bytes:
+            return True
+        if (self.rotate_seconds is not None and
+                time.monotonic() - self._opened_at >= self.rotate_seconds):
+            return True
+        return False
+
+    def _write_block(self, timestamps, samples):
+        """블록을 CSV 행으로 기록 (모든 채널이 결측인 행은 제외)"""
+        keep = ~np.isnan(samples).all(axis=1)
+        if not keep.all():
+            timestamps, samples = timestamps[keep], samples[keep]
+        self._file.write(format_csv_block(timestamps, samples))
+        self.rows_written += len(timestamps)
+
+    def _run(self):
+        """기록 스레드 본체"""
+        try:
+            while True:
+                try:
+                    block = self._queue.get(timeout=self.fsync_interval)
+                except queue.Empty:
+                    block = False
+
+                if block is None:
+                    break
+                if block is not False:
+                    self._write_block(*block)
+                    if self._needs_rotation():
+                        self._open_file()
+
+                if time.monotonic() - self._last_sync >= self.fsync_interval:
+                    self._sync()
+        except Exception as e:
+            self.error = e
+            logger.error(f"연속 기록 실패: {e}")
+        finally:
+            try:
+                self._close_file()
+            except Exception as e:
+                logger.error(f"기록 파일 닫기 실패: {e}")
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Replay Module
+저장된 기록(CSV / 바이너리 캡처) 재생 → 실시간 수집 경로로 전달
+"""
+
+import gzip
+import threading
+import time
+import numpy as np
+import logging
+
+from data.binary_capture import BinaryCaptureReader, FILE_EXT as BINARY_CAPTURE_EXT
+from data.data_export import parse_timestamps, GZIP_EXT
+from hardware.adc_conversion import NO_RANGE
+
+logger = logging.getLogger(__name__)
+
+NUM_CHANNELS = 8
+
+
+def load_recording(filename):
+    """
+    기록 파일 읽기
+
+    Args:
+        filename: CSV (DataExporter/ContinuousRecorder 형식, .gz 압축 가능) 또는 바이너리 캡처 파일
+
+    Returns:
+        (timestamps (n,) float64 epoch 초, samples (n, 8) float32 전압 (결측은 NaN),
+         ranges (n, 8) uint8 캡처 시점 레인지 (기록 안 된 채널은 NO_RANGE, CSV는 None)) 튜플
+    """
+    if filename.endswith(BINARY_CAPTURE_EXT):
+        reader = BinaryCaptureReader(filename)
+        try:
+            timestamps = np.array(reader.timestamps, dtype=np.float64)
+            samples = np.full((len(timestamps), NUM_CHANNELS), np.nan, dtype=np.float32)
+            samples[:, reader.channels] = reader.to_volts()
+            ranges = np.full((len(timestamps), NUM_CHANNELS), NO_RANGE, dtype=np.uint8)
+            row = 0
+            for chunk in reader.chunks:
+                n = len(chunk['timestamps'])
+                ranges[row:row + n, reader.channels] = [chunk['ranges'][ch] for ch in reader.channels]
+                row += n
+        finally:
+            reader.close()
+        return timestamps, samples, ranges
+
+    opener = gzip.open if filename.endswith(GZIP_EXT) else open
+    with opener(filename, 'rt', newline='') as f:
+        header = f.readline().strip().split(',')
+        text = f.read()
+
+    # 헤더: Timestamp,CH0 (V),CH3 (V),...
+    channels = [int(name.split()[0][2:]) for name in header[1:]]
+    width = len(header)
+    fields = text.replace('\r\n', '\n').strip('\n').replace('\n', ',').split(',')
+    if fields == ['']:
+        return np.empty(0), np.empty((0, NUM_CHANNELS), dtype=np.float32), None
+
+    table = np.array(fields).reshape(-1, width)
+    values = table[:, 1:]
+    samples = np.full((len(table), NUM_CHANNELS), np.nan, dtype=np.float32)
+    samples[:, channels] = np.where(values == '', 'nan', values).astype(np.float32)
+    return parse_timestamps(table[:, 0]), samples, None
+
+
+class ReplaySource:
+    """
+    기록 재생 클래스
+
+    재생 스레드가 원본 타임스탬프 간격을 speed 배로 따라가며 재생 시각에
+    도달한 행을 블록 단위로 sink(timestamps, samples, ranges)에 넘긴다
+    (예: ScanBlockQueue.put_block). speed가 None 또는 0 이하이면 대기 없이
+    최대 속도로 block_size 행씩 넘긴다. 타임스탬프와 캡처 시점 레인지는
+    원본 값을 유지한다.
+    """
+
+    def __init__(self, timestamps, samples, ranges=None, speed=1.0, block_size=1024,
+                 max_latency=0.1):
+        """
+        Args:
+            timestamps: (n,) epoch 초 배열 (오름차순)
+            samples: (n, 8) 전압 배열 (결측은 NaN)
+            ranges: (n, 8) 캡처 시점 레인지 배열 (None이면 sink에 None 전달, 현재 레인지 사용)
+            speed: 재생 배속 (None 또는 0 이하이면 최대 속도)
+            block_size: 최대 속도 재생 시 블록 행 수
+            max_latency: 배속 재생 시 블록 전달 최대 간격 (초)
+        """
+        self.timestamps = np.asarray(timestamps, dtype=np.float64)
+        self.samples = np.asarray(samples, dtype=np.float32)
+        if self.samples.shape != (len(self.timestamps), NUM_CHANNELS):
+            raise ValueError(f"기록 크기 불일치: {self.samples.shape}")
+        self.ranges = None if ranges is None else np.asarray(ranges, dtype=np.uint8)
+        if self.ranges is not None and self.ranges.shape != self.samples.shape:
+            raise ValueError(f"레인지 크기 불일치: {self.ranges.shape}")
+        self.speed = speed
+        self.block_size = block_size
+        self.max_latency = max_latency
+
+        self.position = 0
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def from_file(cls, filename, **kwargs):
+        """기록 파일에서 재생 소스 생성"""
+        timestamps, samples, ranges = load_recording(filename)
+        logger.info(f"재생 파일 로드: {filename} ({len(timestamps)}행, CH{cls._channels(samples)})")
+        return cls(timestamps, samples, ranges, **kwargs)
+
+    @staticmethod
+    def _channels(samples):
+        return np.flatnonzero(~np.isnan(samples).all(axis=0)).tolist()
+
+    @property
+    def channels(self):
+        """기록에 데이터가 있는 채널 리스트"""
+        return self._channels(self.samples)
+
+    @property
+    def is_running(self):
+        """재생 스레드 동작 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def progress(self):
+        """재생 진행률 (0.0 ~ 1.0)"""
+        if len(self.timestamps) == 0:
+            return 1.0
+        return self.position / len(self.timestamps)
+
+    @property
+    def is_paused(self):
+        """중간에 멈춘 상태 여부 (resume=True로 이어서 재생 가능)"""
+        return not self.is_running and 0 < self.position < len(self.timestamps)
+
+    def start(self, sink, resume=False):
+        """
+        재생 시작
+
+        Args:
+            sink: 블록을 받을 함수 sink(timestamps, samples, ranges)
+            resume: 멈춘 위치부터 이어서 재생 (False이면 처음부터)
+        """
+        self.stop()
+        if not resume or self.position >= len(self.timestamps):
+            self.position = 0
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(sink,), daemon=True)
+        self._thread.start()
+        speed = f"{self.speed}x" if self.speed and self.speed > 0 else "max"
+        logger.info(f"재생 시작: {self.position}/{len(self.timestamps)}행부터, 속도 {speed}")
+
+    def stop(self):
+        """재생 중지"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _emit(self, sink, stop):
+        """position~stop 행을 sink에 전달"""
+        rows = slice(self.position, stop)
+        ranges = None if self.ranges is None else self.ranges[rows]
+        sink(self.timestamps[rows], self.samples[rows], ranges)
+        self.position = stop
+
+    def _run(self, sink):
+        """재생 스레드 본체"""
+        n = len(self.timestamps)
+        try:
+            if not self.speed or self.speed <= 0:
+                while self.position < n and not self._stop_event.is_set():
+                    self._emit(sink, min(n, self.position + self.block_size))
+                return
+
+            # 재생 시각 = 원본 시작 위치 시각 + 경과 시간 × 배속
+            origin = self.timestamps[self.position] if self.position < n else 0.0
+            started = time.monotonic()
+            while self.position < n and not self._stop_event.is_set():
+                replay_time = origin + (time.monotonic() - started) * self.speed
+                stop = int(np.searchsorted(self.timestamps, replay_time, side='right'))
+                if stop > self.position:
+                    self._emit(sink, stop)
+                if self.position < n:
+                    wait = (self.timestamps[self.position] - replay_time) / self.speed
+                    self._stop_event.wait(min(max(wait, 0.0), self.max_latency))
+        except Exception as e:
+            logger.error(f"재생 실패: {e}")
+        finally:
+            logger.info(f"재생 종료: {self.position}/{n}행")
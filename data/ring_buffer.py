@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Ring Buffer Module
+NumPy 기반 고정 크기 링 버퍼
+"""
+
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RingBuffer:
+    """
+    사전 할당 NumPy 링 버퍼
+
+    저장 공간을 용량의 2배로 잡고 모든 행을 i, i + capacity 두 곳에 기록한다.
+    따라서 view()는 랩어라운드와 관계없이 항상 연속된 뷰를 복사 없이 반환한다.
+    (메모리 2배, 쓰기 2회 대신 읽기 시 복사/재정렬이 없음)
+    mirrored=False이면 용량만큼만 할당하고, 랩어라운드 구간을 읽을 때
+    두 부분을 이어 붙인 복사본을 반환한다 (읽을 때 어차피 변환/복사하는 경우용).
+    """
+
+    def __init__(self, capacity, dtype=np.float64, width=None, fill=0, mirrored=True):
+        """
+        Args:
+            capacity: 최대 행 수
+            dtype: 요소 타입
+            width: 행당 열 수 (None이면 1차원)
+            fill: 초기값
+            mirrored: 미러 영역 사용 여부 (False이면 메모리 절반, 랩어라운드 읽기는 복사)
+        """
+        self.capacity = int(capacity)
+        self.width = width
+        self.mirrored = mirrored
+        rows = 2 * self.capacity if mirrored else self.capacity
+        shape = (rows,) if width is None else (rows, width)
+        self._data = np.full(shape, fill, dtype=dtype)
+        self._pos = 0       # 다음 쓰기 슬롯 (0 <= pos < capacity)
+        self._size = 0
+        self.total_written = 0
+
+    @property
+    def dtype(self):
+        """요소 타입"""
+        return self._data.dtype
+
+    def __len__(self):
+        return self._size
+
+    def append(self, row):
+        """한 행 추가"""
+        pos = self._pos
+        self._data[pos] = row
+        if self.mirrored:
+            self._data[pos + self.capacity] = row
+        self._pos = (pos + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+        self.total_written += 1
+
+    def extend(self, rows):
+        """
+        여러 행 추가
+
+        Args:
+            rows: (n,) 또는 (n, width) 배열
+
+        Returns:
+            밀려난(덮어쓴) 기존 행 수
+        """
+        n = len(rows)
+        if n == 0:
+            return 0
+
+        evicted = max(0, self._size + n - self.capacity)
+        self.total_written += n
+        if n > self.capacity:
+            rows = rows[n - self.capacity:]
+            # 앞부분은 쓰자마자 밀려나므로 쓰기 위치만 전진
+            self._pos = (self._pos + n - self.capacity) % self.capacity
+            n = self.capacity
+
+        cap = self.capacity
+        pos = self._pos
+        first = min(n, cap - pos)
+        self._data[pos:pos + first] = rows[:first]
+        if self.mirrored:
+            self._data[pos + cap:pos + cap + first] = rows[:first]
+        if first < n:
+            rest = n - first
+            self._data[:rest] = rows[first:]
+            if self.mirrored:
+                self._data[cap:cap + rest] = rows[first:]
+
+        self._pos = (pos + n) % cap
+        self._size = min(self._size + n, cap)
+        return evicted
+
+    def view(self):
+        """저장된 행 전체의 연속 뷰 (오래된 행 → 최신 행 순서)"""
+        if not self.mirrored:
+            return self.slice(0, self._size)
+        start = (self._pos - self._size) % self.capacity
+        return self._data[start:start + self._size]
+
+    def slice(self, start, stop):
+        """view()[start:stop] (start/stop은 오래된 행 기준 인덱스)"""
+        if self.mirrored:
+            return self.view()[start:stop]
+        start, stop, _ = slice(start, stop).indices(self._size)
+        n = max(stop - start, 0)
+        i0 = (self._pos - self._size + start) % self.capacity
+        if i0 + n <= self.capacity:
+            return self._data[i0:i0 + n]
+        return np.concatenate((self._data[i0:], self._data[:i0 + n - self.capacity]))
+
+    def tail(self, n):
+        """가장 최근 n개 행 뷰"""
+        return self.slice(self._size - min(n, self._size), self._size)
+
+    def oldest(self, n):
+        """가장 오래된 n개 행 뷰 (다음 쓰기 시 밀려날 행 확인용)"""
+        return self.slice(0, min(n, self._size))
+
+    def latest(self):
+        """가장 최근 행 (비어 있으면 None)"""
+        if self._size == 0:
+            return None
+        return self._data[(self._pos - 1) % self.capacity]
+
+    def set_column(self, column, value):
+        """2차원 버퍼의 한 열 전체를 value로 설정 (미러 영역 포함)"""
+        self._data[:, column] = value
+
+    def clear(self):
+        """전체 삭제"""
+        self._pos = 0
+        self._size = 0
+
+    def resized(self, capacity):
+        """최근 데이터를 유지한 새 용량의 버퍼 반환"""
+        new = RingBuffer(capacity, self._data.dtype, self.width, mirrored=self.mirrored)
+        new.extend(self.view())
+        new.total_written = self.total_written
+        return new
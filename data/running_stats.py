@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Running Statistics Module
+슬라이딩 윈도우 채널 통계 (수집 시 증분 갱신)
+"""
+
+from collections import deque
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RunningStats:
+    """
+    다채널 슬라이딩 윈도우 통계 클래스
+
+    평균/분산은 Welford(블록 단위는 Chan 병합식)로, RMS는 제곱합으로 유지하고
+    윈도우에서 밀려나는 행은 역연산으로 제거한다. 최소/최대는 채널별
+    단조 덱((행 번호, 값))으로 관리하므로 조회는 버퍼 크기와 무관하게 O(1)이다.
+    NaN(결측) 값은 집계에서 제외한다.
+    """
+
+    def __init__(self, num_channels=8):
+        """
+        Args:
+            num_channels: 채널 수
+        """
+        self.num_channels = num_channels
+        self.count = np.zeros(num_channels, dtype=np.int64)
+        self.mean = np.zeros(num_channels)
+        self.m2 = np.zeros(num_channels)
+        self.sum_sq = np.zeros(num_channels)
+        self.max_deques = [deque() for _ in range(num_channels)]
+        self.min_deques = [deque() for _ in range(num_channels)]
+
+    def clear(self):
+        """전체 초기화"""
+        for ch in range(self.num_channels):
+            self.clear_channel(ch)
+
+    def clear_channel(self, channel):
+        """채널 통계 초기화"""
+        self.count[channel] = 0
+        self.mean[channel] = 0.0
+        self.m2[channel] = 0.0
+        self.sum_sq[channel] = 0.0
+        self.max_deques[channel].clear()
+        self.min_deques[channel].clear()
+
+    @staticmethod
+    def _block_moments(samples):
+        """블록의 채널별 (개수, 평균, M2, 제곱합)"""
+        valid = ~np.isnan(samples)
+        n = valid.sum(axis=0)
+        filled = np.where(valid, samples, 0.0)
+        total = filled.sum(axis=0)
+        mean = np.divide(total, n, out=np.zeros(len(n)), where=n > 0)
+        m2 = (np.where(valid, filled - mean, 0.0) ** 2).sum(axis=0)
+        sum_sq = (filled ** 2).sum(axis=0)
+        return n, mean, m2, sum_sq
+
+    def add_block(self, start_seq, samples):
+        """
+        행 블록 추가
+
+        Args:
+            start_seq: 첫 행의 전역 행 번호
+            samples: (n, num_channels) 배열 (결측은 NaN)
+        """
+        if len(samples) == 0:
+            return
+        samples = np.asarray(samples, dtype=np.float64)
+        n_b, mean_b, m2_b, sum_sq_b = self._block_moments(samples)
+
+        n_a = self.count
+        n = n_a + n_b
+        safe_n = np.maximum(n, 1)
+        delta = mean_b - self.mean
+        self.mean = self.mean + delta * n_b / safe_n
+        self.m2 = self.m2 + m2_b + delta ** 2 * n_a * n_b / safe_n
+        self.sum_sq = self.sum_sq + sum_sq_b
+        self.count = n
+
+        seqs = np.arange(start_seq, start_seq + len(samples))
+        for ch in np.flatnonzero(n_b):
+            column = samples[:, ch]
+            valid = ~np.isnan(column)
+            self._push_extrema(self.max_deques[ch], seqs[valid], column[valid])
+            self._push_extrema(self.min_deques[ch], seqs[valid], -column[valid])
+
+    @staticmethod
+    def _push_extrema(dq, seqs, values):
+        """
+        단조 감소 덱에 블록 추가 (최소값 덱은 부호를 뒤집어 저장)
+
+        블록 안에서 뒤쪽 값보다 큰 값(접미 최대값)만 후보가 되므로
+        후보를 벡터 연산으로 고른 뒤 덱 뒤쪽과 병합한다.
+        """
+        suffix_max = np.maximum.accumulate(values[::-1])[::-1]
+        later_max = np.append(suffix_max[1:], -np.inf)
+        keep = values > later_max
+        cand_seqs = seqs[keep].tolist()
+        cand_values = values[keep].tolist()
+
+        first = cand_values[0]
+        while dq and dq[-1][1] <= first:
+            dq.pop()
+        dq.extend(zip(cand_seqs, cand_values))
+
+    def remove_block(self, samples):
+        """
+        윈도우에서 밀려나는 행 블록 제거 (평균/분산/제곱합)
+
+        Args:
+            samples: 밀려나는 (n, num_channels) 배열
+        """
+        if len(samples) == 0:
+            return
+        samples = np.asarray(samples, dtype=np.float64)
+        n_b, mean_b, m2_b, sum_sq_b = self._block_moments(samples)
+
+        n = self.count
+        n_a = n - n_b
+        safe_a = np.maximum(n_a, 1)
+        mean_a = (self.mean * n - mean_b * n_b) / safe_a
+        delta = mean_b - mean_a
+        m2_a = self.m2 - m2_b - delta ** 2 * n_a * n_b / np.maximum(n, 1)
+
+        empty = n_a <= 0
+        self.mean = np.where(empty, 0.0, mean_a)
+        self.m2 = np.where(empty, 0.0, np.maximum(m2_a, 0.0))
+        self.sum_sq = np.where(empty, 0.0, np.maximum(self.sum_sq - sum_sq_b, 0.0))
+        self.count = np.maximum(n_a, 0)
+
+    def expire(self, window_start):
+        """
+        윈도우 시작 행 번호 이전의 최소/최대 후보 제거
+
+        Args:
+            window_start: 윈도우에 남아 있는 가장 오래된 행 번호
+        """
+        for dq in self.max_deques + self.min_deques:
+            while dq and dq[0][0] < window_start:
+                dq.popleft()
+
+    def get(self, channel):
+        """
+        채널 통계 반환
+
+        Returns:
+            {'rms', 'max', 'min', 'avg', 'pp', 'std', 'count'} 딕셔너리
+            (데이터가 없으면 None)
+        """
+        n = int(self.count[channel])
+        if n == 0 or not self.max_deques[channel]:
+            return None
+
+        max_v = self.max_deques[channel][0][1]
+        min_v = -self.min_deques[channel][0][1]
+        return {
+            'rms': float(np.sqrt(self.sum_sq[channel] / n)),
+            'max': max_v,
+            'min': min_v,
+            'avg': float(self.mean[channel]),
+            'pp': max_v - min_v,
+            'std': float(np.sqrt(self.m2[channel] / n)),
+            'count': n
+        }
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Shared Ring Buffer Module
+프로세스 간 공유 메모리 링 버퍼 (multiprocessing.shared_memory)
+"""
+
+from multiprocessing import shared_memory
+import numpy as np
+import logging
+
+from hardware.adc_conversion import NO_RANGE
+
+logger = logging.getLogger(__name__)
+
+
+def _attach_shared_memory(name):
+    """기존 공유 메모리 연결 (resource_tracker 중복 등록 방지)"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python 3.12 이하: 연결한 쪽이 종료될 때 세그먼트가 삭제되지 않도록 등록 해제
+        from multiprocessing import resource_tracker
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+class SharedRingBuffer:
+    """
+    단일 writer / 다중 reader 공유 메모리 링 버퍼
+
+    레이아웃: 헤더(int64 x 8) | timestamps float64[capacity] | codes uint16[capacity, n_channels]
+              | ranges uint8[capacity, n_channels]
+
+    행마다 캡처 시점의 채널별 레인지 ID를 함께 기록하므로 reader는 읽는 시점의
+    레인지가 아니라 캡처 시점의 레인지로 코드를 변환할 수 있다.
+    행 번호(seq)는 0부터 단조 증가하며 행 i는 슬롯 i % capacity에 저장된다.
+    writer는 쓰기 전에 BEGIN, 쓰기 후에 END 카운터를 갱신하므로 reader는
+    END로 읽을 범위를 정하고, 사용 후 BEGIN으로 덮어쓰인 행을 검출한다.
+    """
+
+    HEADER_SLOTS = 8
+    BEGIN, END, CAPACITY, CHANNELS = 0, 1, 2, 3
+
+    def __init__(self, shm, owner=False):
+        """
+        Args:
+            shm: SharedMemory 객체
+            owner: True이면 close() 시 세그먼트 삭제
+        """
+        self.shm = shm
+        self.owner = owner
+
+        self._header = np.ndarray((self.HEADER_SLOTS,), dtype=np.int64, buffer=shm.buf)
+        self.capacity = int(self._header[self.CAPACITY])
+        self.n_channels = int(self._header[self.CHANNELS])
+
+        ts_offset = self.HEADER_SLOTS * 8
+        codes_offset = ts_offset + self.capacity * 8
+        ranges_offset = codes_offset + self.capacity * self.n_channels * 2
+        self.timestamps = np.ndarray((self.capacity,), dtype=np.float64,
+                                     buffer=shm.buf, offset=ts_offset)
+        self.codes = np.ndarray((self.capacity, self.n_channels), dtype=np.uint16,
+                                buffer=shm.buf, offset=codes_offset)
+        self.ranges = np.ndarray((self.capacity, self.n_channels), dtype=np.uint8,
+                                 buffer=shm.buf, offset=ranges_offset)
+
+    @classmethod
+    def create(cls, capacity=65536, n_channels=8):
+        """새 공유 링 버퍼 생성"""
+        size = cls.HEADER_SLOTS * 8 + capacity * 8 + capacity * n_channels * 3
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        header = np.ndarray((cls.HEADER_SLOTS,), dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[cls.CAPACITY] = capacity
+        header[cls.CHANNELS] = n_channels
+        del header
+        logger.info(f"공유 링 버퍼 생성: {shm.name} ({capacity} x {n_channels}ch)")
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """이름으로 기존 공유 링 버퍼 연결"""
+        return cls(_attach_shared_memory(name), owner=False)
+
+    @property
+    def name(self):
+        """공유 메모리 이름"""
+        return self.shm.name
+
+    @property
+    def write_seq(self):
+        """지금까지 기록된 전체 행 수"""
+        return int(self._header[self.END])
+
+    def write(self, timestamps, codes, ranges=None):
+        """
+        블록 쓰기 (단일 writer 전용)
+
+        Args:
+            timestamps: (n,) float64 시각
+            codes: (n, n_channels) uint16 코드
+            ranges: 캡처 시점 레인지 ID, (n_channels,) 블록 공통 또는 (n, n_channels) 행별
+                    (None이면 NO_RANGE)
+        """
+        n = len(timestamps)
+        if n == 0:
+            return
+        ranges = np.broadcast_to(np.asarray(NO_RANGE if ranges is None else ranges, dtype=np.uint8),
+                                 (n, self.n_channels))
+
+        seq = int(self._header[self.END])
+        if n > self.capacity:
+            # 용량을 넘는 앞부분은 어차피 덮어쓰이므로 건너뜀
+            skip = n - self.capacity
+            timestamps, codes, ranges = timestamps[skip:], codes[skip:], ranges[skip:]
+            seq += skip
+            n = self.capacity
+
+        self._header[self.BEGIN] = seq + n
+        i0 = seq % self.capacity
+        first = min(n, self.capacity - i0)
+        self.timestamps[i0:i0 + first] = timestamps[:first]
+        self.codes[i0:i0 + first] = codes[:first]
+        self.ranges[i0:i0 + first] = ranges[:first]
+        if first < n:
+            self.timestamps[:n - first] = timestamps[first:]
+            self.codes[:n - first] = codes[first:]
+            self.ranges[:n - first] = ranges[first:]
+        self._header[self.END] = seq + n
+
+    def read_since(self, seq):
+        """
+        seq 이후 행 읽기
+
+        랩어라운드가 없으면 공유 메모리 뷰를 그대로 반환한다 (복사 없음).
+        뷰 사용이 끝나면 overrun(result['start'])으로 덮어쓰인 행을 확인할 것.
+
+        Args:
+            seq: 마지막으로 읽은 행 번호 (다음 읽을 행)
+
+        Returns:
+            {'start': 첫 행 번호, 'seq': 다음 읽을 행 번호,
+             'timestamps': (n,) 배열, 'codes': (n, n_channels) 배열,
+             'ranges': (n, n_channels) 캡처 시점 레인지 ID 배열,
+             'dropped': 읽기 전에 덮어쓰여 놓친 행 수}
+        """
+        end = int(self._header[self.END])
+        start = min(max(seq, end - self.capacity), end)
+        dropped = max(0, start - seq)
+
+        n = end - start
+        i0 = start % self.capacity
+        if i0 + n <= self.capacity:
+            timestamps = self.timestamps[i0:i0 + n]
+            codes = self.codes[i0:i0 + n]
+            ranges = self.ranges[i0:i0 + n]
+        else:
+            first = self.capacity - i0
+            timestamps = np.concatenate((self.timestamps[i0:], self.timestamps[:n - first]))
+            codes = np.concatenate((self.codes[i0:], self.codes[:n - first]))
+            ranges = np.concatenate((self.ranges[i0:], self.ranges[:n - first]))
+
+        return {
+            'start': start,
+            'seq': end,
+            'timestamps': timestamps,
+            'codes': codes,
+            'ranges': ranges,
+            'dropped': dropped
+        }
+
+    def overrun(self, start, count=None):
+        """
+        start 이후 행 중 writer가 이미 덮어썼거나 쓰는 중인 행 수
+
+        Args:
+            start: read_since() 결과의 'start'
+            count: 검사할 행 수 (None이면 제한 없음)
+        """
+        lost = max(0, int(self._header[self.BEGIN]) - self.capacity - start)
+        return lost if count is None else min(lost, count)
+
+    def close(self):
+        """연결 해제 (소유자는 세그먼트 삭제)"""
+        if self.shm is None:
+            return
+        # 버퍼를 참조하는 뷰를 먼저 해제해야 close 가능
+        self._header = self.timestamps = self.codes = self.ranges = None
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+        self.shm = None
@@ -10,8 +10,8 @@ from ttkbootstrap.constants import *
 from tkinter import filedialog, messagebox
 import threading
 import time
-import queue
 from datetime import datetime
+import numpy as np
 
 from gui.panels.header_panel import HeaderPanel
 from gui.panels.channel_panel import ChannelPanel
@@ -21,11 +21,19 @@ from gui.panels.status_bar import StatusBar
 from gui.panels.digital_io_panel import DigitalIOPanel
 
 from hardware.adc_controller import ADS8668Controller
+from hardware.adc_conversion import NO_RANGE
+from hardware.acquisition_worker import AcquisitionWorker
 from hardware.gpio_monitor import GPIOMonitor
 from hardware.gpio_controller import GPIOController
 from data.data_manager import DataManager
-from data.data_export import DataExporter
+from data.data_export import DataExporter, GZIP_EXT
+from data.export_job import ExportJob
+from data.block_queue import ScanBlockQueue
+from data.recorder import ContinuousRecorder
+from data.replay import ReplaySource
+from data.binary_capture import FILE_EXT as BINARY_CAPTURE_EXT
 from utils.config_manager import ConfigManager
+from utils.scheduler import DeadlineScheduler
 from analysis.statistics import SignalStatistics
 
 import logging
@@ -35,12 +43,28 @@ logger = logging.getLogger(__name__)
 class MainWindow:
     """ADS8668 모니터 메인 윈도우"""
 
-    def __init__(self):
+    def __init__(self, acquisition_mode='thread', history_dir=None, storage='volts',
+                 replay_file=None, replay_speed=1.0, cs_mode=ADS8668Controller.CS_GPIO):
+        """
+        Args:
+            acquisition_mode: 'thread' (GUI 프로세스 내 스레드) 또는
+                              'process' (별도 프로세스 + 공유 메모리 링 버퍼)
+            history_dir: 버퍼 밖으로 밀려난 데이터를 저장할 디렉토리 (None이면 저장 안 함)
+            storage: 샘플 저장 방식 ('volts' 또는 'codes': uint16 원시 코드 + 레인지 구간)
+            replay_file: 재생할 기록 파일 (CSV 또는 바이너리 캡처, None이면 ADC 수집)
+            replay_speed: 재생 배속 (0 이하이면 최대 속도)
+            cs_mode: ADC 칩 셀렉트 방식 ('gpio', 'hardware', 'batched')
+        """
         # 하드웨어 및 데이터 관리
-        self.adc = ADS8668Controller()
+        self.adc = ADS8668Controller(cs_mode)
+        self.acquisition_worker = (AcquisitionWorker(cs_mode=cs_mode)
+                                   if acquisition_mode == 'process' else None)
         self.gpio_monitor = GPIOMonitor(enable_monitoring=True)
         self.gpio_controller = GPIOController()  # 디지털 I/O 컨트롤러
-        self.data_manager = DataManager(max_points=300)
+        self.data_manager = DataManager(
+            max_points=300, history_dir=history_dir, storage=storage,
+            converter=self.adc.converter, range_ids=self.adc.channel_ranges
+        )
         self.config_manager = ConfigManager()
         self.data_exporter = DataExporter()
         self.statistics = SignalStatistics()
@@ -49,11 +73,23 @@ class MainWindow:
         self.is_monitoring = False
         self.monitor_thread = None
         self.simulation_mode = False  # 시뮬레이션 모드 플래그
-        self.data_queue = queue.Queue()
+        self.scan_queue = ScanBlockQueue()
+        self.recorder = None
+        self.chart_seq = -1  # 차트에 반영된 DataManager 상태 변경 시퀀스
+        self.export_job = None  # 진행 중인 백그라운드 내보내기
+
+        # 기록 재생 모드 (ADC 대신 기록 파일을 수집 경로로 전달)
+        self.replay_source = None
+        if replay_file:
+            try:
+                self.replay_source = ReplaySource.from_file(replay_file, speed=replay_speed)
+            except Exception as e:
+                logger.error(f"재생 파일 로드 실패: {e}")
 
         # 설정
         self.sample_interval = 3.0  # 초기 샘플링 인터벌 3초
         self.chart_time_window = 5
+        self.scheduler = DeadlineScheduler(self.sample_interval)
 
         # GPIO 알람 상태
         self.alarm_active = False
@@ -86,6 +122,7 @@ class MainWindow:
             'on_save_config': self.save_config,
             'on_load_config': self.load_config,
             'on_save_data': self.save_data,
+            'on_record_toggle': self.toggle_recording,
             'on_interval_change': self.update_sample_interval
         })
         self.header_panel.pack(fill=X, pady=(0, 10))
@@ -151,13 +188,19 @@ class MainWindow:
         """ADC 연결"""
         logger.info("-" * 60)
         logger.info("Connecting to ADS8668...")
-        if self.adc.connect():
+        if self.acquisition_worker is not None:
+            connected = self._start_acquisition_worker()
+        else:
+            connected = self.adc.connect()
+            if connected:
+                # 기본 레인지 설정
+                for ch in range(8):
+                    self.adc.set_channel_range(ch, 0)
+
+        if connected:
             self.header_panel.set_connection_status(True)
             self.status_bar.set_status("ADC connected successfully")
             self.status_bar.set_sample_rate(self.sample_interval)  # 초기 샘플 레이트 표시
-            # 기본 레인지 설정
-            for ch in range(8):
-                self.adc.set_channel_range(ch, 0)
             logger.info("✓ ADC connected successfully")
             logger.info(f"  Sample interval: {self.sample_interval}s")
             logger.info("-" * 60)
@@ -167,23 +210,57 @@ class MainWindow:
             logger.warning("✗ Failed to connect to ADS8668 (GUI test mode enabled)")
             logger.info("-" * 60)
 
+    def _start_acquisition_worker(self):
+        """수집 프로세스 시작 및 공유 링 버퍼 연결"""
+        logger.info("  Acquisition mode: separate process")
+        if not self.acquisition_worker.start(
+                channels=self.data_manager.get_enabled_channels(),
+                interval=self.sample_interval):
+            # 수집 프로세스 실패 시 스레드 모드로 동작 (시뮬레이션 가능)
+            self.acquisition_worker = None
+            return False
+
+        self.data_manager.attach_shared_buffer(
+            self.acquisition_worker.ring, self.acquisition_worker.to_volts
+        )
+        return True
+
+    def is_adc_connected(self):
+        """ADC 연결 여부 (스레드/프로세스 모드 공통)"""
+        if self.acquisition_worker is not None:
+            return self.acquisition_worker.is_connected
+        return self.adc.is_connected
+
+    def get_channel_range(self, channel):
+        """채널의 현재 레인지 ID"""
+        if self.acquisition_worker is not None:
+            return self.acquisition_worker.channel_ranges[channel]
+        return self.adc.channel_ranges[channel]
+
     def on_channel_enable(self, channel, enabled):
         """채널 활성화 콜백"""
         self.data_manager.enable_channel(channel, enabled)
         self.control_panel.set_channel_display(channel, enabled)
+        if self.acquisition_worker is not None:
+            self.acquisition_worker.set_channels(self.data_manager.get_enabled_channels())
         logger.info(f"CH{channel} {'enabled' if enabled else 'disabled'}")
 
     def on_channel_range_change(self, channel, range_name):
         """채널 레인지 변경 콜백"""
         for range_id, info in ADS8668Controller.RANGES.items():
             if info["name"] == range_name:
-                self.adc.set_channel_range(channel, range_id)
+                if self.acquisition_worker is not None:
+                    self.acquisition_worker.set_channel_range(channel, range_id)
+                else:
+                    self.adc.set_channel_range(channel, range_id)
                 break
 
     def on_channel_display_toggle(self, channel, enabled):
         """차트 채널 표시 토글"""
         self.data_manager.enable_channel(channel, enabled)
         self.channel_panel.set_channel_enabled(channel, enabled)
+        if self.acquisition_worker is not None:
+            self.acquisition_worker.set_channels(self.data_manager.get_enabled_channels())
 
     def on_scale_mode_change(self, mode):
         """Y-Scale 모드 변경"""
@@ -205,6 +282,10 @@ class MainWindow:
         """측정 주기 업데이트"""
         if 0.1 <= interval <= 10.0:
             self.sample_interval = interval
+            self.scheduler.set_interval(interval)
+            self.scan_queue.set_interval(interval)
+            if self.acquisition_worker is not None:
+                self.acquisition_worker.set_interval(interval)
             self.status_bar.set_sample_rate(interval)
             self.status_bar.set_status(f"Sample interval: {interval:.1f}s")
         else:
@@ -219,7 +300,11 @@ class MainWindow:
 
     def start_monitoring(self):
         """모니터링 시작"""
-        if not self.adc.is_connected:
+        if self.replay_source is not None:
+            self.start_replay()
+            return
+
+        if not self.is_adc_connected():
             response = messagebox.askyesno(
                 "ADC Not Connected",
                 "ADC가 연결되지 않았습니다.\n\n시뮬레이션 모드로 실행하시겠습니까?\n\n" +
@@ -239,36 +324,101 @@ class MainWindow:
         logger.info("=" * 60)
         logger.info("▶ ADC Monitoring STARTED")
         logger.info(f"  Interval: {self.sample_interval}s")
-        enabled_ch = [ch for ch in range(8) if self.data_manager.channel_data[ch]['enabled']]
+        enabled_ch = self.data_manager.get_enabled_channels()
         logger.info(f"  Enabled channels: {enabled_ch}")
         logger.info("=" * 60)
 
+        if self.acquisition_worker is not None and not self.simulation_mode:
+            # 수집 프로세스가 링 버퍼에 기록, update_gui에서 폴링
+            self.acquisition_worker.set_channels(self.data_manager.get_enabled_channels())
+            self.acquisition_worker.set_running(True)
+            return
+
         self.monitor_thread = threading.Thread(target=self.monitor_loop, daemon=True)
         self.monitor_thread.start()
 
     def stop_monitoring(self):
         """모니터링 중지"""
         self.is_monitoring = False
+        self.scheduler.stop()
+        if self.replay_source is not None:
+            self.replay_source.stop()
+            self.header_panel.set_monitoring_state(False)
+            self.status_bar.set_status(f"Replay stopped ({self.replay_source.progress:.0%})")
+            return
         self.header_panel.set_monitoring_state(False)
-        self.status_bar.set_status("Stopped")
+
+        if self.acquisition_worker is not None and not self.simulation_mode:
+            # 스캔 주기는 수집 프로세스의 스케줄러가 관리
+            self.acquisition_worker.set_running(False)
+            stats = self.acquisition_worker.get_stats()
+        else:
+            stats = self.scheduler.get_stats()
+        if stats is None:
+            self.status_bar.set_status("Stopped")
+            logger.info("■ ADC Monitoring STOPPED")
+            return
+
+        self.status_bar.set_status(
+            f"Stopped (achieved {stats['achieved_rate']:.2f} Hz, missed {stats['missed']})"
+        )
 
         logger.info("=" * 60)
         logger.info("■ ADC Monitoring STOPPED")
+        logger.info(f"  Scans: {stats['ticks']}, missed deadlines: {stats['missed']}")
+        logger.info(f"  Rate: {stats['achieved_rate']:.3f} Hz (target {stats['target_rate']:.3f} Hz)")
+        logger.info(f"  Jitter: mean {stats['mean_jitter_ms']:.2f} ms, max {stats['max_jitter_ms']:.2f} ms")
+        logger.info(f"  Jitter histogram: {stats['jitter_histogram']}")
         logger.info("=" * 60)
 
+    def start_replay(self):
+        """
+        기록 재생 시작 (기록된 채널 활성화 후 스캔 블록 큐로 전달)
+
+        멈춘 재생을 이어가는 경우가 아니면 이전 데이터를 지우고 차트/기록
+        시퀀스를 초기화해 기록 시각이 이전 데이터와 섞이지 않게 한다.
+        """
+        resume = self.replay_source.is_paused
+        if not resume:
+            self.scan_queue.clear()
+            self.data_manager.clear_all()
+            self.chart_seq = -1
+
+        for ch in self.replay_source.channels:
+            if not self.data_manager.is_channel_enabled(ch):
+                self.channel_panel.set_channel_enabled(ch, True)
+                self.on_channel_enable(ch, True)
+
+        self.is_monitoring = True
+        self.header_panel.set_monitoring_state(True)
+        speed = self.replay_source.speed
+        self.status_bar.set_status(f"Replaying ({f'{speed}x' if speed and speed > 0 else 'max speed'})...")
+        self.replay_source.start(self.scan_queue.put_block, resume=resume)
+
     def monitor_loop(self):
         """모니터링 루프 (별도 스레드)"""
         import random
         import math
         sample_count = 0
 
+        # 절대 데드라인 기반 주기 (작업 시간이 주기에 누적되지 않음)
+        self.scheduler.set_interval(self.sample_interval)
+        self.scheduler.start()
+        self.scan_queue.set_interval(self.sample_interval)
+        row = np.empty(8, dtype=np.float32)
+        # 스캔 결과의 레인지 이름 → 캡처 시점 레인지 ID
+        row_ranges = np.empty(8, dtype=np.uint8)
+        range_ids = {info["name"]: range_id for range_id, info in ADS8668Controller.RANGES.items()}
+
         while self.is_monitoring:
+            if not self.scheduler.wait():
+                break
             try:
                 if self.simulation_mode:
                     # 시뮬레이션 모드: 사인파 + 노이즈 생성
                     results = {}
                     for ch in range(8):
-                        if self.data_manager.channel_data[ch]['enabled']:
+                        if self.data_manager.is_channel_enabled(ch):
                             t = sample_count * self.sample_interval
                             # 채널별로 다른 주파수의 사인파 생성
                             freq = 0.5 + ch * 0.1  # 0.5Hz ~ 1.2Hz
@@ -281,18 +431,22 @@ class MainWindow:
                                 'range': '±10V'
                             }
                 else:
-                    # 실제 ADC 모드
-                    results = self.adc.read_all_channels()
+                    # 실제 ADC 모드 (활성화된 채널만 자동 시퀀스로 스캔)
+                    results = self.adc.read_all_channels(
+                        self.data_manager.get_enabled_channels()
+                    )
 
                 if results:
                     sample_count += 1
-                    self.data_queue.put({
-                        'timestamp': datetime.now(),
-                        'channels': results
-                    })
+                    row.fill(np.nan)
+                    row_ranges.fill(NO_RANGE)
+                    for ch, ch_data in results.items():
+                        row[ch] = ch_data['voltage']
+                        row_ranges[ch] = range_ids.get(ch_data['range'], NO_RANGE)
+                    self.scan_queue.put_scan(time.time(), row, row_ranges)
 
                     # ADC 전압 값 로그 출력 (활성화된 채널만)
-                    enabled_channels = [ch for ch in range(8) if self.data_manager.channel_data[ch]['enabled']]
+                    enabled_channels = self.data_manager.get_enabled_channels()
                     if enabled_channels:
                         log_msg = f"[ADC #{sample_count:04d}] "
                         for ch in enabled_channels:
@@ -300,11 +454,11 @@ class MainWindow:
                                 voltage = results[ch]['voltage']
                                 log_msg += f"CH{ch}:{voltage:+7.4f}V  "
                         logger.info(log_msg.rstrip())
-
-                time.sleep(self.sample_interval)
             except Exception as e:
                 logger.error(f"Monitor error: {e}")
-                time.sleep(self.sample_interval)
+
+        # 채우던 블록 전달
+        self.scan_queue.flush()
 
     def start_update_loop(self):
         """GUI 업데이트 루프"""
@@ -315,36 +469,44 @@ class MainWindow:
         # 시간 업데이트
         self.status_bar.update_time()
 
-        # 데이터 큐 처리
+        # 재생 스레드가 끝났는지 큐를 비우기 전에 확인 (남은 블록은 아래에서 반영)
+        replay_done = (self.replay_source is not None and self.is_monitoring and
+                       not self.replay_source.is_running)
+
+        # 스캔 블록 큐 처리 (쌓인 블록을 한 번에 추가)
         data_updated = False
-        while not self.data_queue.empty():
-            try:
-                data = self.data_queue.get_nowait()
-                self.data_manager.add_batch_data(data['timestamp'], data['channels'])
-
-                # 채널 표시 업데이트
-                for ch, ch_data in data['channels'].items():
-                    if self.data_manager.channel_data[ch]['enabled']:
-                        # 프로그레스바 계산
-                        range_id = self.adc.channel_ranges[ch]
-                        range_info = ADS8668Controller.RANGES[range_id]
-                        max_v = float(range_info['name'].split('V')[0].replace('±', '').replace('-', ''))
-
-                        if '±' in range_info['name']:
-                            pct = ((ch_data['voltage'] + max_v) / (2 * max_v)) * 100
-                        else:
-                            pct = (ch_data['voltage'] / max_v) * 100
-
-                        self.channel_panel.update_channel_display(
-                            ch, ch_data['voltage'], pct
-                        )
-
-                data_updated = True
-            except queue.Empty:
-                break
+        block = self.scan_queue.drain()
+        if block is not None:
+            timestamps, samples, ranges = block
+            self.data_manager.add_block(timestamps, samples, ranges=ranges)
+
+            # 채널 표시 업데이트 (최신 스캔)
+            for ch, voltage in enumerate(samples[-1].tolist()):
+                if voltage == voltage and self.data_manager.is_channel_enabled(ch):
+                    self.update_channel_display(ch, voltage)
+
+            data_updated = True
+
+        # 수집 프로세스 모드: 공유 링 버퍼 폴링
+        if self.acquisition_worker is not None and self.is_monitoring and not self.simulation_mode:
+            latest = self.data_manager.poll_shared_buffer()
+            for ch, voltage in latest.items():
+                if self.data_manager.is_channel_enabled(ch):
+                    self.update_channel_display(ch, voltage)
+            data_updated = data_updated or bool(latest)
+
+        # 재생이 끝나면 (마지막 블록까지 반영 후) 모니터링 종료
+        if replay_done:
+            self.stop_monitoring()
 
-        # 차트 및 통계 업데이트
-        if data_updated:
+        # 연속 기록
+        self.feed_recorder()
+
+        # 백그라운드 내보내기 진행률
+        self.poll_export_job()
+
+        # 차트 및 통계 업데이트 (마지막 반영 이후 바뀐 채널만)
+        if data_updated or self.data_manager.change_seq != self.chart_seq:
             self.update_chart()
             self.update_statistics()
 
@@ -354,19 +516,42 @@ class MainWindow:
         # 500ms마다 반복
         self.root.after(500, self.update_gui)
 
+    def update_channel_display(self, ch, voltage):
+        """채널 전압 및 프로그레스바 표시"""
+        range_info = ADS8668Controller.RANGES[self.get_channel_range(ch)]
+        max_v = float(range_info['name'].split('V')[0].replace('±', '').replace('-', ''))
+
+        if '±' in range_info['name']:
+            pct = ((voltage + max_v) / (2 * max_v)) * 100
+        else:
+            pct = (voltage / max_v) * 100
+
+        self.channel_panel.update_channel_display(ch, voltage, pct)
+
     def update_chart(self):
         """차트 업데이트"""
         y_limits = self.control_panel.get_y_scale_limits()
-        channel_data = self.data_manager.get_all_data()
-        self.chart_panel.update_time_domain(channel_data, y_limits)
+        changed = self.data_manager.changed_channels(self.chart_seq)
+        self.chart_seq = self.data_manager.change_seq
+
+        # 표시 구간만, 플롯 폭의 2배 점 수 이내로 축약 (재생 중에는 최신 데이터 시각 기준)
+        t_end = time.time()
+        if self.replay_source is not None:
+            latest = self.data_manager.timestamps.latest()
+            if latest is not None:
+                t_end = float(latest)
+        t0 = t_end - self.chart_time_window * 60
+        max_points = 2 * self.chart_panel.get_plot_width()
+        channel_data = {ch: self.data_manager.get_channel_view(ch, t0, None, max_points)
+                        for ch in changed}
+        self.chart_panel.update_time_domain(channel_data, y_limits, changed, t_end)
 
     def update_statistics(self):
         """통계 업데이트"""
         stats_channel = self.control_panel.get_stats_channel()
-        data = self.data_manager.get_channel_data(stats_channel)
+        stats = self.data_manager.get_running_statistics(stats_channel)
 
-        if data and len(data['voltages']) > 0:
-            stats = self.statistics.calculate_statistics(data['voltages'])
+        if stats:
             self.control_panel.update_statistics(stats)
 
     def save_chart_snapshot(self):
@@ -386,18 +571,97 @@ class MainWindow:
                 messagebox.showerror("Error", f"Failed to save chart:\n{e}")
 
     def save_data(self):
-        """데이터 저장"""
+        """데이터 저장 (백그라운드 작업, 진행 중이면 취소 여부 확인)"""
+        if self.export_job is not None and self.export_job.is_running:
+            if messagebox.askyesno("Export in progress", "Cancel the current export?"):
+                self.export_job.cancel()
+            return
+
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            filetypes=[("CSV files", "*.csv"),
+                       ("CSV files (gzip)", f"*.csv{GZIP_EXT}"),
+                       ("Binary capture", f"*{BINARY_CAPTURE_EXT}"),
+                       ("All files", "*.*")]
         )
 
         if filename:
-            channel_data = self.data_manager.get_all_data()
-            if self.data_exporter.export_to_csv(filename, channel_data):
-                messagebox.showinfo("Success", f"Data saved!\n{filename}")
+            # 버퍼 구간의 일관된 복사본 (내보내는 동안 수집이 계속되어도 불변)
+            oldest = self.data_manager.timestamps.oldest(1)
+            frame = self.data_manager.snapshot(
+                t_start=float(oldest[0]) if len(oldest) else None
+            )
+            if filename.endswith(BINARY_CAPTURE_EXT):
+                job = ExportJob(
+                    self.data_exporter.export_to_binary, filename, frame,
+                    range_ids=[self.get_channel_range(ch) for ch in range(8)],
+                    config={'sample_interval': self.sample_interval},
+                    converter=self.adc.converter
+                )
             else:
-                messagebox.showerror("Error", "Failed to save data")
+                job = ExportJob(self.data_exporter.export_to_csv, filename, frame)
+            job.start()
+            self.export_job = job
+            self.status_bar.set_status(f"Exporting {filename}...")
+
+    def poll_export_job(self):
+        """백그라운드 내보내기 진행률 표시 및 완료 처리"""
+        job = self.export_job
+        if job is None:
+            return
+        if job.is_running:
+            self.status_bar.set_status(f"Exporting... {job.progress:.0%}")
+            return
+
+        self.export_job = None
+        if job.result:
+            self.status_bar.set_status(f"Data saved ({job.elapsed:.1f}s): {job.filename}")
+            messagebox.showinfo("Success", f"Data saved!\n{job.filename}")
+        elif job.is_cancelled:
+            self.status_bar.set_status("Export cancelled")
+        else:
+            self.status_bar.set_status("Export failed")
+            messagebox.showerror("Error", "Failed to save data")
+
+    def toggle_recording(self):
+        """연속 기록 시작/정지"""
+        if self.recorder is not None:
+            self.data_manager.set_row_sink(None)
+            self.recorder.stop()
+            self.status_bar.set_status(
+                f"Recording stopped: {self.recorder.rows_written} rows, "
+                f"{len(self.recorder.files)} file(s)"
+            )
+            self.recorder = None
+            self.header_panel.set_recording_state(False)
+            return
+
+        directory = filedialog.askdirectory(title="Select recording directory")
+        if not directory:
+            return
+
+        recorder = ContinuousRecorder(directory, self.data_manager.get_enabled_channels())
+        if not recorder.start():
+            messagebox.showerror("Error", "Failed to start recording")
+            return
+
+        self.recorder = recorder
+        # 수집 블록을 DataManager에 넣는 시점에 그대로 전달 (버퍼에서 다시 읽지 않음)
+        self.data_manager.set_row_sink(recorder.submit)
+        self.header_panel.set_recording_state(True)
+        self.status_bar.set_status(f"Recording to {directory}")
+
+    def feed_recorder(self):
+        """연속 기록 상태 확인 (행은 DataManager row_sink로 수집 시점에 전달됨)"""
+        if self.recorder is None:
+            return
+        if not self.recorder.is_recording:
+            # 기록 스레드 오류로 종료된 경우
+            logger.error(f"연속 기록 중단: {self.recorder.error}")
+            self.status_bar.set_status(f"Recording failed: {self.recorder.error}")
+            self.data_manager.set_row_sink(None)
+            self.recorder = None
+            self.header_panel.set_recording_state(False)
 
     def save_config(self):
         """설정 저장"""
@@ -502,7 +766,7 @@ class MainWindow:
         # CS 핀 상태도 업데이트 (읽기 전용)
         # CS 핀은 ADC 컨트롤러에서 제어하므로 상태만 표시
         # ADC가 연결되어 있고 SPI 통신 중일 때는 HIGH (대부분의 시간)
-        if self.adc.is_connected:
+        if self.is_adc_connected():
             # CS 핀은 기본적으로 HIGH 상태 유지
             self.control_panel.update_gpio_input(8, True, 0, 0)
         else:
@@ -625,8 +889,15 @@ class MainWindow:
             self.gpio_controller.disconnect()
         if self.gpio_monitor:
             self.gpio_monitor.close()
+        if self.acquisition_worker:
+            self.acquisition_worker.stop()
         if self.adc:
             self.adc.close()
+        if self.recorder:
+            self.recorder.stop()
+        if self.export_job is not None:
+            self.export_job.cancel(wait=True)
+        self.data_manager.close_history()
         self.root.destroy()
 
     def run(self):
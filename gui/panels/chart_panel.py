@@ -42,16 +42,18 @@ class ChartPanel:
         canvas_widget = self.chart.create_canvas(toolbar_parent=None)
         canvas_widget.pack(fill=BOTH, expand=True)
 
-    def update_time_domain(self, channel_data, y_limits=None):
+    def update_time_domain(self, channel_data, y_limits=None, changed=None, t_end=None):
         """
         Time Domain 차트 업데이트
 
         Args:
             channel_data: 채널 데이터 딕셔너리
             y_limits: Y축 제한 (y_min, y_max) 또는 None
+            changed: 갱신할 채널 목록 (None이면 전체)
+            t_end: X축 오른쪽 끝 시각 (epoch 초, None이면 현재 시각)
         """
         if isinstance(self.chart, TimeDomainChart):
-            self.chart.update_data(channel_data, y_limits)
+            self.chart.update_data(channel_data, y_limits, changed, t_end)
 
     def update_spectral(self, frequencies, magnitude_db, harmonics=None):
         """
@@ -65,6 +67,12 @@ class ChartPanel:
         if isinstance(self.chart, SpectralChart):
             self.chart.update_spectrum(frequencies, magnitude_db, harmonics)
 
+    def get_plot_width(self):
+        """차트 플롯 영역 폭 (픽셀)"""
+        if self.chart:
+            return self.chart.get_plot_width()
+        return 1000
+
     def enable_cursor(self, enabled):
         """측정 커서 활성화"""
         if self.chart:
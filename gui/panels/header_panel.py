@@ -21,6 +21,7 @@ class HeaderPanel:
                 'on_save_config': 설정 저장 콜백,
                 'on_load_config': 설정 불러오기 콜백,
                 'on_save_data': 데이터 저장 콜백,
+                'on_record_toggle': 연속 기록 시작/정지 콜백,
                 'on_interval_change': 측정 주기 변경 콜백
             }
         """
@@ -60,6 +61,13 @@ class HeaderPanel:
         tb.Label(interval_frame, text="sec", font=("DejaVu Sans", 9)).pack(side=LEFT, padx=(2, 0))
 
         # 버튼들
+        self.record_button = tb.Button(
+            button_frame, text="Record",
+            command=self._on_record_toggle,
+            bootstyle="danger-outline", width=8
+        )
+        self.record_button.pack(side=RIGHT, padx=5)
+
         tb.Button(button_frame, text="Save Data",
                  command=self._on_save_data,
                  bootstyle="secondary", width=10).pack(side=RIGHT, padx=5)
@@ -105,6 +113,11 @@ class HeaderPanel:
         if self.callbacks.get('on_save_data'):
             self.callbacks['on_save_data']()
 
+    def _on_record_toggle(self):
+        """연속 기록 버튼 콜백"""
+        if self.callbacks.get('on_record_toggle'):
+            self.callbacks['on_record_toggle']()
+
     def _on_interval_change(self):
         """측정 주기 변경 콜백"""
         if self.callbacks.get('on_interval_change'):
@@ -124,6 +137,13 @@ class HeaderPanel:
         else:
             self.start_button.config(text="Start", bootstyle="success")
 
+    def set_recording_state(self, is_recording):
+        """연속 기록 상태 업데이트"""
+        if is_recording:
+            self.record_button.config(text="Recording", bootstyle="danger")
+        else:
+            self.record_button.config(text="Record", bootstyle="danger-outline")
+
     def get_interval(self):
         """현재 측정 주기 반환"""
         return float(self.interval_var.get())
@@ -13,6 +13,16 @@ from datetime import datetime, timedelta
 import numpy as np
 
 
+def to_local_datetime64(timestamps):
+    """
+    epoch 초 배열 → 로컬 시각 datetime64 배열 (matplotlib 날짜 축용)
+
+    X축 범위는 naive 로컬 datetime으로 설정되므로 같은 기준으로 맞춘다.
+    """
+    offset = datetime.now().astimezone().utcoffset().total_seconds()
+    return ((np.asarray(timestamps, dtype=np.float64) + offset) * 1e6).astype('datetime64[us]')
+
+
 class BaseChartWidget:
     """차트 위젯 베이스 클래스"""
 
@@ -44,6 +54,11 @@ class BaseChartWidget:
 
         return self.canvas.get_tk_widget()
 
+    def get_plot_width(self):
+        """플롯 영역 폭 (픽셀, 캔버스가 없으면 Figure 크기 기준)"""
+        bbox = self.ax.get_window_extent()
+        return max(int(bbox.width), 1)
+
     def enable_cursor(self, enabled=True):
         """측정 커서 활성화"""
         if enabled and not self.cursor:
@@ -94,42 +109,50 @@ class TimeDomainChart(BaseChartWidget):
         self.ax.set_xlim(now - timedelta(minutes=self.time_window), now)
         self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
 
-    def update_data(self, channel_data, y_limits=None):
+    def update_data(self, channel_data, y_limits=None, changed=None, t_end=None):
         """
         차트 데이터 업데이트
 
         Args:
-            channel_data: {ch: {'timestamps': [...], 'voltages': [...], 'enabled': bool}, ...}
+            channel_data: {ch: {'timestamps': epoch 초 배열, 'voltages': 배열, 'enabled': bool}, ...}
             y_limits: (y_min, y_max) 튜플 또는 None (Auto)
+            changed: 갱신할 채널 목록 (None이면 전체). 목록에 없는 채널은 기존 라인 유지
+            t_end: X축 오른쪽 끝 시각 (epoch 초, None이면 현재 시각, 재생 시 최신 데이터 시각)
         """
-        has_data = False
-
-        for ch in range(8):
+        for ch in (range(8) if changed is None else changed):
             if ch in channel_data and channel_data[ch]['enabled'] and len(channel_data[ch]['timestamps']) > 0:
                 self.lines[ch].set_data(
-                    channel_data[ch]['timestamps'],
+                    to_local_datetime64(channel_data[ch]['timestamps']),
                     channel_data[ch]['voltages']
                 )
                 self.lines[ch].set_visible(True)
-                has_data = True
             else:
                 self.lines[ch].set_visible(False)
 
-        if has_data:
-            # X축 업데이트
-            now = datetime.now()
-            self.ax.set_xlim(now - timedelta(minutes=self.time_window), now)
+        visible = [ch for ch in range(8)
+                   if self.lines[ch].get_visible() and len(self.lines[ch].get_xdata()) > 0]
+        if visible:
+            # X축 업데이트 (라인 데이터와 같은 로컬 datetime64 기준)
+            if t_end is None:
+                now = datetime.now()
+                self.ax.set_xlim(now - timedelta(minutes=self.time_window), now)
+            else:
+                end = to_local_datetime64([t_end])[0]
+                self.ax.set_xlim(end - np.timedelta64(int(self.time_window * 60e6), 'us'), end)
 
             # Y축 업데이트
             if y_limits is None:
                 # Auto mode
-                all_v = []
-                for ch in range(8):
-                    if ch in channel_data and channel_data[ch]['enabled']:
-                        all_v.extend(channel_data[ch]['voltages'])
-
-                if all_v:
-                    v_min, v_max = min(all_v), max(all_v)
+                ranges = []
+                for ch in visible:
+                    v = np.asarray(self.lines[ch].get_ydata(), dtype=np.float64)
+                    v = v[~np.isnan(v)]
+                    if len(v) > 0:
+                        ranges.append((v.min(), v.max()))
+
+                if ranges:
+                    v_min = float(min(r[0] for r in ranges))
+                    v_max = float(max(r[1] for r in ranges))
                     margin = (v_max - v_min) * 0.1 if v_max != v_min else 1
                     self.ax.set_ylim(v_min - margin, v_max + margin)
             else:
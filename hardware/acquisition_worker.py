@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Acquisition Worker Module
+별도 프로세스 ADC 수집 (공유 메모리 링 버퍼로 전달)
+"""
+
+import multiprocessing as mp
+import queue
+import time
+import logging
+
+import numpy as np
+
+from data.shared_ring_buffer import SharedRingBuffer
+from hardware.adc_conversion import CodeConverter, MISSING_CODE, NO_RANGE, range_runs
+
+logger = logging.getLogger(__name__)
+
+# 워커 연결 상태
+STATUS_STARTING = 0
+STATUS_CONNECTED = 1
+STATUS_FAILED = -1
+
+
+def _worker_main(ring_name, commands, replies, stop_event, status, cs_mode, interval, channels, ranges):
+    """
+    수집 프로세스 본체
+
+    ADS8668Controller를 자식 프로세스에서 생성하여 GUI 프로세스의 GIL과
+    matplotlib 렌더링에 영향받지 않고 스캔하고, 결과를 링 버퍼에 기록한다.
+    수집 중지 시 스케줄러 통계를 replies 큐로 돌려준다.
+    """
+    from hardware.adc_controller import ADS8668Controller
+    from utils.scheduler import DeadlineScheduler
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%H:%M:%S'
+    )
+
+    ring = SharedRingBuffer.attach(ring_name)
+    adc = ADS8668Controller(cs_mode)
+    if not adc.connect():
+        status.value = STATUS_FAILED
+        ring.close()
+        return
+
+    for ch, range_id in enumerate(ranges):
+        adc.set_channel_range(ch, range_id)
+    status.value = STATUS_CONNECTED
+
+    scheduler = DeadlineScheduler(interval)
+    channels = sorted(channels)
+    running = False
+    row = np.empty((1, ring.n_channels), dtype=np.uint16)
+    ts = np.empty(1, dtype=np.float64)
+    # 스캔 행과 함께 기록할 캡처 시점 레인지 (레인지 명령 처리 후 갱신)
+    row_ranges = np.array(adc.channel_ranges[:ring.n_channels], dtype=np.uint8)
+
+    try:
+        while not stop_event.is_set():
+            # 명령 처리
+            while True:
+                try:
+                    cmd, arg = commands.get_nowait()
+                except queue.Empty:
+                    break
+                if cmd == 'channels':
+                    channels = sorted(arg)
+                elif cmd == 'range':
+                    adc.set_channel_range(*arg)
+                    row_ranges[:] = adc.channel_ranges[:ring.n_channels]
+                elif cmd == 'interval':
+                    scheduler.set_interval(arg)
+                elif cmd == 'run':
+                    running = arg
+                    if running:
+                        scheduler.start()
+                    else:
+                        scheduler.stop()
+                        replies.put(('stats', scheduler.get_stats()))
+
+            if not running:
+                stop_event.wait(0.05)
+                continue
+
+            # 긴 주기에서도 명령/종료에 반응하도록 나누어 대기
+            remaining = scheduler.remaining()
+            if remaining > 0.05:
+                stop_event.wait(0.05)
+                continue
+            if not scheduler.wait() or not channels:
+                continue
+
+            codes = adc.read_codes(channels)
+            if codes is None:
+                continue
+
+            row.fill(MISSING_CODE)
+            row[0, channels] = codes
+            ts[0] = time.time()
+            ring.write(ts, row, row_ranges)
+    finally:
+        adc.close()
+        ring.close()
+
+
+class AcquisitionWorker:
+    """
+    ADC 수집 프로세스 관리 클래스
+
+    GUI 측은 ring(SharedRingBuffer)을 통해 결과를 읽고,
+    채널/레인지/주기 변경은 명령 큐로 전달한다.
+    """
+
+    def __init__(self, capacity=65536, cs_mode='gpio'):
+        """
+        Args:
+            capacity: 링 버퍼 용량 (스캔 수)
+            cs_mode: ADS8668Controller 칩 셀렉트 방식
+        """
+        self.capacity = capacity
+        self.cs_mode = cs_mode
+        self._ctx = mp.get_context('spawn')
+
+        self.ring = None
+        self.process = None
+        self.commands = None
+        self.replies = None
+        self.stop_event = None
+        self.status = None
+
+        self.channel_ranges = [0] * 8
+        self.converter = CodeConverter()
+
+    @property
+    def is_connected(self):
+        """수집 프로세스의 ADC 연결 여부"""
+        return self.status is not None and self.status.value == STATUS_CONNECTED
+
+    def start(self, channels=(), interval=1.0, timeout=5.0):
+        """
+        수집 프로세스 시작 (수집은 set_running(True) 이후 시작)
+
+        Args:
+            channels: 초기 스캔 채널 리스트
+            interval: 초기 측정 주기 (초)
+            timeout: ADC 연결 대기 시간 (초)
+
+        Returns:
+            bool: ADC 연결 성공 여부
+        """
+        if self.process is not None:
+            return self.is_connected
+
+        try:
+            self.ring = SharedRingBuffer.create(self.capacity)
+            self.commands = self._ctx.Queue()
+            self.replies = self._ctx.Queue()
+            self.stop_event = self._ctx.Event()
+            self.status = self._ctx.Value('i', STATUS_STARTING)
+
+            self.process = self._ctx.Process(
+                target=_worker_main,
+                args=(self.ring.name, self.commands, self.replies, self.stop_event, self.status,
+                      self.cs_mode, interval, list(channels), list(self.channel_ranges)),
+                daemon=True
+            )
+            self.process.start()
+        except Exception as e:
+            logger.error(f"수집 프로세스 시작 실패: {e}")
+            self.stop()
+            return False
+
+        deadline = time.monotonic() + timeout
+        while self.status.value == STATUS_STARTING and time.monotonic() < deadline:
+            if not self.process.is_alive():
+                break
+            time.sleep(0.05)
+
+        if not self.is_connected:
+            logger.error("수집 프로세스 ADC 연결 실패")
+            self.stop()
+            return False
+
+        logger.info(f"수집 프로세스 시작 (PID {self.process.pid})")
+        return True
+
+    def _send(self, cmd, arg):
+        """명령 전송"""
+        if self.commands is not None:
+            self.commands.put((cmd, arg))
+
+    def set_running(self, running):
+        """수집 시작/중지 (중지 시 get_stats()로 통계를 받음)"""
+        if running and self.replies is not None:
+            # 응답 대기 시간을 넘겨 도착한 이전 통계는 버림
+            while True:
+                try:
+                    self.replies.get_nowait()
+                except queue.Empty:
+                    break
+        self._send('run', bool(running))
+
+    def get_stats(self, timeout=1.0):
+        """
+        수집 프로세스 스케줄러 통계 (set_running(False) 이후 호출)
+
+        Args:
+            timeout: 응답 대기 시간 (초)
+
+        Returns:
+            DeadlineScheduler.get_stats() 딕셔너리 (응답이 없으면 None)
+        """
+        if self.replies is None:
+            return None
+        try:
+            _, stats = self.replies.get(timeout=timeout)
+        except queue.Empty:
+            logger.warning("수집 프로세스 통계 응답 없음")
+            return None
+        return stats
+
+    def set_channels(self, channels):
+        """스캔 채널 변경"""
+        self._send('channels', list(channels))
+
+    def set_channel_range(self, channel, range_id):
+        """채널 레인지 변경"""
+        self.channel_ranges[channel] = range_id
+        self._send('range', (channel, range_id))
+
+    def set_interval(self, interval):
+        """측정 주기 변경"""
+        self._send('interval', interval)
+
+    def to_volts(self, codes, ranges=None):
+        """
+        링 버퍼 코드 블록을 전압으로 변환
+
+        Args:
+            codes: (n, 8) uint16 배열
+            ranges: (n, 8) 캡처 시점 레인지 ID 배열 (링 버퍼 'ranges',
+                    None 또는 NO_RANGE 항목은 현재 레인지)
+
+        Returns:
+            (n, 8) float64 배열 (결측 채널은 NaN)
+        """
+        if ranges is None:
+            return self.converter.convert_block(codes, self.channel_ranges)
+
+        volts = np.empty(codes.shape, dtype=np.float64)
+        for lo, hi, row in range_runs(ranges):
+            range_ids = [current if r == NO_RANGE else int(r)
+                         for r, current in zip(row.tolist(), self.channel_ranges)]
+            volts[lo:hi] = self.converter.convert_block(codes[lo:hi], range_ids)
+        return volts
+
+    def stop(self):
+        """수집 프로세스 종료 및 공유 메모리 해제"""
+        if self.stop_event is not None:
+            self.stop_event.set()
+        if self.process is not None:
+            self.process.join(timeout=2.0)
+            if self.process.is_alive():
+                self.process.terminate()
+            self.process = None
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+        self.commands = None
+        self.replies = None
+        self.status = None
+        logger.info("수집 프로세스 종료")
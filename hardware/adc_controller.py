@@ -6,50 +6,73 @@ ADS8668 ADC Controller Module
 
 import spidev
 import RPi.GPIO as GPIO
+import numpy as np
 import time
 import logging
 
+from hardware.spi_batch import SpiBatchTransfer
+from hardware.adc_conversion import ADC_RANGES, CodeConverter
+
 logger = logging.getLogger(__name__)
 
 
 class ADS8668Controller:
     """ADS8668 ADC 제어 클래스"""
 
-    RANGES = {
-        0: {"name": "±10V", "reg": 0, "offset": 0x800, "scale": 5.00},
-        1: {"name": "±5V", "reg": 1, "offset": 0x800, "scale": 2.50},
-        2: {"name": "±2.5V", "reg": 2, "offset": 0x800, "scale": 1.25},
-        3: {"name": "±1.25V", "reg": 3, "offset": 0x800, "scale": 0.625},
-        4: {"name": "±0.5V", "reg": 11, "offset": 0x800, "scale": 0.3125},
-        5: {"name": "0-10V", "reg": 5, "offset": 0x000, "scale": 2.50},
-        6: {"name": "0-5V", "reg": 6, "offset": 0x000, "scale": 1.25},
-        7: {"name": "0-2.5V", "reg": 7, "offset": 0x000, "scale": 0.625},
-        8: {"name": "0-1.25V", "reg": 15, "offset": 0x000, "scale": 0.3125},
-    }
+    RANGES = ADC_RANGES
 
     ADCS_PIN = 8
 
-    def __init__(self):
+    # 칩 셀렉트 방식
+    CS_GPIO = 'gpio'            # GPIO 8 직접 제어 (구 커널 CS 글리치 대응, 기본값)
+    CS_HARDWARE = 'hardware'    # spidev 하드웨어 CS (xfer2)
+    CS_BATCHED = 'batched'      # 멀티 메시지 ioctl, 프레임 사이 CS 토글은 커널이 수행
+    CS_MODES = (CS_GPIO, CS_HARDWARE, CS_BATCHED)
+
+    # 커맨드 (4바이트 프레임의 첫 바이트, 응답은 다음 프레임에서 수신)
+    CMD_NO_OP = 0x00
+    CMD_AUTO_RST = 0xA0
+    CMD_MAN_CH = 0xC0
+
+    # 프로그램 레지스터 주소
+    REG_AUTO_SEQ_EN = 0x01
+    REG_RANGE_CH0 = 0x05
+
+    def __init__(self, cs_mode=CS_GPIO):
+        """
+        Args:
+            cs_mode: 칩 셀렉트 방식 (CS_GPIO, CS_HARDWARE, CS_BATCHED)
+        """
+        if cs_mode not in self.CS_MODES:
+            raise ValueError(f"Unknown CS mode: {cs_mode}")
+        self.cs_mode = cs_mode
         self.spi = None
         self.channel_ranges = [0] * 8
         self.is_connected = False
+        self._auto_seq_mask = None  # 마지막으로 기록한 AUTO_SEQ_EN 값
+        self._batch_cache = {}      # 프레임 목록별 SpiBatchTransfer
+        self.converter = CodeConverter(self.RANGES)
 
     def connect(self):
         """ADC 연결 및 초기화"""
         try:
-            GPIO.setmode(GPIO.BCM)
-            GPIO.setwarnings(False)
-            GPIO.setup(self.ADCS_PIN, GPIO.OUT, initial=GPIO.HIGH)
+            if self.cs_mode == self.CS_GPIO:
+                # 2020-05-27 이후 커널의 CS 글리치 대응: CS를 GPIO로 직접 제어
+                GPIO.setmode(GPIO.BCM)
+                GPIO.setwarnings(False)
+                GPIO.setup(self.ADCS_PIN, GPIO.OUT, initial=GPIO.HIGH)
 
             self.spi = spidev.SpiDev()
             self.spi.open(0, 0)
-            self.spi.no_cs = True
+            self.spi.no_cs = self.cs_mode == self.CS_GPIO
             self.spi.mode = 1
             self.spi.max_speed_hz = 10000000
 
             time.sleep(0.5)
+            self._auto_seq_mask = None
+            self._batch_cache.clear()
             self.is_connected = True
-            logger.info("ADS8668 연결 성공")
+            logger.info(f"ADS8668 연결 성공 (CS: {self.cs_mode})")
             return True
         except Exception as e:
             logger.error(f"ADS8668 연결 실패: {e}")
@@ -57,19 +80,93 @@ class ADS8668Controller:
 
     def _xfer_spi(self, data):
         """SPI 데이터 전송"""
+        if self.cs_mode != self.CS_GPIO:
+            return self.spi.xfer2(data)
         GPIO.output(self.ADCS_PIN, 0)
         result = self.spi.xfer(data)
         GPIO.output(self.ADCS_PIN, 1)
         return result
 
+    def _get_batch(self, frames):
+        """프레임 목록에 해당하는 SpiBatchTransfer 반환 (캐시)"""
+        key = tuple(tuple(frame) for frame in frames)
+        batch = self._batch_cache.get(key)
+        if batch is None:
+            batch = SpiBatchTransfer(self.spi.fileno(), frames, self.spi.max_speed_hz)
+            self._batch_cache[key] = batch
+        return batch
+
+    def _xfer_frames(self, frames):
+        """
+        연속 프레임 전송
+
+        ADS8668은 CS 하강 에지마다 샘플링하므로 프레임마다 CS를 토글해야 함.
+        CS_BATCHED 모드에서는 전체 프레임이 하나의 ioctl로 전송되고
+        프레임 사이 CS 토글은 커널이 수행한다.
+
+        Args:
+            frames: [[b0, b1, b2, b3], ...] 4바이트 프레임 리스트
+
+        Returns:
+            프레임별 응답 리스트
+        """
+        if self.cs_mode == self.CS_BATCHED:
+            replies = []
+            step = SpiBatchTransfer.MAX_FRAMES
+            for i in range(0, len(frames), step):
+                replies.extend(self._get_batch(frames[i:i + step]).replies())
+            return replies
+
+        if self.cs_mode == self.CS_HARDWARE:
+            xfer2 = self.spi.xfer2
+            return [xfer2(frame) for frame in frames]
+
+        output = GPIO.output
+        xfer = self.spi.xfer
+        pin = self.ADCS_PIN
+        replies = []
+        for frame in frames:
+            output(pin, 0)
+            replies.append(xfer(frame))
+            output(pin, 1)
+        return replies
+
+    def _write_register(self, address, value):
+        """프로그램 레지스터 쓰기"""
+        return self._xfer_spi([(address << 1) | 1, value, 0x00, 0x00])
+
+    @staticmethod
+    def _decode(rdat):
+        """응답 프레임에서 12비트 변환 값 추출"""
+        return (rdat[2] << 4) + (rdat[3] >> 4)
+
+    def _make_result(self, channel, adat):
+        """변환 값을 결과 딕셔너리로 변환"""
+        range_id = self.channel_ranges[channel]
+        voltage = float(self.converter.channel_table(channel, range_id)[adat])
+        return {"raw": adat, "voltage": voltage, "range": self.RANGES[range_id]["name"]}
+
+    def to_volts(self, codes, channels):
+        """
+        원시 코드 블록을 현재 레인지/보정값 기준 전압으로 일괄 변환
+
+        Args:
+            codes: (n, k) 정수 배열 (capture_burst/read_codes 결과)
+            channels: 열별 채널 번호 리스트 (길이 k)
+
+        Returns:
+            (n, k) float64 전압 배열
+        """
+        range_ids = [self.channel_ranges[ch] for ch in channels]
+        return self.converter.convert_block(codes, range_ids, channels)
+
     def set_channel_range(self, channel, range_id):
         """채널 입력 레인지 설정"""
         if channel < 0 or channel > 7 or range_id not in self.RANGES:
             return False
         try:
             reg_value = self.RANGES[range_id]["reg"]
-            wdat = [((5 + channel) << 1) | 1, reg_value, 0x00, 0x00]
-            self._xfer_spi(wdat)
+            self._write_register(self.REG_RANGE_CH0 + channel, reg_value)
             self.channel_ranges[channel] = range_id
             logger.info(f"CH{channel} 레인지 설정: {self.RANGES[range_id]['name']}")
             return True
@@ -82,28 +179,185 @@ class ADS8668Controller:
         if channel < 0 or channel > 7:
             return None
         try:
-            wdat = [0xc0 + (channel << 2), 0x00, 0x00, 0x00]
+            wdat = [self.CMD_MAN_CH + (channel << 2), 0x00, 0x00, 0x00]
             self._xfer_spi(wdat)
             rdat = self._xfer_spi(wdat)
-            adat = (rdat[2] << 4) + (rdat[3] >> 4)
+            return self._make_result(channel, self._decode(rdat))
+        except Exception as e:
+            logger.error(f"CH{channel} 읽기 실패: {e}")
+            return None
+
+    def read_channels(self, channels):
+        """
+        매뉴얼 모드 파이프라인 읽기
 
-            range_id = self.channel_ranges[channel]
-            range_info = self.RANGES[range_id]
-            voltage = (adat - range_info["offset"]) * range_info["scale"] / 1000
+        ADS8668은 이전 프레임 커맨드의 결과를 돌려주므로, 채널 N+1의
+        MAN_Ch 커맨드를 채널 N의 데이터가 나오는 프레임에 실어 보낸다.
+        채널 k개를 2k 대신 k+1 프레임으로 읽는다.
 
-            return {"raw": adat, "voltage": voltage, "range": range_info["name"]}
+        Args:
+            channels: 읽을 채널 리스트 (순서/중복 허용)
+
+        Returns:
+            [{'raw', 'voltage', 'range'}, ...] 요청 순서대로, 실패 시 None
+        """
+        channels = list(channels)
+        if not channels:
+            return []
+        if any(ch < 0 or ch > 7 for ch in channels):
+            return None
+
+        try:
+            frames = [[self.CMD_MAN_CH + (ch << 2), 0x00, 0x00, 0x00] for ch in channels]
+            frames.append([self.CMD_NO_OP, 0x00, 0x00, 0x00])
+            replies = self._xfer_frames(frames)
+            return [self._make_result(ch, self._decode(rdat))
+                    for ch, rdat in zip(channels, replies[1:])]
         except Exception as e:
-            logger.error(f"CH{channel} 읽기 실패: {e}")
+            logger.error(f"파이프라인 읽기 실패: {e}")
+            return None
+
+    def _set_auto_sequence(self, channels):
+        """AUTO_SEQ_EN 레지스터에 스캔 채널 설정 (변경 시에만 기록)"""
+        mask = 0
+        for ch in channels:
+            mask |= 1 << ch
+        if mask != self._auto_seq_mask:
+            self._write_register(self.REG_AUTO_SEQ_EN, mask)
+            self._auto_seq_mask = mask
+
+    def read_all_channels(self, channels=None, auto_sequence=True):
+        """
+        전체 채널 읽기
+
+        자동 시퀀스 모드에서는 AUTO_SEQ_EN에 등록된 채널만 순서대로
+        변환되므로 AUTO_RST 1프레임 + 채널당 NO_OP 1프레임으로 스캔이 끝난다.
+        auto_sequence=False이면 매뉴얼 모드 파이프라인 읽기를 사용한다.
+
+        Args:
+            channels: 읽을 채널 리스트 (None이면 CH0-CH7 전체)
+            auto_sequence: AUTO_RST 자동 시퀀스 사용 여부
+
+        Returns:
+            {channel: {'raw', 'voltage', 'range'}, ...}
+        """
+        if channels is None:
+            channels = range(8)
+        channels = sorted({ch for ch in channels if 0 <= ch <= 7})
+        if not channels:
+            return {}
+
+        if not auto_sequence:
+            results = self.read_channels(channels)
+            return dict(zip(channels, results)) if results else {}
+
+        codes = self.read_codes(channels)
+        if codes is None:
+            return {}
+        return {ch: self._make_result(ch, int(code)) for ch, code in zip(channels, codes)}
+
+    def read_codes(self, channels):
+        """
+        자동 시퀀스 스캔 (원시 코드만)
+
+        전압 변환 없이 코드만 반환하므로 수집 스레드는 코드만 보관하고
+        변환은 소비 측에서 to_volts()로 일괄 처리할 수 있다.
+
+        Args:
+            channels: 정렬된 채널 리스트
+
+        Returns:
+            (k,) uint16 코드 배열 (channels 순서) 또는 None
+        """
+        try:
+            self._set_auto_sequence(channels)
+            frames = [[self.CMD_AUTO_RST, 0x00, 0x00, 0x00]]
+            frames += [[self.CMD_NO_OP, 0x00, 0x00, 0x00] for _ in channels]
+            replies = self._xfer_frames(frames)
+
+            # 프레임 N의 응답은 시퀀스의 N번째 채널 데이터
+            return np.fromiter((self._decode(rdat) for rdat in replies[1:]),
+                               dtype=np.uint16, count=len(channels))
+        except Exception as e:
+            logger.error(f"자동 시퀀스 스캔 실패: {e}")
             return None
 
-    def read_all_channels(self):
-        """전체 채널 읽기"""
-        results = {}
-        for ch in range(8):
-            data = self.read_channel(ch)
-            if data:
-                results[ch] = data
-        return results
+    def capture_burst(self, channels, n_samples):
+        """
+        고속 버스트 캡처
+
+        AUTO_RST 이후 NO_OP 프레임을 끊김 없이 보내 자동 시퀀스를 최대 SPI
+        속도로 돌린다. CS_BATCHED 모드에서는 ioctl 1회에 여러 스캔을 묶어
+        전송하고, 스캔 시각은 ioctl 전후 monotonic 시각에서 보간한다.
+        모든 버퍼는 캡처 시작 전에 할당된다.
+
+        Args:
+            channels: 캡처할 채널 리스트
+            n_samples: 채널당 샘플 수
+
+        Returns:
+            {'channels': [...], 'codes': (n_samples, k) uint16 배열,
+             'timestamps': (n_samples,) float64 monotonic 시각 [s],
+             'sample_rate': 측정된 유효 샘플링 레이트 [Hz],
+             'range_ids': 캡처 시점의 채널별 레인지 ID} 또는 None
+        """
+        channels = sorted({ch for ch in channels if 0 <= ch <= 7})
+        if not channels or n_samples < 1:
+            return None
+
+        k = len(channels)
+        batched = self.cs_mode == self.CS_BATCHED
+        scans_per_run = max(1, SpiBatchTransfer.MAX_FRAMES // k) if batched else 1
+        n_runs = -(-n_samples // scans_per_run)
+
+        frame_bytes = np.empty((n_runs, scans_per_run * k * 4), dtype=np.uint8)
+        t_start = np.empty(n_runs, dtype=np.int64)
+        t_end = np.empty(n_runs, dtype=np.int64)
+        frames = [[self.CMD_NO_OP, 0x00, 0x00, 0x00] for _ in range(scans_per_run * k)]
+        clock = time.monotonic_ns
+
+        try:
+            self._set_auto_sequence(channels)
+            if batched:
+                batch = self._get_batch(frames)
+                rx = np.ctypeslib.as_array(batch.rx)
+                run = batch.run
+
+            # AUTO_RST 이후 프레임부터 시퀀스 순서대로 데이터가 나온다
+            self._xfer_frames([[self.CMD_AUTO_RST, 0x00, 0x00, 0x00]])
+
+            for i in range(n_runs):
+                t_start[i] = clock()
+                if batched:
+                    run()
+                    t_end[i] = clock()
+                    frame_bytes[i] = rx
+                else:
+                    replies = self._xfer_frames(frames)
+                    t_end[i] = clock()
+                    frame_bytes[i] = np.asarray(replies, dtype=np.uint8).ravel()
+        except Exception as e:
+            logger.error(f"버스트 캡처 실패: {e}")
+            return None
+
+        fb = frame_bytes.reshape(-1, k, 4)[:n_samples]
+        codes = (fb[..., 2].astype(np.uint16) << 4) | (fb[..., 3] >> 4)
+
+        # 각 스캔의 시각 = 해당 전송 구간 내 중앙 시점
+        frac = (np.arange(scans_per_run) + 0.5) / scans_per_run
+        timestamps = (t_start[:, None] + (t_end - t_start)[:, None] * frac).ravel()[:n_samples] / 1e9
+
+        duration = timestamps[-1] - timestamps[0]
+        sample_rate = (n_samples - 1) / duration if duration > 0 else 0.0
+
+        logger.info(f"버스트 캡처 완료: {n_samples} x {k}ch, {sample_rate:.1f} Hz")
+        return {
+            'channels': channels,
+            'codes': codes,
+            'timestamps': timestamps,
+            'sample_rate': sample_rate,
+            'range_ids': [self.channel_ranges[ch] for ch in channels]
+        }
 
     def close(self):
         """연결 종료"""
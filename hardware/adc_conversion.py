@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+ADC Code Conversion Module
+원시 코드 → 전압 변환 (레인지/보정별 룩업 테이블)
+"""
+
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+# ADS8668 입력 레인지 (reg: 레인지 레지스터 값, offset: 코드 오프셋, scale: mV/LSB)
+ADC_RANGES = {
+    0: {"name": "±10V", "reg": 0, "offset": 0x800, "scale": 5.00},
+    1: {"name": "±5V", "reg": 1, "offset": 0x800, "scale": 2.50},
+    2: {"name": "±2.5V", "reg": 2, "offset": 0x800, "scale": 1.25},
+    3: {"name": "±1.25V", "reg": 3, "offset": 0x800, "scale": 0.625},
+    4: {"name": "±0.5V", "reg": 11, "offset": 0x800, "scale": 0.3125},
+    5: {"name": "0-10V", "reg": 5, "offset": 0x000, "scale": 2.50},
+    6: {"name": "0-5V", "reg": 6, "offset": 0x000, "scale": 1.25},
+    7: {"name": "0-2.5V", "reg": 7, "offset": 0x000, "scale": 0.625},
+    8: {"name": "0-1.25V", "reg": 15, "offset": 0x000, "scale": 0.3125},
+}
+
+CODE_BITS = 12
+CODE_COUNT = 1 << CODE_BITS
+CODE_MASK = CODE_COUNT - 1
+
+# 결측 샘플 표시 (12비트 코드 범위 밖), 변환 시 NaN
+MISSING_CODE = 0xFFFF
+
+# 행별 레인지 배열에서 레인지 미지정 표시 (해당 채널은 현재 레인지 사용)
+NO_RANGE = 0xFF
+
+
+def range_runs(ranges):
+    """
+    행별 레인지 배열을 같은 레인지가 이어지는 구간으로 나누기
+
+    Args:
+        ranges: (n, k) 행별 채널 레인지 ID 배열
+
+    Returns:
+        [(시작 행, 끝 행, (k,) 레인지 행), ...]
+    """
+    ranges = np.asarray(ranges)
+    if len(ranges) == 0:
+        return []
+    change = np.flatnonzero((ranges[1:] != ranges[:-1]).any(axis=1)) + 1
+    bounds = np.r_[0, change, len(ranges)]
+    return [(int(lo), int(hi), ranges[lo]) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
+class CodeConverter:
+    """
+    원시 코드 변환 클래스
+
+    레인지와 채널 보정값(gain, offset) 조합마다 4096개 항목의 전압 테이블을
+    한 번만 계산해 두고, uint16 코드 블록은 인덱싱 한 번으로 변환한다.
+    """
+
+    def __init__(self, ranges=None):
+        """
+        Args:
+            ranges: 레인지 정의 딕셔너리 (None이면 ADC_RANGES)
+        """
+        self.ranges = ADC_RANGES if ranges is None else ranges
+        self.calibration = [(1.0, 0.0)] * 8  # 채널별 (gain, offset[V])
+        self._tables = {}
+        self._stacked = {}
+
+    def set_calibration(self, channel, gain=1.0, offset=0.0):
+        """
+        채널 보정값 설정
+
+        Args:
+            channel: 채널 번호 (0-7)
+            gain: 전압 배율
+            offset: 전압 오프셋 (V)
+        """
+        if 0 <= channel <= 7:
+            self.calibration[channel] = (float(gain), float(offset))
+            self._stacked.clear()
+
+    def get_table(self, range_id, gain=1.0, offset=0.0):
+        """
+        레인지/보정값에 해당하는 변환 테이블 반환
+
+        Returns:
+            (4096,) float64 배열, table[code] = 전압(V)
+        """
+        key = (range_id, gain, offset)
+        table = self._tables.get(key)
+        if table is None:
+            info = self.ranges[range_id]
+            codes = np.arange(CODE_COUNT, dtype=np.float64)
+            table = (codes - info["offset"]) * info["scale"] / 1000 * gain + offset
+            table.setflags(write=False)
+            self._tables[key] = table
+        return table
+
+    def channel_table(self, channel, range_id):
+        """채널 보정값이 적용된 변환 테이블 반환"""
+        gain, offset = self.calibration[channel]
+        return self.get_table(range_id, gain, offset)
+
+    def to_volts(self, codes, range_id, channel=None):
+        """
+        단일 레인지 코드 배열 변환
+
+        Args:
+            codes: 원시 코드 (스칼라 또는 정수 배열)
+            range_id: 레인지 ID
+            channel: 보정값을 적용할 채널 (None이면 보정 없음)
+
+        Returns:
+            전압 값 (codes와 같은 shape)
+        """
+        if channel is None:
+            table = self.get_table(range_id)
+        else:
+            table = self.channel_table(channel, range_id)
+        return table[np.bitwise_and(codes, CODE_MASK)]
+
+    def convert_block(self, codes, range_ids, channels=None):
+        """
+        다채널 코드 블록 변환
+
+        Args:
+            codes: (n, k) 정수 배열
+            range_ids: 열별 레인지 ID 리스트 (길이 k)
+            channels: 열별 채널 번호 리스트 (None이면 0..k-1)
+
+        Returns:
+            (n, k) float64 전압 배열 (MISSING_CODE는 NaN)
+        """
+        if channels is None:
+            channels = range(len(range_ids))
+        key = tuple(zip(channels, range_ids))
+        stacked = self._stacked.get(key)
+        if stacked is None:
+            stacked = np.stack([self.channel_table(ch, r) for ch, r in key])
+            self._stacked[key] = stacked
+
+        missing = codes == MISSING_CODE
+        volts = stacked[np.arange(len(key)), np.bitwise_and(codes, CODE_MASK)]
+        if missing.any():
+            volts[missing] = np.nan
+        return volts
+
+    def from_volts(self, volts, range_ids, channels=None):
+        """
+        전압 블록 → 원시 코드 (convert_block의 역변환, 가장 가까운 코드)
+
+        Args:
+            volts: (n, k) 전압 배열 (결측은 NaN)
+            range_ids: 열별 레인지 ID 리스트 (길이 k)
+            channels: 열별 채널 번호 리스트 (None이면 0..k-1)
+
+        Returns:
+            (n, k) uint16 코드 배열 (NaN은 MISSING_CODE)
+        """
+        if channels is None:
+            channels = range(len(range_ids))
+        offsets, scales, gains, cal_offsets = [], [], [], []
+        for ch, range_id in zip(channels, range_ids):
+            info = self.ranges[range_id]
+            gain, offset = self.calibration[ch]
+            offsets.append(info["offset"])
+            scales.append(info["scale"] / 1000)
+            gains.append(gain)
+            cal_offsets.append(offset)
+
+        volts = np.asarray(volts, dtype=np.float64)
+        missing = np.isnan(volts)
+        codes = ((volts - cal_offsets) / gains) / scales + offsets
+        codes = np.clip(np.rint(np.where(missing, 0, codes)), 0, CODE_MASK).astype(np.uint16)
+        codes[missing] = MISSING_CODE
+        return codes
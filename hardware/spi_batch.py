@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+SPI Batch Transfer Module
+spidev 멀티 메시지 ioctl (SPI_IOC_MESSAGE(N)) 전송
+"""
+
+import ctypes
+import fcntl
+import logging
+
+logger = logging.getLogger(__name__)
+
+SPI_IOC_MAGIC = ord('k')
+
+
+class SpiIocTransfer(ctypes.Structure):
+    """linux/spi/spidev.h의 struct spi_ioc_transfer"""
+
+    _fields_ = [
+        ('tx_buf', ctypes.c_uint64),
+        ('rx_buf', ctypes.c_uint64),
+        ('len', ctypes.c_uint32),
+        ('speed_hz', ctypes.c_uint32),
+        ('delay_usecs', ctypes.c_uint16),
+        ('bits_per_word', ctypes.c_uint8),
+        ('cs_change', ctypes.c_uint8),
+        ('tx_nbits', ctypes.c_uint8),
+        ('rx_nbits', ctypes.c_uint8),
+        ('word_delay_usecs', ctypes.c_uint8),
+        ('pad', ctypes.c_uint8),
+    ]
+
+
+def spi_ioc_message(count):
+    """SPI_IOC_MESSAGE(count) 요청 코드 (_IOW('k', 0, char[count * 32]))"""
+    size = count * ctypes.sizeof(SpiIocTransfer)
+    return (1 << 30) | (size << 16) | (SPI_IOC_MAGIC << 8)
+
+
+class SpiBatchTransfer:
+    """
+    고정 프레임 목록을 하나의 ioctl로 전송하는 클래스
+
+    프레임마다 spi_ioc_transfer를 하나씩 두고 cs_change를 설정하여
+    프레임 사이의 CS 해제/재선택을 커널이 수행하도록 한다.
+    버퍼는 생성 시 한 번만 할당되므로 같은 프레임을 반복 전송할 때 재사용된다.
+    """
+
+    # ioctl 크기 필드는 14비트 (32바이트 * 511 < 16384)
+    MAX_FRAMES = 511
+
+    def __init__(self, fd, frames, speed_hz=0):
+        """
+        Args:
+            fd: spidev 파일 디스크립터 (SpiDev.fileno())
+            frames: [[b0, b1, ...], ...] 동일 길이 프레임 리스트
+            speed_hz: 전송 클럭 (0이면 디바이스 기본값)
+        """
+        if not frames or len(frames) > self.MAX_FRAMES:
+            raise ValueError(f"frame count must be 1-{self.MAX_FRAMES}")
+
+        self.fd = fd
+        self.count = len(frames)
+        self.frame_size = len(frames[0])
+
+        total = self.count * self.frame_size
+        self.tx = (ctypes.c_uint8 * total)(*[b for frame in frames for b in frame])
+        self.rx = (ctypes.c_uint8 * total)()
+        self.transfers = (SpiIocTransfer * self.count)()
+
+        tx_addr = ctypes.addressof(self.tx)
+        rx_addr = ctypes.addressof(self.rx)
+        for i, xfer in enumerate(self.transfers):
+            offset = i * self.frame_size
+            xfer.tx_buf = tx_addr + offset
+            xfer.rx_buf = rx_addr + offset
+            xfer.len = self.frame_size
+            xfer.speed_hz = speed_hz
+            # 마지막 프레임의 cs_change는 "CS 유지" 의미이므로 설정하지 않음
+            xfer.cs_change = 1 if i < self.count - 1 else 0
+
+        self.request = spi_ioc_message(self.count)
+
+    def run(self):
+        """
+        전송 실행
+
+        Returns:
+            수신 버퍼 (ctypes uint8 배열, 다음 run() 호출 시 덮어씀)
+        """
+        fcntl.ioctl(self.fd, self.request, self.transfers)
+        return self.rx
+
+    def replies(self):
+        """전송 실행 후 프레임별 응답 리스트 반환"""
+        rx = bytes(self.run())
+        size = self.frame_size
+        return [rx[i:i + size] for i in range(0, len(rx), size)]
@@ -5,6 +5,7 @@ ADS8668 ADC Monitor - Main Entry Point
 """
 
 import sys
+import argparse
 import logging
 
 # 한글 폰트 설정 (matplotlib)
@@ -21,6 +22,22 @@ from gui.main_window import MainWindow
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description='ADS8668 ADC Monitor')
+    parser.add_argument('--acquisition', choices=['thread', 'process'], default='thread',
+                        help='ADC 수집 방식 (process: 별도 프로세스 + 공유 메모리 링 버퍼)')
+    parser.add_argument('--cs-mode', choices=['gpio', 'hardware', 'batched'], default='gpio',
+                        help='ADC 칩 셀렉트 방식 (gpio: GPIO 8 직접 제어, hardware: spidev CS, '
+                             'batched: 멀티 메시지 ioctl)')
+    parser.add_argument('--history-dir', default=None,
+                        help='메모리 버퍼 밖으로 밀려난 데이터를 저장할 디렉토리 (mmap 세그먼트)')
+    parser.add_argument('--storage', choices=['volts', 'codes'], default='volts',
+                        help='샘플 저장 방식 (codes: uint16 원시 코드 + 레인지 구간, 읽을 때 변환)')
+    parser.add_argument('--replay', default=None, metavar='FILE',
+                        help='ADC 대신 기록 파일(CSV 또는 .adcap 바이너리 캡처)을 재생')
+    parser.add_argument('--replay-speed', type=float, default=1.0,
+                        help='재생 배속 (0이면 대기 없이 최대 속도)')
+    args = parser.parse_args()
+
     # 루트 로거 설정 (모든 모듈의 로그 출력)
     logging.basicConfig(
         level=logging.INFO,
@@ -35,7 +52,14 @@ def main():
 
     try:
         # 메인 윈도우 실행
-        app = MainWindow()
+        app = MainWindow(
+            acquisition_mode=args.acquisition,
+            cs_mode=args.cs_mode,
+            history_dir=args.history_dir,
+            storage=args.storage,
+            replay_file=args.replay,
+            replay_speed=args.replay_speed
+        )
         app.run()
 
     except KeyboardInterrupt:
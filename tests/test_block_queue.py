@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""ScanBlockQueue → DataManager.add_block 전달 테스트"""
+
+import numpy as np
+
+from data.block_queue import ScanBlockQueue
+from data.data_manager import DataManager
+from hardware.adc_conversion import NO_RANGE
+
+
+def test_drain_keeps_capture_time_ranges():
+    queue = ScanBlockQueue(block_size=4)
+    queue.set_interval(0)
+    dm = DataManager(max_points=100, storage=DataManager.STORAGE_CODES)
+    dm.enable_channel(0)
+
+    row = np.full(8, np.nan, dtype=np.float32)
+    ranges = np.zeros(8, dtype=np.uint8)
+    row[0] = 8.0
+    for i in range(3):
+        queue.put_scan(1700000000.0 + i, row, ranges)
+    # 수집 스레드에서 레인지 변경 후 캡처, GUI는 아직 drain 전
+    ranges[0] = 2
+    row[0] = 1.0
+    for i in range(3, 6):
+        queue.put_scan(1700000000.0 + i, row, ranges)
+    queue.flush()
+
+    timestamps, samples, block_ranges = queue.drain()
+    assert block_ranges[:, 0].tolist() == [0, 0, 0, 2, 2, 2]
+    dm.add_block(timestamps, samples, ranges=block_ranges)
+
+    volts = dm.get_channel_data(0)['voltages']
+    np.testing.assert_allclose(volts[:3], 8.0, atol=0.01)
+    np.testing.assert_allclose(volts[3:], 1.0, atol=0.01)
+    assert dm.range_segments == [(0, (0,) * 8), (3, (2,) + (0,) * 7)]
+
+
+def test_blocks_without_ranges_keep_current_range():
+    queue = ScanBlockQueue()
+    queue.put_block(1700000000.0 + np.arange(3), np.ones((3, 8)))
+    timestamps, samples, ranges = queue.drain()
+    assert (ranges == NO_RANGE).all()
+
+    dm = DataManager(max_points=100, range_ids=[1] * 8)
+    dm.enable_channel(0)
+    dm.add_block(timestamps, samples, ranges=ranges)
+    assert dm.range_segments == [(0, (1,) * 8)]
+
+
+def test_flush_reuses_drained_blocks():
+    queue = ScanBlockQueue(block_size=4)
+    queue.set_interval(0)
+    row = np.zeros(8, dtype=np.float32)
+
+    seen = set()
+    for i in range(20):
+        row[0] = i
+        queue.put_scan(1700000000.0 + i, row)
+        queue.flush()
+        timestamps, samples, _ = queue.drain()
+        assert samples[0, 0] == i
+        seen.add(id(samples.base))
+    # 채우는 블록 / 전달된 블록 / GUI가 사용 중인 블록만 돌려 쓴다
+    assert len(seen) <= 3
+
+    # 반환된 블록은 다음 drain 전까지 덮어쓰이지 않는다
+    row[0] = 100
+    queue.put_scan(1700000100.0, row)
+    queue.flush()
+    _, first, _ = queue.drain()
+    row[0] = 101
+    queue.put_scan(1700000101.0, row)
+    assert first[0, 0] == 100
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""DataExporter 내보내기 / 타임스탬프 포맷 테스트"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from data.binary_capture import BinaryCaptureReader
+from data.data_export import DataExporter, format_timestamps
+from data.data_manager import DataManager
+
+
+@pytest.mark.parametrize('storage', DataManager.STORAGE_MODES)
+def test_binary_export_keeps_capture_ranges(tmp_path, storage):
+    dm = DataManager(max_points=100, storage=storage)
+    dm.enable_channel(0)
+
+    # ±10V 레인지에서 8V 캡처 후 ±2.5V로 바꿔 1V 캡처
+    dm.add_block(1700000000.0 + np.arange(5), np.full((5, 8), 8.0))
+    dm.set_channel_range(0, 2)
+    dm.add_block(1700000005.0 + np.arange(5), np.full((5, 8), 1.0))
+
+    frame = dm.snapshot()
+    assert frame['ranges'] == [(0, (0,) * 8), (5, (2,) + (0,) * 7)]
+    assert (frame['codes'] is not None) == (storage == DataManager.STORAGE_CODES)
+
+    filename = str(tmp_path / 'capture.adcap')
+    assert DataExporter.export_to_binary(filename, frame, range_ids=[2] + [0] * 7)
+
+    reader = BinaryCaptureReader(filename)
+    try:
+        assert [chunk['ranges'][0] for chunk in reader.chunks] == [0, 2]
+        volts = reader.channel_volts(0)
+    finally:
+        reader.close()
+    np.testing.assert_allclose(volts[:5], 8.0, atol=0.01)
+    np.testing.assert_allclose(volts[5:], 1.0, atol=0.01)
+
+
+def test_format_timestamps_matches_datetime():
+    rng = np.random.default_rng(0)
+    timestamps = np.concatenate([[1700000000.0012345, 1700000000.9999996],
+                                 1700000000.0 + rng.random(2000) * 1e6])
+    expected = [datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S.%f') for ts in timestamps]
+    assert format_timestamps(timestamps).tolist() == expected
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""DecimationPyramid.get_view 점 수 제한 테스트"""
+
+import numpy as np
+
+from data.data_manager import DataManager
+
+
+def test_view_with_tail_stays_within_max_points():
+    rng = np.random.default_rng(0)
+    for n in range(40, 200, 3):
+        dm = DataManager(max_points=64)
+        dm.enable_channel(0)
+        dm.add_block(1700000000.0 + np.arange(n), rng.random((n, 8)))
+
+        for max_points in (4, 8, 16, 40):
+            view = dm.get_channel_view(0, max_points=max_points)
+            assert len(view['timestamps']) <= max_points
+            assert np.all(np.diff(view['timestamps']) >= 0)
+
+
+def test_view_skips_evicted_buckets_and_keeps_extremes():
+    rng = np.random.default_rng(1)
+    dm = DataManager(max_points=173)
+    dm.enable_channel(0)
+    dm.add_block(1700000000.0 + np.arange(36), rng.random((36, 8)))
+    dm.add_block(1700000036.0 + np.arange(157), rng.random((157, 8)))
+
+    raw = dm.get_channel_data(0)
+    view = dm.get_channel_view(0, max_points=10)
+    assert len(view['timestamps']) <= 10
+    assert view['timestamps'][0] >= raw['timestamps'][0]
+    assert np.isin(view['voltages'], raw['voltages']).all()
+    assert view['voltages'].max() == raw['voltages'].max()
+    assert view['voltages'].min() == raw['voltages'].min()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""ContinuousRecorder + DataManager.row_sink 연동 테스트"""
+
+import numpy as np
+
+from data.data_manager import DataManager
+from data.recorder import ContinuousRecorder
+
+
+def _read_rows(recorder):
+    rows = []
+    for path in recorder.files:
+        with open(path, newline='') as f:
+            rows.extend(f.read().splitlines()[1:])
+    return rows
+
+
+def _add_rows(dm, start, count):
+    for i in range(start, start + count):
+        dm.add_data(0, 1700000000.0 + i, float(i))
+
+
+def _start(tmp_path, dm):
+    recorder = ContinuousRecorder(str(tmp_path), [0], fsync_interval=0.1)
+    assert recorder.start()
+    dm.set_row_sink(recorder.submit)
+    return recorder
+
+
+def test_block_larger_than_buffer_is_fully_recorded(tmp_path):
+    dm = DataManager(max_points=300)
+    dm.enable_channel(0)
+    recorder = _start(tmp_path, dm)
+
+    samples = np.full((1000, 8), np.nan)
+    samples[:, 0] = np.arange(1000)
+    dm.add_block(1700000000.0 + np.arange(1000), samples)
+    recorder.stop()
+
+    values = [float(row.split(',')[1]) for row in _read_rows(recorder)]
+    assert values == [float(i) for i in range(1000)]
+
+
+def test_channel_toggle_does_not_duplicate_rows(tmp_path):
+    dm = DataManager(max_points=100)
+    dm.enable_channel(0)
+    recorder = _start(tmp_path, dm)
+
+    _add_rows(dm, 0, 3)
+    # 채널 토글은 행을 추가하지 않으므로 아무것도 기록하지 않는다
+    dm.enable_channel(1)
+    dm.enable_channel(1, False)
+    _add_rows(dm, 3, 2)
+    recorder.stop()
+
+    values = [float(row.split(',')[1]) for row in _read_rows(recorder)]
+    assert values == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test_rows_after_reset_are_recorded(tmp_path):
+    dm = DataManager(max_points=100)
+    dm.enable_channel(0)
+    recorder = _start(tmp_path, dm)
+
+    _add_rows(dm, 0, 2)
+    dm.clear_all()
+    _add_rows(dm, 2, 3)
+    dm.resize_buffer(50)
+    _add_rows(dm, 5, 2)
+    dm.set_row_sink(None)
+    _add_rows(dm, 7, 2)
+    recorder.stop()
+
+    values = [float(row.split(',')[1]) for row in _read_rows(recorder)]
+    assert values == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+
+def test_dropped_counts_only_lost_rows():
+    dm = DataManager(max_points=3)
+    dm.enable_channel(0)
+    _add_rows(dm, 0, 3)
+    seq = dm.read_since(0)['seq']
+    assert seq == 3
+
+    dm.enable_channel(1)
+    _add_rows(dm, 3, 5)
+    delta = dm.read_since(seq)
+    assert delta['dropped'] == 2
+    assert np.array_equal(delta['samples'][:, 0], [5.0, 6.0, 7.0])
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""ReplaySource 재생/이어서 재생 테스트"""
+
+import threading
+
+import numpy as np
+
+from data.data_export import DataExporter
+from data.data_manager import DataManager
+from data.replay import ReplaySource
+
+
+def _source(n=100):
+    samples = np.full((n, 8), np.nan, dtype=np.float32)
+    samples[:, 0] = np.arange(n)
+    return ReplaySource(1700000000.0 + np.arange(n), samples, speed=None, block_size=10)
+
+
+def test_resume_continues_from_paused_position():
+    source = _source()
+    received = []
+    paused = threading.Event()
+
+    def sink(timestamps, samples, ranges):
+        received.append(samples[:, 0].copy())
+        if len(received) == 3:
+            source._stop_event.set()
+            paused.set()
+
+    source.start(sink)
+    paused.wait(5.0)
+    source.stop()
+    assert source.is_paused and source.position == 30
+
+    source.start(lambda ts, s, r: received.append(s[:, 0].copy()), resume=True)
+    source._thread.join(5.0)
+    np.testing.assert_array_equal(np.concatenate(received), np.arange(100))
+
+
+def test_start_without_resume_restarts():
+    source = _source()
+    source.position = 40
+    received = []
+    source.start(lambda ts, s, r: received.append(s[:, 0].copy()))
+    source._thread.join(5.0)
+    np.testing.assert_array_equal(np.concatenate(received), np.arange(100))
+    assert not source.is_paused
+
+
+def test_binary_replay_keeps_capture_ranges(tmp_path):
+    dm = DataManager(max_points=100)
+    dm.enable_channel(0)
+    dm.add_block(1700000000.0 + np.arange(5), np.full((5, 8), 8.0))
+    dm.set_channel_range(0, 2)
+    dm.add_block(1700000005.0 + np.arange(5), np.full((5, 8), 1.0))
+    filename = str(tmp_path / 'capture.adcap')
+    assert DataExporter.export_to_binary(filename, dm.snapshot(), range_ids=[2] + [0] * 7)
+
+    # 현재 레인지(±2.5V)로 다시 양자화하면 8V가 잘린다
+    target = DataManager(max_points=100, storage=DataManager.STORAGE_CODES, range_ids=[2] * 8)
+    target.enable_channel(0)
+    source = ReplaySource.from_file(filename, speed=None)
+    source.start(lambda ts, s, r: target.add_block(ts, s, ranges=r))
+    source._thread.join(5.0)
+
+    volts = target.get_channel_data(0)['voltages']
+    np.testing.assert_allclose(volts[:5], 8.0, atol=0.01)
+    np.testing.assert_allclose(volts[5:], 1.0, atol=0.01)
+    assert target.range_segments == [(0, (0,) + (2,) * 7), (5, (2,) * 8)]
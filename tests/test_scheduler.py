@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""DeadlineScheduler 테스트"""
+
+import threading
+import time
+
+from utils.scheduler import DeadlineScheduler
+
+
+def test_set_interval_moves_pending_deadline():
+    scheduler = DeadlineScheduler(10.0)
+    scheduler.start()
+    assert scheduler.wait()     # 첫 데드라인 (즉시)
+
+    # 10초 대기 중에 주기를 줄이면 남은 대기도 새 주기 기준으로 줄어든다
+    timer = threading.Timer(0.05, scheduler.set_interval, args=(0.1,))
+    timer.start()
+    started = time.monotonic()
+    assert scheduler.wait()
+    assert time.monotonic() - started < 1.0
+    assert scheduler.missed == 0
+    timer.join()
+
+
+def test_set_interval_lengthens_pending_deadline():
+    scheduler = DeadlineScheduler(0.05)
+    scheduler.start()
+    assert scheduler.wait()
+    scheduler.set_interval(0.3)
+    started = time.monotonic()
+    assert scheduler.wait()
+    assert time.monotonic() - started > 0.2
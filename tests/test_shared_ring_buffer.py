@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""SharedRingBuffer → DataManager.poll_shared_buffer 캡처 시점 레인지 테스트"""
+
+import numpy as np
+import pytest
+
+from data.data_manager import DataManager
+from data.shared_ring_buffer import SharedRingBuffer
+from hardware.acquisition_worker import AcquisitionWorker
+from hardware.adc_conversion import CodeConverter, MISSING_CODE
+
+
+@pytest.mark.parametrize('storage', DataManager.STORAGE_MODES)
+def test_poll_converts_with_capture_time_ranges(storage):
+    ring = SharedRingBuffer.create(capacity=16)
+    worker = AcquisitionWorker()
+    dm = DataManager(max_points=100, storage=storage)
+    dm.enable_channel(0)
+    dm.attach_shared_buffer(ring, worker.to_volts)
+    converter = CodeConverter()
+
+    try:
+        codes = np.full((1, 8), MISSING_CODE, dtype=np.uint16)
+        # ±10V에서 8V 캡처 → 레인지 변경 → ±2.5V에서 1V 캡처 (폴링 전)
+        codes[0, 0] = converter.from_volts([[8.0]], [0])[0, 0]
+        for i in range(3):
+            ring.write(np.array([1700000000.0 + i]), codes, [0] * 8)
+        worker.channel_ranges[0] = 2
+        codes[0, 0] = converter.from_volts([[1.0]], [2])[0, 0]
+        for i in range(3, 6):
+            ring.write(np.array([1700000000.0 + i]), codes, [2] + [0] * 7)
+
+        latest = dm.poll_shared_buffer()
+        volts = dm.get_channel_data(0)['voltages']
+        np.testing.assert_allclose(volts[:3], 8.0, atol=0.01)
+        np.testing.assert_allclose(volts[3:], 1.0, atol=0.01)
+        assert latest[0] == pytest.approx(1.0, abs=0.01)
+        assert dm.range_segments == [(0, (0,) * 8), (3, (2,) + (0,) * 7)]
+    finally:
+        dm.attach_shared_buffer(None, None)
+        ring.close()
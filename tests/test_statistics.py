@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""SignalStatistics 테스트"""
+
+import numpy as np
+
+from analysis.statistics import SignalStatistics
+
+
+def test_batch_std_with_large_dc_offset():
+    rng = np.random.default_rng(0)
+    data = 1000.0 + rng.normal(0, 1e-3, (5000, 3))
+    data[::7, 1] = np.nan
+
+    stats = SignalStatistics.calculate_statistics_batch(data)
+    np.testing.assert_allclose(stats['std'], np.nanstd(data, axis=0), rtol=1e-9)
+    np.testing.assert_allclose(stats['avg'], np.nanmean(data, axis=0), rtol=1e-12)
+
+
+def test_batch_statistics_empty_channel():
+    data = np.column_stack([np.arange(4.0), np.full(4, np.nan)])
+    stats = SignalStatistics.calculate_statistics_batch(data)
+    assert stats['count'].tolist() == [4, 0]
+    assert stats['std'][1] == 0.0 and stats['avg'][1] == 0.0
+
+
+def test_batch_mask_leaves_input_unchanged():
+    x = np.arange(5.0)
+    fortran = np.asfortranarray(np.column_stack([x, x * 2]))
+    mask = np.array([1, 1, 0, 1, 1], dtype=bool)
+
+    stats = SignalStatistics.calculate_statistics_batch(x, mask=mask)
+    assert stats['count'].tolist() == [4]
+    assert stats['max'][0] == 4.0
+    np.testing.assert_array_equal(x, np.arange(5.0))
+
+    SignalStatistics.calculate_statistics_batch(fortran, mask=mask)
+    np.testing.assert_array_equal(fortran[:, 1], np.arange(5.0) * 2)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""TimeDomainAnalyzer 테스트"""
+
+import numpy as np
+
+from analysis.time_domain import TimeDomainAnalyzer
+
+
+def test_detect_peaks_plateau_midpoints():
+    analyzer = TimeDomainAnalyzer()
+    x = np.array([0, 1, 3, 3, 1, 0, 2, 5, 5, 5, 2, 0, 1, 0], dtype=float)
+
+    assert analyzer.detect_peaks(x, 0.5).tolist() == [2, 8, 12]
+    multi = analyzer.detect_peaks_multi(np.column_stack([x, x[::-1]]), 0.5)
+    assert multi[0].tolist() == [2, 8, 12]
+    assert multi[1].tolist() == [1, 5, 10]
+
+
+def test_detect_peaks_plateau_at_edge_is_not_a_peak():
+    analyzer = TimeDomainAnalyzer()
+    x = np.array([0, 1, 2, 2, 2], dtype=float)
+    assert analyzer.detect_peaks(x, 0.0).tolist() == []
+
+
+def test_detect_peaks_prominence_on_quantized_signal():
+    analyzer = TimeDomainAnalyzer()
+    x = np.array([0, 2, 2, 1, 3, 3, 3, 0, 1, 0], dtype=float)
+    # 평탄한 꼭대기 중앙(5)만 프로미넌스 2 이상
+    assert analyzer.detect_peaks(x, -1.0, prominence=2).tolist() == [5]
+    assert analyzer.detect_peaks(x, -1.0, distance=4).tolist() == [1, 5]
+
+
+def test_calculate_frequency_noisy_sine_default_hysteresis():
+    analyzer = TimeDomainAnalyzer()
+    fs = 1000.0
+    t = np.arange(3000) / fs
+    rng = np.random.default_rng(0)
+    x = np.sin(2 * np.pi * 3.3 * t) + rng.normal(0, 0.1, len(t))
+
+    # 슈미트 트리거 없이는 교차 근처 잡음이 주기로 잡힌다
+    assert analyzer.calculate_frequency(x, fs, hysteresis=0.0) > 10
+    assert abs(analyzer.calculate_frequency(x, fs) - 3.3) < 0.1
+
+    multi = analyzer.calculate_frequency(np.column_stack([x, np.full(len(x), np.nan)]), fs)
+    assert abs(multi[0] - 3.3) < 0.1 and multi[1] == 0.0
@@ -10,10 +10,10 @@ from ttkbootstrap.constants import *
 from tkinter import filedialog, messagebox
 import threading
 import time
-import queue
 from datetime import datetime
 import random
 import math
+import numpy as np
 
 # 기존 프로젝트 모듈 임포트
 # 경로 문제를 해결하기 위해 sys.path에 현재 경로 추가
@@ -24,6 +24,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from gui.panels.chart_panel import ChartPanel
 from gui.panels.control_panel import ControlPanel
 from data.data_manager import DataManager
+from data.block_queue import ScanBlockQueue
 from analysis.statistics import SignalStatistics
 
 import logging
@@ -36,12 +37,13 @@ class TimeDomainViewer:
     def __init__(self):
         # 데이터 관리
         self.data_manager = DataManager(max_points=300)
+        self.chart_seq = -1  # 차트에 반영된 DataManager 상태 변경 시퀀스
         self.statistics = SignalStatistics()
 
         # 모니터링 상태
         self.is_monitoring = False
         self.monitor_thread = None
-        self.data_queue = queue.Queue()
+        self.scan_queue = ScanBlockQueue()
         self.sample_interval = 0.1  # 시뮬레이션 데이터 업데이트 주기 (초)
 
         # GUI 초기화
@@ -172,9 +174,11 @@ class TimeDomainViewer:
     def monitor_loop(self):
         """시뮬레이션 데이터 생성 루프 (별도 스레드)"""
         sample_count = 0
+        row = np.empty(8, dtype=np.float32)
+        self.scan_queue.set_interval(self.sample_interval)
         while self.is_monitoring:
             try:
-                results = {}
+                row.fill(np.nan)
                 for ch in range(8):
                     if self.data_manager.is_channel_enabled(ch):
                         t = sample_count * self.sample_interval
@@ -184,13 +188,10 @@ class TimeDomainViewer:
                         amplitude = 2 + ch * 0.5 # 2V ~ 5.5V
                         noise = random.uniform(-0.1, 0.1)
                         voltage = amplitude * math.sin(2 * math.pi * freq * t + phase) + noise
-                        results[ch] = {'voltage': voltage}
+                        row[ch] = voltage
 
-                if results:
-                    self.data_queue.put({
-                        'timestamp': datetime.now(),
-                        'channels': results
-                    })
+                if not np.isnan(row).all():
+                    self.scan_queue.put_scan(time.time(), row)
                 
                 sample_count += 1
                 time.sleep(self.sample_interval)
@@ -205,16 +206,10 @@ class TimeDomainViewer:
 
     def update_gui(self):
         """GUI를 주기적으로 업데이트"""
-        data_updated = False
-        while not self.data_queue.empty():
-            try:
-                data = self.data_queue.get_nowait()
-                self.data_manager.add_batch_data(data['timestamp'], data['channels'])
-                data_updated = True
-            except queue.Empty:
-                break
-        
-        if data_updated:
+        block = self.scan_queue.drain()
+        if block is not None:
+            timestamps, samples, ranges = block
+            self.data_manager.add_block(timestamps, samples, ranges=ranges)
             self.update_chart()
             self.update_statistics()
 
@@ -224,24 +219,27 @@ class TimeDomainViewer:
     def update_chart(self):
         """차트 업데이트"""
         y_limits = self.control_panel.get_y_scale_limits()
-        all_channel_data = self.data_manager.get_all_data()
-        
-        # ControlPanel의 채널 활성화 상태에 따라 데이터 필터링
+        changed = self.data_manager.changed_channels(self.chart_seq)
+        self.chart_seq = self.data_manager.change_seq
+
+        t0 = time.time() - self.chart_panel.time_window * 60
+        max_points = 2 * self.chart_panel.get_plot_width()
+
+        # ControlPanel의 채널 활성화 상태에 따라 데이터 필터링 (바뀐 채널만)
         display_data = {}
-        for ch, data in all_channel_data.items():
+        for ch in changed:
             if self.control_panel.chart_channel_vars[ch].get():
-                display_data[ch] = data
+                display_data[ch] = self.data_manager.get_channel_view(ch, t0, None, max_points)
         
-        self.chart_panel.update_time_domain(display_data, y_limits)
+        self.chart_panel.update_time_domain(display_data, y_limits, changed)
 
 
     def update_statistics(self):
         """통계 정보 업데이트"""
         stats_channel = self.control_panel.get_stats_channel()
-        data = self.data_manager.get_channel_data(stats_channel)
+        stats = self.data_manager.get_running_statistics(stats_channel)
 
-        if data and len(data['voltages']) > 1:
-            stats = self.statistics.calculate_statistics(data['voltages'])
+        if stats and stats['count'] > 1:
             self.control_panel.update_statistics(stats)
 
     def on_closing(self):
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Deadline Scheduler Module
+절대 시각 기반 주기 스케줄러
+"""
+
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineScheduler:
+    """
+    monotonic_ns 절대 데드라인 기반 주기 스케줄러
+
+    작업 후 interval만큼 sleep하는 방식과 달리 다음 데드라인을
+    '이전 데드라인 + interval'로 계산하므로 작업 시간이 주기에 누적되지 않는다.
+    데드라인을 한 주기 이상 놓치면 위상을 유지한 채 건너뛰고 missed로 집계한다.
+    """
+
+    # 지터 히스토그램 구간 상한 (ms), 마지막 구간은 초과분
+    JITTER_BINS_MS = (0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0)
+
+    # stop() 응답성을 위한 최대 단일 sleep 시간 (초)
+    MAX_SLEEP = 0.1
+
+    def __init__(self, interval):
+        """
+        Args:
+            interval: 주기 (초)
+        """
+        self.interval_ns = int(interval * 1e9)
+        self.running = False
+        self.reset()
+
+    def reset(self):
+        """통계 초기화"""
+        self.start_ns = None
+        self.next_deadline = None
+        self.ticks = 0
+        self.missed = 0
+        self.jitter_sum_ns = 0
+        self.max_jitter_ns = 0
+        self.jitter_histogram = [0] * (len(self.JITTER_BINS_MS) + 1)
+
+    def set_interval(self, interval):
+        """
+        주기 변경 (대기 중인 데드라인도 즉시 다시 계산)
+
+        다음 데드라인을 '마지막 데드라인 + 새 주기'로 옮기고, 그 시각이 이미
+        지났으면 현재 시각으로 맞춘다 (주기 변경을 놓친 주기로 세지 않음).
+        """
+        interval_ns = int(interval * 1e9)
+        if self.next_deadline is not None and self.ticks > 0:
+            last_deadline = self.next_deadline - self.interval_ns
+            self.next_deadline = max(last_deadline + interval_ns, time.monotonic_ns())
+        self.interval_ns = interval_ns
+
+    def start(self):
+        """스케줄 시작 (첫 데드라인 = 현재 시각)"""
+        self.reset()
+        self.running = True
+        self.start_ns = time.monotonic_ns()
+        self.next_deadline = self.start_ns
+
+    def stop(self):
+        """대기 중인 wait() 중단"""
+        self.running = False
+
+    def remaining(self):
+        """다음 데드라인까지 남은 시간 (초, 지났으면 0)"""
+        if self.next_deadline is None:
+            return 0.0
+        return max(0.0, (self.next_deadline - time.monotonic_ns()) / 1e9)
+
+    def wait(self):
+        """
+        다음 데드라인까지 대기
+
+        Returns:
+            bool: 데드라인 도달 시 True, stop()으로 중단되면 False
+        """
+        if self.next_deadline is None:
+            self.start()
+
+        # set_interval()이 대기 중에 데드라인을 옮길 수 있으므로 매번 다시 읽는다
+        now = time.monotonic_ns()
+        while self.running and now < self.next_deadline:
+            time.sleep(min((self.next_deadline - now) / 1e9, self.MAX_SLEEP))
+            now = time.monotonic_ns()
+        deadline = self.next_deadline
+
+        if not self.running:
+            return False
+
+        lateness = now - deadline
+        if lateness >= self.interval_ns:
+            # 놓친 주기는 건너뛰고 위상 유지
+            skipped = lateness // self.interval_ns
+            self.missed += skipped
+            deadline += skipped * self.interval_ns
+            lateness -= skipped * self.interval_ns
+
+        self._record_jitter(lateness)
+        self.ticks += 1
+        self.next_deadline = deadline + self.interval_ns
+        return True
+
+    def _record_jitter(self, lateness_ns):
+        """지터 히스토그램 갱신"""
+        self.jitter_sum_ns += lateness_ns
+        if lateness_ns > self.max_jitter_ns:
+            self.max_jitter_ns = lateness_ns
+
+        lateness_ms = lateness_ns / 1e6
+        for i, edge in enumerate(self.JITTER_BINS_MS):
+            if lateness_ms <= edge:
+                self.jitter_histogram[i] += 1
+                return
+        self.jitter_histogram[-1] += 1
+
+    def get_stats(self):
+        """
+        스케줄 통계 반환
+
+        Returns:
+            {'ticks', 'missed', 'target_rate', 'achieved_rate',
+             'mean_jitter_ms', 'max_jitter_ms', 'jitter_histogram'} 딕셔너리
+        """
+        elapsed = (time.monotonic_ns() - self.start_ns) / 1e9 if self.start_ns else 0.0
+
+        labels = [f"<={edge}ms" for edge in self.JITTER_BINS_MS]
+        labels.append(f">{self.JITTER_BINS_MS[-1]}ms")
+
+        return {
+            'ticks': self.ticks,
+            'missed': self.missed,
+            'target_rate': 1e9 / self.interval_ns if self.interval_ns > 0 else 0.0,
+            'achieved_rate': self.ticks / elapsed if elapsed > 0 else 0.0,
+            'mean_jitter_ms': self.jitter_sum_ns / self.ticks / 1e6 if self.ticks else 0.0,
+            'max_jitter_ms': self.max_jitter_ns / 1e6,
+            'jitter_histogram': dict(zip(labels, self.jitter_histogram))
+        }